@@ -0,0 +1,172 @@
+"""Benchmark JSON decoders on synthetic 48-month Oura payloads.
+
+Compares decode time and peak memory of each available decoder for the two
+payload shapes that dominate a long historical import:
+
+* heart rate: 30-day windows of 5-minute samples
+* detailed sleep: one document per night with hrv, heart_rate and
+  sleep_phase_5_min series
+
+Each decoder is measured alone and, for collections the API client decodes into
+typed models, followed by that decoding (the "+models" rows). Heart rate samples
+are kept as plain dicts, so they have no such row. Peak memory is the
+traced peak while all decoded documents of the payload are held at once.
+
+Run from the repository root:
+
+    python benchmarks/decode_payloads.py [--months 48] [--repeat 5]
+"""
+from __future__ import annotations
+
+import argparse
+from datetime import datetime, timedelta, timezone
+import importlib.util
+import json
+from pathlib import Path
+import random
+import sys
+import time
+import tracemalloc
+
+_PACKAGE_PATH = Path(__file__).parent.parent / "custom_components" / "oura"
+
+
+def _load(name: str):
+    """Load a standalone module directly so Home Assistant doesn't need to be installed."""
+    spec = importlib.util.spec_from_file_location(f"oura_{name}", _PACKAGE_PATH / f"{name}.py")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module  # dataclasses resolve annotations through sys.modules
+    spec.loader.exec_module(module)
+    return module
+
+
+decoder = _load("decoder")
+models = _load("models")
+
+SAMPLES_PER_DAY = 288  # one heart rate sample every 5 minutes
+WINDOW_DAYS = 30  # heart rate range limit per request
+SERIES_POINTS = 100  # ~8 hours of 5-minute sleep samples
+
+
+def heartrate_windows(days: int) -> list[bytes]:
+    """Build one encoded heart rate response per 30-day window."""
+    rng = random.Random(0)
+    start = datetime(2020, 1, 1, tzinfo=timezone.utc)
+    windows = []
+    for window_start in range(0, days, WINDOW_DAYS):
+        window_end = min(days, window_start + WINDOW_DAYS)
+        samples = [
+            {
+                "bpm": rng.randint(45, 160),
+                "source": rng.choice(("awake", "rest", "sleep", "workout")),
+                "timestamp": (start + timedelta(minutes=5 * i)).isoformat(),
+            }
+            for i in range(window_start * SAMPLES_PER_DAY, window_end * SAMPLES_PER_DAY)
+        ]
+        windows.append(json.dumps({"data": samples, "next_token": None}).encode())
+    return windows
+
+
+def sleep_documents(days: int) -> bytes:
+    """Build an encoded detailed sleep response with one document per night."""
+    rng = random.Random(1)
+    start = datetime(2020, 1, 1, 23, tzinfo=timezone.utc)
+    documents = []
+    for day in range(days):
+        bedtime = start + timedelta(days=day)
+        documents.append(
+            {
+                "id": f"sleep-{day}",
+                "day": (bedtime + timedelta(hours=2)).date().isoformat(),
+                "bedtime_start": bedtime.isoformat(),
+                "bedtime_end": (bedtime + timedelta(hours=8)).isoformat(),
+                "type": "long_sleep",
+                "efficiency": rng.randint(70, 98),
+                "total_sleep_duration": rng.randint(18000, 32000),
+                "deep_sleep_duration": rng.randint(2000, 8000),
+                "rem_sleep_duration": rng.randint(3000, 9000),
+                "light_sleep_duration": rng.randint(8000, 16000),
+                "awake_time": rng.randint(600, 4000),
+                "average_hrv": rng.randint(20, 90),
+                "lowest_heart_rate": rng.randint(40, 60),
+                "hrv": {
+                    "interval": 300.0,
+                    "timestamp": bedtime.isoformat(),
+                    "items": [rng.choice((None, rng.uniform(10, 120))) for _ in range(SERIES_POINTS)],
+                },
+                "heart_rate": {
+                    "interval": 300.0,
+                    "timestamp": bedtime.isoformat(),
+                    "items": [rng.choice((None, rng.uniform(40, 80))) for _ in range(SERIES_POINTS)],
+                },
+                "sleep_phase_5_min": "".join(rng.choice("1234") for _ in range(SERIES_POINTS)),
+                "movement_30_sec": "".join(rng.choice("123") for _ in range(SERIES_POINTS * 10)),
+            }
+        )
+    return json.dumps({"data": documents, "next_token": None}).encode()
+
+
+def measure(decode, bodies: list[bytes], repeat: int) -> tuple[float, int]:
+    """Return the best total decode time (s) and peak traced memory (bytes)."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for body in bodies:
+            decode(body)
+        best = min(best, time.perf_counter() - started)
+
+    tracemalloc.start()
+    held = [decode(body) for body in bodies]
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del held
+    return best, peak
+
+
+def with_models(loads, model):
+    """Return a decode function that also builds the typed models."""
+
+    def decode(body: bytes):
+        return models.decode_documents(model, loads(body)["data"])
+
+    return decode
+
+
+def main() -> int:
+    """Run the benchmark and print a table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--months", type=int, default=48, help="months of history (default 48)")
+    parser.add_argument("--repeat", type=int, default=5, help="timing runs per decoder (default 5)")
+    args = parser.parse_args()
+
+    days = args.months * 30
+    payloads = {
+        "heartrate": (heartrate_windows(days), models.PATH_MODELS.get("heartrate")),
+        "sleep_detail": ([sleep_documents(days)], models.PATH_MODELS["sleep"]),
+    }
+
+    decoders = []
+    for name in (decoder.DECODER_ORJSON, decoder.DECODER_STDLIB):
+        try:
+            decoders.append(decoder.get_json_loads(name))
+        except ImportError:
+            print(f"{name}: not installed, skipped")
+
+    print(f"{'payload':<14}{'size (MB)':>11}{'decoder':>15}{'time (ms)':>12}{'peak (MB)':>12}")
+    for payload_name, (bodies, model) in payloads.items():
+        size = sum(len(body) for body in bodies) / 1e6
+        for name, loads in decoders:
+            runs = [(name, loads)]
+            if model is not None:
+                runs.append((f"{name}+models", with_models(loads, model)))
+            for label, decode in runs:
+                seconds, peak = measure(decode, bodies, args.repeat)
+                print(
+                    f"{payload_name:<14}{size:>11.1f}{label:>15}"
+                    f"{seconds * 1000:>12.1f}{peak / 1e6:>12.1f}"
+                )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -10,8 +10,10 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant, ServiceCall
 from homeassistant.helpers import config_entry_oauth2_flow, config_validation as cv
+from homeassistant.helpers.storage import Store
 
-from .api import OuraApiClient
+from .api import DATA_RATE_LIMITERS, OuraApiClient, OuraWebhookClient
+from .cassette import cassette_from_env
 from .const import (
     DOMAIN,
     CONF_UPDATE_INTERVAL,
@@ -19,11 +21,23 @@ from .const import (
     CONF_HISTORICAL_DATA_IMPORTED,
     CONF_AUTH_METHOD,
     CONF_PERSONAL_ACCESS_TOKEN,
+    CONF_WEBHOOK_ENABLED,
     AUTH_METHOD_PAT,
     DEFAULT_UPDATE_INTERVAL,
     DEFAULT_HISTORICAL_MONTHS,
+    DEFAULT_POLL_INTERVALS,
+    POLL_CLASS_OPTIONS,
+    SYNC_STORAGE_KEY,
+    SYNC_STORAGE_VERSION,
+    CAPABILITY_STORAGE_KEY,
+    CAPABILITY_STORAGE_VERSION,
+    RESPONSE_CACHE_STORAGE_KEY,
+    RESPONSE_CACHE_STORAGE_VERSION,
+    WEBHOOK_STORAGE_KEY,
+    WEBHOOK_STORAGE_VERSION,
 )
 from .coordinator import OuraDataUpdateCoordinator
+from .webhook import OuraWebhookManager
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -49,31 +63,40 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     # Check authentication method
     auth_method = entry.data.get(CONF_AUTH_METHOD)
+    implementation = None
 
     if auth_method == AUTH_METHOD_PAT:
         # Use Personal Access Token authentication
         pat_token = entry.data.get(CONF_PERSONAL_ACCESS_TOKEN)
         _LOGGER.debug("Using PAT authentication")
-        api_client = OuraApiClient(hass, entry=entry, pat_token=pat_token)
+        api_client = OuraApiClient(
+            hass, entry=entry, pat_token=pat_token, cassette=cassette_from_env()
+        )
     else:
         # Use OAuth2 authentication (default)
-        Implementation = (
+        implementation = (
             await config_entry_oauth2_flow.async_get_config_entry_implementation(
                 hass, entry
             )
         )
 
-        session = config_entry_oauth2_flow.OAuth2Session(hass, entry, Implementation)
+        session = config_entry_oauth2_flow.OAuth2Session(hass, entry, implementation)
 
         # Log session state for debugging
         _LOGGER.debug("OAuth2Session created. Valid token: %s", session.valid_token)
 
         # Pass the entry to the API client so it can access the token directly
-        api_client = OuraApiClient(hass, session, entry)
+        api_client = OuraApiClient(hass, session, entry, cassette=cassette_from_env())
 
-    # Get update interval from options, or use default
+    # Get update interval and per-class polling cadence from options, or use defaults
     update_interval = entry.options.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL)
-    coordinator = OuraDataUpdateCoordinator(hass, api_client, entry, update_interval)
+    poll_intervals = {
+        poll_class: entry.options.get(option, DEFAULT_POLL_INTERVALS[poll_class])
+        for poll_class, option in POLL_CLASS_OPTIONS.items()
+    }
+    coordinator = OuraDataUpdateCoordinator(
+        hass, api_client, entry, update_interval, poll_intervals
+    )
 
     # Check if historical data has been imported (persistent flag in config entry options)
     # This flag survives restarts and prevents re-importing on every HA restart
@@ -97,19 +120,29 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             hass.config_entries.async_update_entry(entry, options=new_options)
             _LOGGER.info("Historical data import complete - flag saved to prevent re-import")
         except Exception as err:
-            _LOGGER.error("Failed to load historical data: %s", err)
-            # Continue anyway - regular updates will still work
+            _LOGGER.error("Failed to load historical data, will retry on next setup: %s", err)
+            # Continue anyway - regular updates will still work; the flag stays unset
     else:
         _LOGGER.debug("Historical data already imported - skipping")
 
-    # Do the first refresh (or subsequent refreshes)
-    await coordinator.async_config_entry_first_refresh()
+    # After a restart, publish the cached responses right away and revalidate in
+    # the background; otherwise wait for the first refresh
+    if historical_data_imported and await coordinator.async_restore_cached_data():
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), name=f"{DOMAIN} revalidate cached data"
+        )
+    else:
+        await coordinator.async_config_entry_first_refresh()
 
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    # Optional push mode: webhooks replace most polling
+    if entry.options.get(CONF_WEBHOOK_ENABLED, False):
+        await _async_setup_webhook(hass, entry, coordinator, implementation)
+
     # Register services (only once, not per entry)
     if not hass.services.has_service(DOMAIN, SERVICE_SET_DEBUG_LOGGING):
         async def set_debug_logging(call: ServiceCall) -> None:
@@ -138,6 +171,29 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return True
 
 
+async def _async_setup_webhook(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    coordinator: OuraDataUpdateCoordinator,
+    implementation: config_entry_oauth2_flow.AbstractOAuth2Implementation | None,
+) -> None:
+    """Register the webhook and subscribe to Oura change notifications."""
+    # Subscriptions are managed with the OAuth application's client credentials
+    client_id = getattr(implementation, "client_id", None)
+    client_secret = getattr(implementation, "client_secret", None)
+    if not client_id or not client_secret:
+        _LOGGER.warning(
+            "Oura push mode requires OAuth2 application credentials; falling back to polling"
+        )
+        return
+
+    manager = OuraWebhookManager(
+        hass, entry, coordinator, OuraWebhookClient(hass, client_id, client_secret)
+    )
+    if await manager.async_setup():
+        entry.async_on_unload(manager.async_unload)
+
+
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Reload config entry when options change."""
     await hass.config_entries.async_reload(entry.entry_id)
@@ -147,5 +203,18 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
         hass.data[DOMAIN].pop(entry.entry_id)
+        # The account's request budget is rebuilt by the next setup
+        hass.data.get(DATA_RATE_LIMITERS, {}).pop(entry.unique_id or entry.entry_id, None)
 
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the entry's persisted sync, capability, response and webhook state."""
+    for version, key in (
+        (SYNC_STORAGE_VERSION, SYNC_STORAGE_KEY),
+        (CAPABILITY_STORAGE_VERSION, CAPABILITY_STORAGE_KEY),
+        (RESPONSE_CACHE_STORAGE_VERSION, RESPONSE_CACHE_STORAGE_KEY),
+        (WEBHOOK_STORAGE_VERSION, WEBHOOK_STORAGE_KEY),
+    ):
+        await Store(hass, version, key.format(entry_id=entry.entry_id)).async_remove()
@@ -2,18 +2,44 @@
 from __future__ import annotations
 
 import asyncio
-from datetime import datetime, timedelta
+from collections import OrderedDict, deque
+from collections.abc import AsyncIterator, Iterable, Iterator, Mapping
+from datetime import date, datetime, timedelta
+from email.utils import parsedate_to_datetime
+import hashlib
+import hmac
 import logging
+import os
+import random
+import time
 from typing import Any
 
-from aiohttp import ClientSession, ClientResponseError
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from types import SimpleNamespace
+from urllib.parse import urlsplit
+
+from aiohttp import (
+    ClientError,
+    ClientResponseError,
+    ClientSession,
+    ClientTimeout,
+    RequestInfo,
+    TraceConfig,
+)
+from multidict import CIMultiDict, CIMultiDictProxy
+from yarl import URL
+from homeassistant.helpers.aiohttp_client import (
+    async_create_clientsession,
+    async_get_clientsession,
+)
 from homeassistant.helpers.config_entry_oauth2_flow import OAuth2Session
 from homeassistant.core import HomeAssistant
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.util import dt as dt_util
 
-from .const import API_BASE_URL
+from .cassette import OuraCassette
+from .const import API_BASE_URL, DOMAIN, ENV_API_BASE_URL, WEBHOOK_API_URL
+from .decoder import JsonLoads, json_loads as default_json_loads
+from .models import PATH_MODELS, OuraModel, decode_document, decode_documents
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -38,6 +64,386 @@ API_ENDPOINTS = {
     "rest_mode": "_async_get_rest_mode",
 }
 
+# Collection path (relative to API_BASE_URL) for each data key in API_ENDPOINTS
+ENDPOINT_PATHS = {
+    "sleep": "daily_sleep",
+    "readiness": "daily_readiness",
+    "activity": "daily_activity",
+    "heartrate": "heartrate",
+    "sleep_detail": "sleep",
+    "stress": "daily_stress",
+    "resilience": "daily_resilience",
+    "spo2": "daily_spo2",
+    "vo2_max": "vO2_max",
+    "cardiovascular_age": "daily_cardiovascular_age",
+    "sleep_time": "sleep_time",
+    "workout": "workout",
+    "session": "session",
+    "tag": "tag",
+    "enhanced_tag": "enhanced_tag",
+    "rest_mode": "rest_mode_period",
+}
+
+# Endpoints that answer 401 when the scope or ring generation doesn't support them
+SCOPE_GATED_ENDPOINTS = frozenset({
+    "resilience",
+    "spo2",
+    "vo2_max",
+    "cardiovascular_age",
+    "workout",
+    "session",
+    "tag",
+    "enhanced_tag",
+    "rest_mode",
+})
+SCOPE_GATED_PATHS = frozenset(ENDPOINT_PATHS[endpoint] for endpoint in SCOPE_GATED_ENDPOINTS)
+
+# Endpoints that expose /{document_id}; heart rate samples have no ids
+DOCUMENT_ENDPOINTS = frozenset(ENDPOINT_PATHS) - {"heartrate"}
+
+# Marks a response from a scope-gated endpoint that answered 401 (feature unavailable)
+UNSUPPORTED_KEY = "unsupported"
+
+# The heartrate endpoint rejects ranges longer than this many days
+HEARTRATE_MAX_DAYS = 30
+
+# Oura allows 5000 requests per 5 minutes for each access token
+RATE_LIMIT_REQUESTS = 5000
+RATE_LIMIT_PERIOD = 300  # seconds
+RATE_LIMIT_MAX_RETRIES = 3  # 429 responses retried after Retry-After before failing
+RATE_LIMIT_DEFAULT_RETRY_AFTER = 60.0  # seconds, when the header is missing
+
+# hass.data key holding one OuraRateLimiter per Oura account
+DATA_RATE_LIMITERS = f"{DOMAIN}_rate_limiters"
+
+# Per-endpoint circuit breaker: after this many consecutive failures an endpoint
+# is skipped for a jittered, exponentially growing period before one probe request
+CIRCUIT_FAILURE_THRESHOLD = 3
+CIRCUIT_BASE_BACKOFF = 60  # seconds
+CIRCUIT_MAX_BACKOFF = 3600  # seconds
+CIRCUIT_JITTER = 0.2  # +/- fraction applied to each backoff
+CIRCUIT_CLOSED = "closed"
+CIRCUIT_OPEN = "open"
+CIRCUIT_HALF_OPEN = "half_open"
+
+# Request timeouts, keyed by the path segment after API_BASE_URL. Without them a
+# single hung endpoint stalls the whole gather.
+DEFAULT_REQUEST_TIMEOUT = ClientTimeout(total=30, connect=10, sock_read=20)
+REQUEST_TIMEOUTS = {
+    # Up to 30 days of 5-minute samples per window
+    "heartrate": ClientTimeout(total=60, connect=10, sock_read=45),
+    # Detailed sleep periods carry per-5-minute HRV and heart rate series
+    "sleep": ClientTimeout(total=45, connect=10, sock_read=30),
+}
+
+# Request coalescing: identical concurrent GETs share one request, and completed
+# responses are reused briefly
+RESPONSE_MEMO_TTL = 30  # seconds
+RESPONSE_MEMO_MAX_ENTRIES = 32
+# Heart rate windows are large and streamed once; memoizing them would pin backfills in memory
+RESPONSE_MEMO_EXCLUDED = frozenset({"heartrate"})
+
+# Windowed range fetching: windows run concurrently and are retried individually
+DEFAULT_MAX_CONCURRENT_WINDOWS = 4
+WINDOW_RETRY_ATTEMPTS = 3
+WINDOW_RETRY_BACKOFF = 2  # seconds, doubled after each failed attempt
+
+
+def _date_windows(start_date: date, end_date: date, max_days: int) -> Iterator[tuple[date, date]]:
+    """Split the half-open range [start_date, end_date) into contiguous windows.
+
+    Each window starts exactly where the previous one ended, so no day is skipped.
+    """
+    window_start = start_date
+    while window_start < end_date:
+        window_end = min(window_start + timedelta(days=max_days), end_date)
+        yield window_start, window_end
+        window_start = window_end
+
+
+def _heartrate_windows(start_date: date, end_date: date) -> Iterator[dict[str, str]]:
+    """Yield request params covering the range in HEARTRATE_MAX_DAYS windows."""
+    for window_start, window_end in _date_windows(start_date, end_date, HEARTRATE_MAX_DAYS):
+        yield {
+            "start_datetime": f"{window_start.isoformat()}T00:00:00",
+            "end_datetime": f"{window_end.isoformat()}T00:00:00",
+        }
+
+
+def _heartrate_delta(params: dict[str, str], since: str | None) -> dict[str, str]:
+    """Start a heart rate window at the newest sample already fetched.
+
+    Regular polls then only download the samples recorded since the last
+    poll instead of the whole day. The newest sample is requested again
+    (the start is inclusive) and dropped by the coordinator. A cursor outside
+    the window (older, or on/after its end day) leaves the window unchanged,
+    so the start never passes the end.
+    """
+    if since is None or not params["start_datetime"][:10] <= since[:10] < params["end_datetime"][:10]:
+        return params
+    return {**params, "start_datetime": since}
+
+
+def _endpoint_path(url: str) -> str:
+    """Return the collection path segment of an API URL (e.g. "daily_sleep")."""
+    path = urlsplit(url).path
+    return path.rsplit("/usercollection/", 1)[-1].split("/", 1)[0]
+
+
+def _request_key(url: str, params: Mapping[str, Any] | None) -> tuple[str, tuple[tuple[str, str], ...]]:
+    """Return the dedup key of a GET: endpoint path plus its normalized query."""
+    query = tuple(sorted((name, str(value)) for name, value in (params or {}).items()))
+    return _endpoint_path(url), query
+
+
+def _is_retryable(err: Exception) -> bool:
+    """Return True for transient failures worth retrying (network, 429, 5xx)."""
+    if isinstance(err, ClientResponseError):
+        return err.status == 429 or err.status >= 500
+    return isinstance(err, (ClientError, asyncio.TimeoutError))
+
+
+def _parse_retry_after(value: str | None) -> float:
+    """Parse a Retry-After header (delta seconds or HTTP date) into seconds."""
+    if not value:
+        return RATE_LIMIT_DEFAULT_RETRY_AFTER
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return RATE_LIMIT_DEFAULT_RETRY_AFTER
+    return max(0.0, (retry_at - dt_util.utcnow()).total_seconds())
+
+
+class OuraRateLimiter:
+    """Token bucket enforcing Oura's per-account request quota.
+
+    Requests wait in FIFO order for a token instead of failing. A 429 response
+    empties the bucket and pauses all requests until Retry-After has elapsed.
+    """
+
+    def __init__(
+        self,
+        capacity: int = RATE_LIMIT_REQUESTS,
+        period: float = RATE_LIMIT_PERIOD,
+    ) -> None:
+        """Initialize the rate limiter.
+
+        Args:
+            capacity: Requests allowed per period (also the burst size)
+            period: Length of the quota period in seconds
+        """
+        self.capacity = capacity
+        self._refill_rate = capacity / period  # tokens per second
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    @property
+    def remaining(self) -> int:
+        """Return the number of requests that can be sent right now."""
+        now = time.monotonic()
+        if now < self._paused_until:
+            return 0
+        self._refill(now)
+        return int(self._tokens)
+
+    def _refill(self, now: float) -> None:
+        """Add the tokens earned since the last update."""
+        self._tokens = min(
+            float(self.capacity), self._tokens + (now - self._updated) * self._refill_rate
+        )
+        self._updated = now
+
+    async def async_acquire(self) -> None:
+        """Wait until a request may be sent and consume one token."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self._refill_rate)
+
+    def async_pause(self, seconds: float) -> None:
+        """Stop issuing requests for the given time after the server throttled us."""
+        now = time.monotonic()
+        self._paused_until = max(self._paused_until, now + seconds)
+        self._tokens = 0.0
+        self._updated = now
+
+
+class OuraRequestMetrics:
+    """Request instrumentation collected from aiohttp trace hooks."""
+
+    def __init__(self) -> None:
+        """Initialize the counters."""
+        self.requests = 0
+        self.failures = 0
+        self.connections_created = 0
+        self.connections_reused = 0
+        self.dns_cache_hits = 0
+        self.dns_cache_misses = 0
+        self.coalesced = 0
+        self.memo_hits = 0
+        # Per-endpoint latency: count, total, max and last (seconds)
+        self.latency: dict[str, dict[str, float]] = {}
+
+    def trace_config(self) -> TraceConfig:
+        """Return a TraceConfig that feeds these metrics."""
+        trace_config = TraceConfig()
+        trace_config.on_request_start.append(self._on_request_start)
+        trace_config.on_request_end.append(self._on_request_end)
+        trace_config.on_request_exception.append(self._on_request_exception)
+        trace_config.on_connection_create_end.append(self._on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(self._on_connection_reuseconn)
+        trace_config.on_dns_cache_hit.append(self._on_dns_cache_hit)
+        trace_config.on_dns_cache_miss.append(self._on_dns_cache_miss)
+        return trace_config
+
+    async def _on_request_start(
+        self, session: ClientSession, context: SimpleNamespace, params: Any
+    ) -> None:
+        context.start = time.monotonic()
+
+    async def _on_request_end(
+        self, session: ClientSession, context: SimpleNamespace, params: Any
+    ) -> None:
+        self.requests += 1
+        endpoint = (context.trace_request_ctx or {}).get("endpoint", "other")
+        self.record_latency(endpoint, time.monotonic() - context.start)
+
+    async def _on_request_exception(
+        self, session: ClientSession, context: SimpleNamespace, params: Any
+    ) -> None:
+        self.failures += 1
+
+    async def _on_connection_create_end(
+        self, session: ClientSession, context: SimpleNamespace, params: Any
+    ) -> None:
+        self.connections_created += 1
+
+    async def _on_connection_reuseconn(
+        self, session: ClientSession, context: SimpleNamespace, params: Any
+    ) -> None:
+        self.connections_reused += 1
+
+    async def _on_dns_cache_hit(
+        self, session: ClientSession, context: SimpleNamespace, params: Any
+    ) -> None:
+        self.dns_cache_hits += 1
+
+    async def _on_dns_cache_miss(
+        self, session: ClientSession, context: SimpleNamespace, params: Any
+    ) -> None:
+        self.dns_cache_misses += 1
+
+    def record_latency(self, endpoint: str, seconds: float) -> None:
+        """Add one request's latency to the endpoint's running stats."""
+        stats = self.latency.setdefault(endpoint, {"count": 0, "total": 0.0, "max": 0.0, "last": 0.0})
+        stats["count"] += 1
+        stats["total"] += seconds
+        stats["max"] = max(stats["max"], seconds)
+        stats["last"] = seconds
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the metrics for diagnostics."""
+        return {
+            "requests": self.requests,
+            "failures": self.failures,
+            "connections_created": self.connections_created,
+            "connections_reused": self.connections_reused,
+            "dns_cache_hits": self.dns_cache_hits,
+            "dns_cache_misses": self.dns_cache_misses,
+            "coalesced": self.coalesced,
+            "memo_hits": self.memo_hits,
+            "latency": {
+                endpoint: {
+                    "count": int(stats["count"]),
+                    "avg": round(stats["total"] / stats["count"], 3),
+                    "max": round(stats["max"], 3),
+                    "last": round(stats["last"], 3),
+                }
+                for endpoint, stats in self.latency.items()
+            },
+        }
+
+
+class OuraCircuitBreaker:
+    """Circuit breaker for a single endpoint.
+
+    Closed: requests flow normally. Open: requests are skipped until the backoff
+    expires. Half-open: a single probe request decides whether to close again
+    or re-open with a longer backoff.
+    """
+
+    def __init__(self, endpoint: str) -> None:
+        """Initialize the breaker for an API_ENDPOINTS key."""
+        self.endpoint = endpoint
+        self.state = CIRCUIT_CLOSED
+        self.failures = 0
+        self.trips = 0
+        self.last_error: str | None = None
+        self._open_until = 0.0
+
+    def allow_request(self) -> bool:
+        """Return whether the endpoint may be requested now."""
+        if self.state == CIRCUIT_CLOSED:
+            return True
+        if self.state == CIRCUIT_OPEN and time.monotonic() >= self._open_until:
+            self.state = CIRCUIT_HALF_OPEN
+            return True
+        return False
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful request."""
+        if self.state != CIRCUIT_CLOSED:
+            _LOGGER.info("Oura %s endpoint recovered", self.endpoint)
+        self.state = CIRCUIT_CLOSED
+        self.failures = 0
+        self.trips = 0
+        self.last_error = None
+
+    def record_failure(self, err: Exception) -> None:
+        """Count a failure and open the circuit once the threshold is reached."""
+        self.failures += 1
+        self.last_error = str(err)
+        if self.state == CIRCUIT_HALF_OPEN or self.failures >= CIRCUIT_FAILURE_THRESHOLD:
+            self._open()
+
+    def _open(self) -> None:
+        """Open the circuit with a jittered exponential backoff."""
+        self.trips += 1
+        backoff = min(CIRCUIT_BASE_BACKOFF * 2 ** (self.trips - 1), CIRCUIT_MAX_BACKOFF)
+        backoff *= random.uniform(1 - CIRCUIT_JITTER, 1 + CIRCUIT_JITTER)
+        self.state = CIRCUIT_OPEN
+        self._open_until = time.monotonic() + backoff
+        _LOGGER.warning(
+            "Oura %s endpoint failed %d times in a row; pausing it for %.0f seconds: %s",
+            self.endpoint, self.failures, backoff, self.last_error
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the breaker state for diagnostics."""
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "trips": self.trips,
+            "retry_in": max(0.0, round(self._open_until - time.monotonic(), 1))
+            if self.state == CIRCUIT_OPEN
+            else 0.0,
+            "last_error": self.last_error,
+        }
+
 
 class OuraApiClient:
     """Oura API client."""
@@ -48,6 +454,10 @@ class OuraApiClient:
         session: OAuth2Session | None = None,
         entry: ConfigEntry | None = None,
         pat_token: str | None = None,
+        max_concurrent_windows: int = DEFAULT_MAX_CONCURRENT_WINDOWS,
+        json_loads: JsonLoads | None = None,
+        cassette: OuraCassette | None = None,
+        base_url: str | None = None,
     ) -> None:
         """Initialize the API client.
 
@@ -56,53 +466,124 @@ class OuraApiClient:
             session: OAuth2 session (required if using OAuth2)
             entry: Config entry (required)
             pat_token: Personal Access Token (optional, alternative to OAuth2)
+            max_concurrent_windows: Maximum windowed range requests in flight at once
+            json_loads: JSON decoder for response bodies (default: fastest available)
+            cassette: Record responses to, or replay them from, a cassette
+            base_url: Collection API root, e.g. a local stand-in server
+                (default: OURA_API_BASE_URL from the environment, else API_BASE_URL)
         """
         self.hass = hass
         self.session = session
         self.entry = entry
         self.pat_token = pat_token
         self._client_session: ClientSession | None = None
+        self._rate_limiter: OuraRateLimiter | None = None
+        self._auth_headers: dict[str, str] | None = None
+        self._token_refresh: asyncio.Future[dict[str, str]] | None = None
+        self._replayed_token: str | None = None
+        self._in_flight: dict[tuple, asyncio.Future[dict[str, Any]]] = {}
+        self._memo: OrderedDict[tuple, tuple[float, dict[str, Any]]] = OrderedDict()
+        self.circuit_breakers = {endpoint: OuraCircuitBreaker(endpoint) for endpoint in API_ENDPOINTS}
+        self.metrics = OuraRequestMetrics()
+        self._json_loads = json_loads or default_json_loads
+        self._cassette = cassette
+        self.base_url = (base_url or os.environ.get(ENV_API_BASE_URL) or API_BASE_URL).rstrip("/")
+        self._max_concurrent_windows = max(1, max_concurrent_windows)
+        self._window_semaphore = asyncio.Semaphore(self._max_concurrent_windows)
+
+    @property
+    def rate_limiter(self) -> OuraRateLimiter:
+        """Get the rate limiter shared by every client of this Oura account."""
+        if self._rate_limiter is None:
+            limiters = self.hass.data.setdefault(DATA_RATE_LIMITERS, {})
+            key = (self.entry.unique_id or self.entry.entry_id) if self.entry else "default"
+            self._rate_limiter = limiters.setdefault(key, OuraRateLimiter())
+        return self._rate_limiter
 
     @property
     def client_session(self) -> ClientSession:
-        """Get aiohttp client session."""
+        """Get the client's aiohttp session, creating it on first use.
+
+        HA creates it on its shared connector and closes it on shutdown; the
+        session adds default timeouts and the request metrics trace config.
+        """
         if self._client_session is None:
-            self._client_session = async_get_clientsession(self.hass)
+            self._client_session = async_create_clientsession(
+                self.hass,
+                timeout=DEFAULT_REQUEST_TIMEOUT,
+                auto_decompress=True,  # aiohttp advertises gzip/deflate by default
+                trace_configs=[self.metrics.trace_config()],
+            )
         return self._client_session
 
-    async def async_get_data(self, days_back: int = 1) -> dict[str, Any]:
+    async def async_get_data(
+        self,
+        days_back: int = 1,
+        since: Mapping[str, date] | None = None,
+        endpoints: Iterable[str] | None = None,
+        heartrate_since: str | None = None,
+    ) -> dict[str, Any]:
         """Get data from Oura API.
 
         Args:
             days_back: Number of days of historical data to fetch (default: 1)
+            since: Optional per-endpoint start dates (sync cursors). Endpoints listed
+                here are fetched from that day instead of from days_back.
+            endpoints: Optional subset of API_ENDPOINTS keys to fetch (default: all).
+                Only the requested keys are present in the result.
+            heartrate_since: Optional timestamp of the newest heart rate sample
+                already held (the coordinator's cursor). A single-window heart rate
+                request then starts there instead of at the start of its day.
 
         Note: Oura API end_date is exclusive, so we add 1 day to include today's data.
         """
-        today = dt_util.now().date()
+        today = (await self.async_now()).date()
         start_date = today - timedelta(days=days_back)
         end_date = today + timedelta(days=1)  # Exclusive end, so +1 to include today
+        since = since or {}
+        requested = set(API_ENDPOINTS if endpoints is None else endpoints)
+        keys = [key for key in API_ENDPOINTS if key in requested]
 
-        # Fetch all endpoints concurrently using data-driven approach
+        # Endpoints with an open circuit are skipped; the coordinator keeps
+        # their last good documents until a probe succeeds
+        skipped = [key for key in keys if not self.circuit_breakers[key].allow_request()]
+        if skipped:
+            _LOGGER.debug("Skipping endpoints with open circuits: %s", skipped)
+            keys = [key for key in keys if key not in skipped]
+
+        # Resolve the token once up front so the concurrent requests share it
+        await self._async_get_auth_headers()
+
+        # Fetch the requested endpoints concurrently using data-driven approach
         results = await asyncio.gather(
-            *(getattr(self, method)(start_date, end_date) for method in API_ENDPOINTS.values()),
+            *(
+                self._async_get_heartrate(
+                    since.get(key, start_date), end_date, heartrate_since
+                )
+                if key == "heartrate"
+                else getattr(self, API_ENDPOINTS[key])(since.get(key, start_date), end_date)
+                for key in keys
+            ),
             return_exceptions=True,
         )
 
         # Process results and count failures
-        data = {}
+        data = {key: {} for key in skipped}
         failed_endpoints = 0
-        total_endpoints = len(API_ENDPOINTS)
+        total_endpoints = len(keys)
 
-        for (key, _), result in zip(API_ENDPOINTS.items(), results):
+        for key, result in zip(keys, results):
             if isinstance(result, Exception):
                 failed_endpoints += 1
                 _LOGGER.debug("Error fetching %s data: %s", key, result)
+                self.circuit_breakers[key].record_failure(result)
                 data[key] = {}
             else:
+                self.circuit_breakers[key].record_success()
                 data[key] = result
 
         # Log network connectivity issues if >= 50% of endpoints failed
-        if failed_endpoints >= total_endpoints * 0.5:
+        if total_endpoints and failed_endpoints >= total_endpoints * 0.5:
             _LOGGER.warning(
                 "Network connectivity issue: %d/%d API endpoints failed. "
                 "Will retry on next update cycle.",
@@ -111,100 +592,88 @@ class OuraApiClient:
 
         return data
 
+    async def async_now(self) -> datetime:
+        """Return the current local time, or the recording time when replaying a cassette.
+
+        Request ranges are derived from it, so a replay asks for the ranges the
+        cassette was recorded with on whatever day it runs.
+        """
+        if self._cassette is not None and self._cassette.replaying:
+            if (recorded_at := await self._cassette.async_recorded_at()) is not None:
+                return dt_util.as_local(recorded_at)
+        return dt_util.now()
+
     async def _async_get_sleep(self, start_date: datetime.date, end_date: datetime.date) -> dict[str, Any]:
         """Get sleep data."""
-        url = f"{API_BASE_URL}/daily_sleep"
+        url = f"{self.base_url}/daily_sleep"
         params = {
             "start_date": start_date.isoformat(),
             "end_date": end_date.isoformat(),
         }
-        return await self._async_get(url, params)
+        return await self._async_get_collection(url, params)
 
     async def _async_get_readiness(self, start_date: datetime.date, end_date: datetime.date) -> dict[str, Any]:
         """Get readiness data."""
-        url = f"{API_BASE_URL}/daily_readiness"
+        url = f"{self.base_url}/daily_readiness"
         params = {
             "start_date": start_date.isoformat(),
             "end_date": end_date.isoformat(),
         }
-        return await self._async_get(url, params)
+        return await self._async_get_collection(url, params)
 
     async def _async_get_activity(self, start_date: datetime.date, end_date: datetime.date) -> dict[str, Any]:
         """Get activity data."""
-        url = f"{API_BASE_URL}/daily_activity"
+        url = f"{self.base_url}/daily_activity"
         params = {
             "start_date": start_date.isoformat(),
             "end_date": end_date.isoformat(),
         }
-        return await self._async_get(url, params)
+        return await self._async_get_collection(url, params)
 
-    async def _async_get_heartrate(self, start_date: datetime.date, end_date: datetime.date) -> dict[str, Any]:
+    async def _async_get_heartrate(
+        self, start_date: datetime.date, end_date: datetime.date, since: str | None = None
+    ) -> dict[str, Any]:
         """Get heart rate data.
         
         Note: The heartrate endpoint has a maximum range of 30 days.
-        For historical data requests, we'll batch the requests.
+        Longer ranges are split into windows that are fetched concurrently.
+        A window that still fails after its retries fails the whole request, so
+        async_get_data counts it against the circuit breaker and the coordinator
+        keeps the last good samples.
         """
-        url = f"{API_BASE_URL}/heartrate"
-        
-        # Calculate the number of days in the range
-        days_range = (end_date - start_date).days
-        
-        # If range is > 30 days, batch the requests
-        if days_range > 30:
-            all_data = []
-            current_start = start_date
-            
-            while current_start < end_date:
-                current_end = min(current_start + timedelta(days=30), end_date)
-                params = {
-                    "start_datetime": f"{current_start.isoformat()}T00:00:00",
-                    "end_datetime": f"{current_end.isoformat()}T23:59:59",
-                }
-                
-                try:
-                    batch_data = await self._async_get(url, params)
-                    if batch_data and "data" in batch_data:
-                        all_data.extend(batch_data["data"])
-                except Exception as err:
-                    _LOGGER.warning(
-                        "Failed to fetch heart rate data for %s to %s: %s",
-                        current_start, current_end, err
-                    )
-                
-                current_start = current_end + timedelta(days=1)
-            
-            return {"data": all_data}
-        else:
-            # Range is 30 days or less, single request
-            params = {
-                "start_datetime": f"{start_date.isoformat()}T00:00:00",
-                "end_datetime": f"{end_date.isoformat()}T23:59:59",
-            }
-            
-            try:
-                return await self._async_get(url, params)
-            except Exception as err:
-                _LOGGER.debug("Heart rate endpoint failed: %s", err)
-                # Return empty data instead of failing completely
+        url = f"{self.base_url}/heartrate"
+        windows = list(_heartrate_windows(start_date, end_date))
+
+        # Range is 30 days or less, single request
+        if len(windows) <= 1:
+            if not windows:
                 return {"data": []}
+            return await self._async_get_window(url, _heartrate_delta(windows[0], since))
+
+        # Range is > 30 days, fetch the windows concurrently
+        all_data = []
+        async for documents in self._async_iter_windows(url, windows):
+            all_data.extend(documents)
+
+        return {"data": all_data}
 
     async def _async_get_sleep_detail(self, start_date: datetime.date, end_date: datetime.date) -> dict[str, Any]:
         """Get detailed sleep data including HRV."""
-        url = f"{API_BASE_URL}/sleep"
+        url = f"{self.base_url}/sleep"
         params = {
             "start_date": start_date.isoformat(),
             "end_date": end_date.isoformat(),
         }
-        return await self._async_get(url, params)
+        return await self._async_get_collection(url, params)
 
     async def _async_get_stress(self, start_date: datetime.date, end_date: datetime.date) -> dict[str, Any]:
         """Get daily stress data."""
-        url = f"{API_BASE_URL}/daily_stress"
+        url = f"{self.base_url}/daily_stress"
         params = {
             "start_date": start_date.isoformat(),
             "end_date": end_date.isoformat(),
         }
-        return await self._async_get(url, params)
+        return await self._async_get_collection(url, params)
 
     async def _async_get_resilience(self, start_date: datetime.date, end_date: datetime.date) -> dict[str, Any]:
         """Get daily resilience data.
@@ -212,16 +681,16 @@ class OuraApiClient:
         Note: This endpoint may return 401 if the user hasn't authorized the required scope
         or if their ring/subscription doesn't support this feature.
         """
-        url = f"{API_BASE_URL}/daily_resilience"
+        url = f"{self.base_url}/daily_resilience"
         params = {
             "start_date": start_date.isoformat(),
             "end_date": end_date.isoformat(),
         }
         try:
-            return await self._async_get(url, params)
+            return await self._async_get_collection(url, params)
         except ClientResponseError as err:
             if err.status == 401:  # Feature not available
-                return {"data": []}
+                return {"data": [], UNSUPPORTED_KEY: True}
             raise
 
     async def _async_get_spo2(self, start_date: datetime.date, end_date: datetime.date) -> dict[str, Any]:
@@ -230,16 +699,16 @@ class OuraApiClient:
         Note: This endpoint may return 401 if the user hasn't authorized the spo2Daily scope
         or if their ring doesn't support SpO2 (only Gen3 and Ring 4).
         """
-        url = f"{API_BASE_URL}/daily_spo2"
+        url = f"{self.base_url}/daily_spo2"
         params = {
             "start_date": start_date.isoformat(),
             "end_date": end_date.isoformat(),
         }
         try:
-            return await self._async_get(url, params)
+            return await self._async_get_collection(url, params)
         except ClientResponseError as err:
             if err.status == 401:  # Feature not available (Gen3/Ring4 only)
-                return {"data": []}
+                return {"data": [], UNSUPPORTED_KEY: True}
             raise
 
     async def _async_get_vo2_max(self, start_date: datetime.date, end_date: datetime.date) -> dict[str, Any]:
@@ -248,16 +717,16 @@ class OuraApiClient:
         Note: This endpoint may return 401 if the user hasn't authorized the required scope
         or if their ring/subscription doesn't support this feature.
         """
-        url = f"{API_BASE_URL}/vO2_max"
+        url = f"{self.base_url}/vO2_max"
         params = {
             "start_date": start_date.isoformat(),
             "end_date": end_date.isoformat(),
         }
         try:
-            return await self._async_get(url, params)
+            return await self._async_get_collection(url, params)
         except ClientResponseError as err:
             if err.status == 401:  # Feature not available
-                return {"data": []}
+                return {"data": [], UNSUPPORTED_KEY: True}
             raise
 
     async def _async_get_cardiovascular_age(self, start_date: datetime.date, end_date: datetime.date) -> dict[str, Any]:
@@ -266,26 +735,26 @@ class OuraApiClient:
         Note: This endpoint may return 401 if the user hasn't authorized the required scope
         or if their ring/subscription doesn't support this feature.
         """
-        url = f"{API_BASE_URL}/daily_cardiovascular_age"
+        url = f"{self.base_url}/daily_cardiovascular_age"
         params = {
             "start_date": start_date.isoformat(),
             "end_date": end_date.isoformat(),
         }
         try:
-            return await self._async_get(url, params)
+            return await self._async_get_collection(url, params)
         except ClientResponseError as err:
             if err.status == 401:  # Feature not available
-                return {"data": []}
+                return {"data": [], UNSUPPORTED_KEY: True}
             raise
 
     async def _async_get_sleep_time(self, start_date: datetime.date, end_date: datetime.date) -> dict[str, Any]:
         """Get optimal sleep time recommendations."""
-        url = f"{API_BASE_URL}/sleep_time"
+        url = f"{self.base_url}/sleep_time"
         params = {
             "start_date": start_date.isoformat(),
             "end_date": end_date.isoformat(),
         }
-        return await self._async_get(url, params)
+        return await self._async_get_collection(url, params)
 
     async def _async_get_workout(self, start_date: datetime.date, end_date: datetime.date) -> dict[str, Any]:
         """Get workout data.
@@ -293,16 +762,16 @@ class OuraApiClient:
         Note: This endpoint may return 401 if the user hasn't authorized the workout scope
         or if their ring/subscription doesn't support this feature.
         """
-        url = f"{API_BASE_URL}/workout"
+        url = f"{self.base_url}/workout"
         params = {
             "start_date": start_date.isoformat(),
             "end_date": end_date.isoformat(),
         }
         try:
-            return await self._async_get(url, params)
+            return await self._async_get_collection(url, params)
         except ClientResponseError as err:
             if err.status == 401:  # Feature not available
-                return {"data": []}
+                return {"data": [], UNSUPPORTED_KEY: True}
             raise
 
     async def _async_get_session(self, start_date: datetime.date, end_date: datetime.date) -> dict[str, Any]:
@@ -311,16 +780,16 @@ class OuraApiClient:
         Note: This endpoint may return 401 if the user hasn't authorized the session scope
         or if their ring/subscription doesn't support this feature.
         """
-        url = f"{API_BASE_URL}/session"
+        url = f"{self.base_url}/session"
         params = {
             "start_date": start_date.isoformat(),
             "end_date": end_date.isoformat(),
         }
         try:
-            return await self._async_get(url, params)
+            return await self._async_get_collection(url, params)
         except ClientResponseError as err:
             if err.status == 401:  # Feature not available
-                return {"data": []}
+                return {"data": [], UNSUPPORTED_KEY: True}
             raise
 
     async def _async_get_tag(self, start_date: datetime.date, end_date: datetime.date) -> dict[str, Any]:
@@ -328,16 +797,16 @@ class OuraApiClient:
 
         Note: This endpoint may return 401 if the user hasn't authorized the tag scope.
         """
-        url = f"{API_BASE_URL}/tag"
+        url = f"{self.base_url}/tag"
         params = {
             "start_date": start_date.isoformat(),
             "end_date": end_date.isoformat(),
         }
         try:
-            return await self._async_get(url, params)
+            return await self._async_get_collection(url, params)
         except ClientResponseError as err:
             if err.status == 401:  # Feature not available
-                return {"data": []}
+                return {"data": [], UNSUPPORTED_KEY: True}
             raise
 
     async def _async_get_enhanced_tag(self, start_date: datetime.date, end_date: datetime.date) -> dict[str, Any]:
@@ -345,16 +814,16 @@ class OuraApiClient:
 
         Note: This endpoint may return 401 if the user hasn't authorized the tag scope.
         """
-        url = f"{API_BASE_URL}/enhanced_tag"
+        url = f"{self.base_url}/enhanced_tag"
         params = {
             "start_date": start_date.isoformat(),
             "end_date": end_date.isoformat(),
         }
         try:
-            return await self._async_get(url, params)
+            return await self._async_get_collection(url, params)
         except ClientResponseError as err:
             if err.status == 401:  # Feature not available
-                return {"data": []}
+                return {"data": [], UNSUPPORTED_KEY: True}
             raise
 
     async def _async_get_rest_mode(self, start_date: datetime.date, end_date: datetime.date) -> dict[str, Any]:
@@ -362,56 +831,372 @@ class OuraApiClient:
 
         Note: This endpoint may return 401 if the user hasn't authorized the required scope.
         """
-        url = f"{API_BASE_URL}/rest_mode_period"
+        url = f"{self.base_url}/rest_mode_period"
         params = {
             "start_date": start_date.isoformat(),
             "end_date": end_date.isoformat(),
         }
         try:
-            return await self._async_get(url, params)
+            return await self._async_get_collection(url, params)
         except ClientResponseError as err:
             if err.status == 401:  # Feature not available
-                return {"data": []}
+                return {"data": [], UNSUPPORTED_KEY: True}
             raise
 
-    async def _async_get(self, url: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
-        """Make GET request to Oura API."""
+    async def async_iter_documents(
+        self, endpoint: str, start_date: date, end_date: date
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Stream documents for one endpoint, following next_token across pages.
+
+        Args:
+            endpoint: Data key from API_ENDPOINTS (e.g. "sleep", "heartrate")
+            start_date: First day to fetch
+            end_date: Exclusive end day
+
+        Pages are requested lazily as the caller consumes documents, so large
+        backfills never hold more than one page of a response at a time.
+        """
+        url = f"{self.base_url}/{ENDPOINT_PATHS[endpoint]}"
+
+        if endpoint == "heartrate":
+            # Heart rate is limited to 30 days per request; stream window by window
+            async for documents in self._async_iter_windows(
+                url, _heartrate_windows(start_date, end_date)
+            ):
+                for document in documents:
+                    yield document
+            return
+
+        params = {
+            "start_date": start_date.isoformat(),
+            "end_date": end_date.isoformat(),
+        }
         try:
-            # Use PAT authentication if token is provided
-            if self.pat_token:
-                headers = {
-                    "Authorization": f"Bearer {self.pat_token}",
-                }
-            else:
-                # Use OAuth2 authentication
-                if not self.session:
-                    raise ValueError("No authentication method available (neither PAT nor OAuth2 session)")
-
-                # Ensure token is valid and get the token data
-                await self.session.async_ensure_token_valid()
-
-                # Access the token directly from the session
-                if not self.session.valid_token or not self.session.token:
-                    _LOGGER.error(
-                        "OAuth session has no valid token. Valid: %s, Token exists: %s",
-                        self.session.valid_token,
-                        self.session.token is not None
+            async for page in self._async_iter_pages(url, params):
+                for document in page:
+                    yield document
+        except ClientResponseError as err:
+            if err.status == 401 and endpoint in SCOPE_GATED_ENDPOINTS:
+                return  # Feature not available
+            raise
+
+    async def async_get_document(self, endpoint: str, document_id: str) -> OuraModel | None:
+        """Fetch a single document by id.
+
+        Args:
+            endpoint: Data key from DOCUMENT_ENDPOINTS (e.g. "sleep", "workout")
+            document_id: Document id, e.g. the object_id of a webhook notification
+
+        Returns:
+            The decoded document, or None if it no longer exists.
+
+        Raises:
+            ValueError: If the endpoint has no single-document route (heart rate).
+            OuraModelError: If the document does not match its schema.
+        """
+        if endpoint not in DOCUMENT_ENDPOINTS:
+            raise ValueError(f"Oura {endpoint} data cannot be fetched by document id")
+
+        path = ENDPOINT_PATHS[endpoint]
+        try:
+            # Always fetch: the document just changed, a memoized copy may predate it
+            document = await self._async_get(
+                f"{self.base_url}/{path}/{document_id}", coalesce=False
+            )
+        except ClientResponseError as err:
+            if err.status == 404:
+                return None
+            raise
+        return decode_document(PATH_MODELS[path], document)
+
+    async def _async_iter_windows(
+        self, url: str, windows: Iterable[dict[str, str]]
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Fetch range windows concurrently and yield their documents in order.
+
+        Up to max_concurrent_windows windows are requested ahead of the consumer,
+        so memory stays bounded by that many windows regardless of range length.
+        A window that still fails after its retries raises, cancelling the rest.
+        """
+        windows = iter(windows)
+        pending: deque[tuple[dict[str, str], asyncio.Task[dict[str, Any]]]] = deque()
+        last_timestamp: str | None = None
+
+        def schedule() -> None:
+            while len(pending) < self._max_concurrent_windows:
+                if (params := next(windows, None)) is None:
+                    return
+                pending.append(
+                    (params, asyncio.ensure_future(self._async_get_window(url, params)))
+                )
+
+        try:
+            schedule()
+            while pending:
+                params, task = pending.popleft()
+                documents = (await task)["data"]
+                schedule()
+
+                # Adjacent windows share their boundary instant; drop a repeated sample
+                if documents and last_timestamp and documents[0].get("timestamp") == last_timestamp:
+                    documents = documents[1:]
+                if documents:
+                    last_timestamp = documents[-1].get("timestamp")
+                    yield documents
+        finally:
+            for _, task in pending:
+                task.cancel()
+
+    async def _async_get_window(self, url: str, params: dict[str, str]) -> dict[str, Any]:
+        """Fetch one range window, retrying transient failures with backoff."""
+        attempt = 1
+        delay = WINDOW_RETRY_BACKOFF
+        async with self._window_semaphore:
+            while True:
+                try:
+                    return await self._async_get_collection(url, params)
+                except Exception as err:
+                    if attempt >= WINDOW_RETRY_ATTEMPTS or not _is_retryable(err):
+                        raise
+                    _LOGGER.debug(
+                        "Retrying %s window %s (attempt %d/%d): %s",
+                        url, params, attempt, WINDOW_RETRY_ATTEMPTS, err
                     )
-                    raise ValueError("Failed to get valid OAuth token")
+                    await asyncio.sleep(delay)
+                    attempt += 1
+                    delay *= 2
+
+    async def _async_iter_pages(
+        self, url: str, params: dict[str, Any]
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Yield the decoded documents of each page, requesting the next one on demand.
 
-                token = self.session.token
+        Documents are decoded into their typed model at this boundary; malformed
+        documents are logged and dropped. Collections without a model in
+        PATH_MODELS (heart rate samples) are yielded as plain dicts.
+        """
+        model = PATH_MODELS.get(_endpoint_path(url))
+        page_params = params
+        while True:
+            payload = await self._async_get(url, page_params)
+            documents = payload.get("data") or []
+            yield decode_documents(model, documents) if model else documents
 
-                if 'access_token' not in token:
-                    _LOGGER.error("Token missing access_token. Token keys: %s", list(token.keys()))
-                    raise ValueError("OAuth token missing access_token")
+            if not (next_token := payload.get("next_token")):
+                return
+            page_params = {**params, "next_token": next_token}
 
-                headers = {
-                    "Authorization": f"Bearer {token['access_token']}",
-                }
+    async def _async_get_collection(self, url: str, params: dict[str, Any]) -> dict[str, Any]:
+        """Fetch every page of a collection and return them as a single response."""
+        documents: list[dict[str, Any]] = []
+        async for page in self._async_iter_pages(url, params):
+            documents.extend(page)
+        return {"data": documents}
+
+    async def _async_get_auth_headers(
+        self, rejected: dict[str, str] | None = None
+    ) -> dict[str, str]:
+        """Return the Authorization headers, refreshing the OAuth token at most once at a time.
+
+        Headers are cached while the token stays valid, so concurrent requests in a
+        batch share one token check. Callers that arrive while a refresh is running
+        await the same in-flight future instead of starting their own.
+
+        Args:
+            rejected: Headers the API just answered with 401. The token is refreshed
+                even if it has not expired yet, unless another request already did so.
+        """
+        if self.pat_token:
+            return {"Authorization": f"Bearer {self.pat_token}"}
+
+        if not self.session:
+            raise ValueError("No authentication method available (neither PAT nor OAuth2 session)")
+
+        force_refresh = rejected is not None and rejected == self._auth_headers
+        if (
+            self._auth_headers is not None
+            and not force_refresh
+            and self._token_refresh is None
+            and self.session.valid_token
+        ):
+            return self._auth_headers
+
+        if self._token_refresh is None:
+            self._token_refresh = asyncio.ensure_future(
+                self._async_refresh_auth_headers(force_refresh)
+            )
+            self._token_refresh.add_done_callback(self._clear_token_refresh)
 
-            async with self.client_session.get(url, headers=headers, params=params) as response:
-                response.raise_for_status()
-                return await response.json()
+        # Shield so one cancelled caller does not abort the refresh for everyone
+        return await asyncio.shield(self._token_refresh)
+
+    def _clear_token_refresh(self, future: asyncio.Future[dict[str, str]]) -> None:
+        """Forget a finished token refresh so the next one starts fresh."""
+        if self._token_refresh is future:
+            self._token_refresh = None
+        if not future.cancelled():
+            future.exception()  # Mark retrieved; awaiting callers re-raise it
+
+    async def _async_refresh_auth_headers(self, force_refresh: bool) -> dict[str, str]:
+        """Make sure the OAuth token is valid and build the headers for it."""
+        self._auth_headers = None
+
+        if force_refresh:
+            # The API rejected a token we still consider valid; refresh it regardless
+            new_token = await self.session.implementation.async_refresh_token(self.session.token)
+            self.hass.config_entries.async_update_entry(
+                self.session.config_entry,
+                data={**self.session.config_entry.data, "token": new_token},
+            )
+        else:
+            await self.session.async_ensure_token_valid()
+
+        # Access the token directly from the session
+        if not self.session.valid_token or not self.session.token:
+            _LOGGER.error(
+                "OAuth session has no valid token. Valid: %s, Token exists: %s",
+                self.session.valid_token,
+                self.session.token is not None
+            )
+            raise ValueError("Failed to get valid OAuth token")
+
+        token = self.session.token
+
+        if 'access_token' not in token:
+            _LOGGER.error("Token missing access_token. Token keys: %s", list(token.keys()))
+            raise ValueError("OAuth token missing access_token")
+
+        self._auth_headers = {
+            "Authorization": f"Bearer {token['access_token']}",
+        }
+        if force_refresh:
+            self._replayed_token = token["access_token"]
+        return self._auth_headers
+
+    def _can_replay(self, headers: dict[str, str], endpoint: str) -> bool:
+        """Return whether a 401 for these headers may be answered with a token refresh.
+
+        Scope-gated endpoints answer 401 for a missing scope on every poll, so their
+        401s never force a refresh; an expired token is refreshed before it is sent
+        anyway. A token that was just force-refreshed is not refreshed again either;
+        that 401 is about scopes, not expiry.
+        """
+        if self.pat_token or not self.session or endpoint in SCOPE_GATED_PATHS:
+            return False
+        return headers.get("Authorization") != f"Bearer {self._replayed_token}"
+
+    async def _async_get(
+        self, url: str, params: dict[str, Any] | None = None, coalesce: bool = True
+    ) -> dict[str, Any]:
+        """Make GET request to Oura API, sharing identical requests.
+
+        The regular refresh, historical import and service calls can ask for the
+        same endpoint and range at once. Concurrent callers await one in-flight
+        request, and successful responses are reused for RESPONSE_MEMO_TTL seconds.
+        Failures are never memoized.
+
+        Args:
+            url: Request URL
+            params: Query parameters
+            coalesce: Set to False to always send a fresh request
+        """
+        if not coalesce:
+            return await self._async_request(url, params)
+
+        key = _request_key(url, params)
+        now = time.monotonic()
+        if (memo := self._memo.get(key)) is not None:
+            expires, payload = memo
+            if expires > now:
+                self.metrics.memo_hits += 1
+                return payload
+            del self._memo[key]
+
+        if (future := self._in_flight.get(key)) is not None:
+            self.metrics.coalesced += 1
+        else:
+            future = asyncio.ensure_future(self._async_request(url, params))
+            self._in_flight[key] = future
+            future.add_done_callback(lambda done: self._finish_request(key, done))
+
+        # Shield so one cancelled caller does not abort the request for everyone
+        return await asyncio.shield(future)
+
+    def _finish_request(self, key: tuple, future: asyncio.Future[dict[str, Any]]) -> None:
+        """Forget a finished request and memoize its response if it succeeded."""
+        if self._in_flight.get(key) is future:
+            del self._in_flight[key]
+        if future.cancelled() or future.exception() is not None:
+            return  # Awaiting callers re-raise the exception
+        if key[0] in RESPONSE_MEMO_EXCLUDED:
+            return
+
+        now = time.monotonic()
+        self._memo[key] = (now + RESPONSE_MEMO_TTL, future.result())
+        self._memo.move_to_end(key)
+        while self._memo and (
+            len(self._memo) > RESPONSE_MEMO_MAX_ENTRIES
+            or next(iter(self._memo.values()))[0] <= now
+        ):
+            self._memo.popitem(last=False)
+
+    async def _async_replay(self, url: str, params: dict[str, Any] | None) -> dict[str, Any]:
+        """Answer a GET from the cassette, raising recorded error statuses."""
+        status, body = await self._cassette.async_play(url, params)
+        if status >= 400:
+            request_url = URL(url).with_query(params or {})
+            raise ClientResponseError(
+                RequestInfo(request_url, "GET", CIMultiDictProxy(CIMultiDict()), request_url),
+                (),
+                status=status,
+                message="Recorded response",
+            )
+        return body
+
+    async def _async_request(self, url: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
+        """Make GET request to Oura API."""
+        if self._cassette is not None and self._cassette.replaying:
+            return await self._async_replay(url, params)
+
+        try:
+            headers = await self._async_get_auth_headers()
+            endpoint = _endpoint_path(url)
+            rate_limit_retries = 0
+            replayed = False
+
+            while True:
+                # Queue behind other requests for this account until budget is available
+                await self.rate_limiter.async_acquire()
+
+                async with self.client_session.get(
+                    url,
+                    headers=headers,
+                    params=params,
+                    timeout=REQUEST_TIMEOUTS.get(endpoint, DEFAULT_REQUEST_TIMEOUT),
+                    trace_request_ctx={"endpoint": endpoint},
+                ) as response:
+                    if response.status == 429 and rate_limit_retries < RATE_LIMIT_MAX_RETRIES:
+                        rate_limit_retries += 1
+                        retry_after = _parse_retry_after(response.headers.get("Retry-After"))
+                        self.rate_limiter.async_pause(retry_after)
+                        _LOGGER.warning(
+                            "Oura API rate limit reached, retrying %s in %.0f seconds",
+                            url, retry_after
+                        )
+                        continue
+
+                    if response.status != 401 or replayed or not self._can_replay(headers, endpoint):
+                        if self._cassette is not None and response.status >= 400:
+                            await self._cassette.async_record(url, params, response.status, None)
+                        response.raise_for_status()
+                        payload = self._json_loads(await response.read())
+                        if self._cassette is not None:
+                            await self._cassette.async_record(url, params, response.status, payload)
+                        return payload
+
+                # Token was rejected: refresh once (shared with other requests) and replay
+                replayed = True
+                headers = await self._async_get_auth_headers(rejected=headers)
         except ClientResponseError as err:
             if err.status != 401:  # 401 handled gracefully by callers for optional features
                 _LOGGER.error("Error fetching data from %s: %s", url, err)
@@ -423,8 +1208,79 @@ class OuraApiClient:
         except Exception as err:
             # Use warning for connection errors, error for other issues
             log_msg = "Unexpected error fetching data from %s: %s"
-            if "Cannot connect" in str(err) or "Domain name not found" in str(err) or "Timeout" in str(err):
+            if (
+                isinstance(err, asyncio.TimeoutError)
+                or "Cannot connect" in str(err)
+                or "Domain name not found" in str(err)
+                or "Timeout" in str(err)
+            ):
                 _LOGGER.warning(log_msg, url, err)
             else:
                 _LOGGER.error(log_msg, url, err)
             raise
+
+
+class OuraWebhookClient:
+    """Client for the Oura webhook subscription API.
+
+    Subscriptions belong to the OAuth application rather than a user, so these
+    requests authenticate with the app's client id and secret.
+    """
+
+    def __init__(self, hass: HomeAssistant, client_id: str, client_secret: str) -> None:
+        """Initialize the webhook client.
+
+        Args:
+            hass: Home Assistant instance
+            client_id: OAuth application client id
+            client_secret: OAuth application client secret
+        """
+        self.hass = hass
+        self._headers = {"x-client-id": client_id, "x-client-secret": client_secret}
+        self._client_secret = client_secret
+
+    def verify_signature(self, timestamp: str, body: bytes, signature: str) -> bool:
+        """Return whether a notification was signed by Oura.
+
+        The x-oura-signature header is the uppercase hex HMAC-SHA256 of the
+        x-oura-timestamp header followed by the raw body, keyed with the
+        application's client secret.
+        """
+        expected = hmac.new(
+            self._client_secret.encode(), timestamp.encode() + body, hashlib.sha256
+        ).hexdigest().upper()
+        return hmac.compare_digest(expected, signature.upper())
+
+    async def async_list_subscriptions(self) -> list[dict[str, Any]]:
+        """List the application's webhook subscriptions."""
+        return await self._async_request("GET", WEBHOOK_API_URL)
+
+    async def async_create_subscription(
+        self, callback_url: str, verification_token: str, event_type: str, data_type: str
+    ) -> dict[str, Any]:
+        """Create a subscription; Oura verifies the callback URL before answering."""
+        return await self._async_request(
+            "POST",
+            WEBHOOK_API_URL,
+            {
+                "callback_url": callback_url,
+                "verification_token": verification_token,
+                "event_type": event_type,
+                "data_type": data_type,
+            },
+        )
+
+    async def async_renew_subscription(self, subscription_id: str) -> dict[str, Any]:
+        """Extend a subscription's expiration time."""
+        return await self._async_request("PUT", f"{WEBHOOK_API_URL}/renew/{subscription_id}")
+
+    async def _async_request(
+        self, method: str, url: str, payload: dict[str, Any] | None = None
+    ) -> Any:
+        """Send a request to the webhook subscription API."""
+        session = async_get_clientsession(self.hass)
+        async with session.request(
+            method, url, headers=self._headers, json=payload, timeout=DEFAULT_REQUEST_TIMEOUT
+        ) as response:
+            response.raise_for_status()
+            return await response.json()
@@ -10,7 +10,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import ATTRIBUTION, DOMAIN
-from .coordinator import OuraDataUpdateCoordinator
+from .coordinator import OuraCategoryCoordinator, OuraDataUpdateCoordinator
 
 
 async def async_setup_entry(
@@ -22,13 +22,13 @@ async def async_setup_entry(
     coordinator: OuraDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
 
     entities = [
-        OuraRestModeBinarySensor(coordinator),
+        OuraRestModeBinarySensor(coordinator.async_category("rest_mode")),
     ]
 
     async_add_entities(entities)
 
 
-class OuraRestModeBinarySensor(CoordinatorEntity[OuraDataUpdateCoordinator], BinarySensorEntity):
+class OuraRestModeBinarySensor(CoordinatorEntity[OuraCategoryCoordinator], BinarySensorEntity):
     """Representation of Oura Ring Rest Mode binary sensor."""
 
     _attr_attribution = ATTRIBUTION
@@ -39,10 +39,10 @@ class OuraRestModeBinarySensor(CoordinatorEntity[OuraDataUpdateCoordinator], Bin
 
     def __init__(
         self,
-        coordinator: OuraDataUpdateCoordinator,
+        coordinator: OuraCategoryCoordinator,
     ) -> None:
         """Initialize the binary sensor."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, context="rest_mode_active")
         self._attr_unique_id = f"{coordinator.entry.entry_id}_rest_mode_active"
 
     @property
@@ -66,16 +66,9 @@ class OuraRestModeBinarySensor(CoordinatorEntity[OuraDataUpdateCoordinator], Bin
         """Return extra state attributes."""
         attrs = {}
 
-        if self.coordinator.data and "_active_rest_mode_raw" in self.coordinator.data:
-            rest_mode_raw = self.coordinator.data["_active_rest_mode_raw"]
-
-            # Add useful rest mode metadata
-            if rest_mode_id := rest_mode_raw.get("id"):
-                attrs["id"] = rest_mode_id
-            if start_day := rest_mode_raw.get("start_day"):
-                attrs["start_day"] = start_day
-            if end_day := rest_mode_raw.get("end_day"):
-                attrs["end_day"] = end_day
+        if self.coordinator.data and "_active_rest_mode" in self.coordinator.data:
+            # Add useful rest mode metadata (id, start_day, end_day)
+            attrs.update(self.coordinator.data["_active_rest_mode"].as_dict())
 
         return attrs if attrs else None
 
@@ -0,0 +1,174 @@
+"""Record/replay cassettes for Oura API traffic.
+
+In record mode every response the API client receives is written to a cassette
+directory, one JSON file per request, keyed by the request path and its sorted
+query. Request headers are never stored and credential fields in response
+bodies are redacted. In replay mode the client answers every request from the
+cassette instead of the network, so tests and benchmarks can run against real
+multi-month data offline and deterministically.
+
+Request ranges are derived from the current day, so a cassette also records
+when it was made and replay runs on that clock (see OuraApiClient.async_now):
+a replay on a later day asks for the same ranges as the recording did.
+
+Set OURA_CASSETTE_DIR (and OURA_CASSETTE_MODE=record or replay, default replay)
+to use a cassette in a running Home Assistant instance.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Mapping
+from datetime import datetime, timezone
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlsplit
+
+_LOGGER = logging.getLogger(__name__)
+
+CASSETTE_RECORD = "record"
+CASSETTE_REPLAY = "replay"
+CASSETTE_FORMAT_VERSION = 1
+# File holding the cassette's recording time, next to the request files
+CASSETTE_MANIFEST = "cassette.json"
+
+ENV_CASSETTE_DIR = "OURA_CASSETTE_DIR"
+ENV_CASSETTE_MODE = "OURA_CASSETTE_MODE"
+
+# Body fields replaced before a response is written to disk
+SCRUBBED_FIELDS = frozenset(
+    {"access_token", "refresh_token", "verification_token", "client_secret", "email"}
+)
+SCRUBBED_VALUE = "**REDACTED**"
+
+
+class CassetteMissError(LookupError):
+    """Raised in replay mode when a request has no recorded response."""
+
+
+def _scrub(value: Any) -> Any:
+    """Return a copy of a decoded body with credential fields redacted."""
+    if isinstance(value, Mapping):
+        return {
+            key: SCRUBBED_VALUE if key in SCRUBBED_FIELDS else _scrub(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, (list, tuple)):
+        return [_scrub(item) for item in value]
+    return value
+
+
+class OuraCassette:
+    """A directory of recorded request/response pairs."""
+
+    def __init__(self, directory: str | Path, mode: str = CASSETTE_REPLAY) -> None:
+        """Initialize the cassette.
+
+        Args:
+            directory: Directory holding one JSON file per recorded request
+            mode: CASSETTE_RECORD or CASSETTE_REPLAY
+        """
+        if mode not in (CASSETTE_RECORD, CASSETTE_REPLAY):
+            raise ValueError(f"Unknown cassette mode: {mode}")
+        self.directory = Path(directory)
+        self.mode = mode
+        self._recorded_at: datetime | None = None
+
+    @property
+    def replaying(self) -> bool:
+        """Return whether requests are answered from the cassette."""
+        return self.mode == CASSETTE_REPLAY
+
+    @property
+    def recording(self) -> bool:
+        """Return whether responses are written to the cassette."""
+        return self.mode == CASSETTE_RECORD
+
+    def _request(self, url: str, params: Mapping[str, Any] | None) -> dict[str, Any]:
+        """Return the host-independent identity of a request."""
+        return {
+            "path": urlsplit(url).path,
+            "params": {name: str(value) for name, value in sorted((params or {}).items())},
+        }
+
+    def _file(self, request: dict[str, Any]) -> Path:
+        """Return the cassette file of a request."""
+        digest = hashlib.sha1(
+            json.dumps(request, sort_keys=True).encode(), usedforsecurity=False
+        ).hexdigest()[:16]
+        name = request["path"].strip("/").replace("/", "_")
+        return self.directory / f"{name}-{digest}.json"
+
+    async def async_recorded_at(self) -> datetime | None:
+        """Return when the cassette was recorded, or None for a cassette without a manifest."""
+        if self._recorded_at is None and self.replaying:
+            manifest = await asyncio.get_running_loop().run_in_executor(
+                None, self._read, self.directory / CASSETTE_MANIFEST
+            )
+            if manifest is not None:
+                self._recorded_at = datetime.fromisoformat(manifest["recorded_at"])
+        return self._recorded_at
+
+    async def async_record(
+        self, url: str, params: Mapping[str, Any] | None, status: int, body: Any
+    ) -> None:
+        """Write one scrubbed request/response pair."""
+        loop = asyncio.get_running_loop()
+        if self._recorded_at is None:
+            # The first response of a recording session sets the replay clock
+            self._recorded_at = datetime.now(timezone.utc)
+            manifest = {
+                "version": CASSETTE_FORMAT_VERSION,
+                "recorded_at": self._recorded_at.isoformat(),
+            }
+            await loop.run_in_executor(
+                None, self._write, self.directory / CASSETTE_MANIFEST, manifest
+            )
+        request = self._request(url, params)
+        entry = {
+            "version": CASSETTE_FORMAT_VERSION,
+            "request": request,
+            "response": {"status": status, "body": _scrub(body)},
+        }
+        path = self._file(request)
+        await loop.run_in_executor(None, self._write, path, entry)
+
+    def _write(self, path: Path, entry: dict[str, Any]) -> None:
+        """Write a cassette file (runs in the executor)."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(entry, indent=1, sort_keys=True), encoding="utf-8")
+
+    async def async_play(
+        self, url: str, params: Mapping[str, Any] | None
+    ) -> tuple[int, Any]:
+        """Return the recorded status and decoded body of a request.
+
+        Raises:
+            CassetteMissError: If the request was never recorded.
+        """
+        request = self._request(url, params)
+        path = self._file(request)
+        entry = await asyncio.get_running_loop().run_in_executor(None, self._read, path)
+        if entry is None or entry.get("request") != request:
+            raise CassetteMissError(f"No recorded response for {request}")
+        response = entry["response"]
+        return response["status"], response["body"]
+
+    def _read(self, path: Path) -> dict[str, Any] | None:
+        """Read a cassette file (runs in the executor)."""
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+
+
+def cassette_from_env() -> OuraCassette | None:
+    """Return the cassette configured through the environment, if any."""
+    if not (directory := os.environ.get(ENV_CASSETTE_DIR)):
+        return None
+    mode = os.environ.get(ENV_CASSETTE_MODE, CASSETTE_REPLAY)
+    _LOGGER.warning("Oura API traffic uses the %s cassette in %s", mode, directory)
+    return OuraCassette(directory, mode)
@@ -9,6 +9,7 @@ from homeassistant import config_entries
 from homeassistant.config_entries import SOURCE_REAUTH
 from homeassistant.helpers import config_entry_oauth2_flow
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.storage import Store
 from homeassistant.data_entry_flow import FlowResult
 import voluptuous as vol
 
@@ -28,6 +29,12 @@ from .const import (
     MAX_UPDATE_INTERVAL,
     MIN_HISTORICAL_MONTHS,
     MAX_HISTORICAL_MONTHS,
+    DEFAULT_POLL_INTERVALS,
+    MAX_POLL_INTERVAL,
+    POLL_CLASS_OPTIONS,
+    CAPABILITY_STORAGE_KEY,
+    CAPABILITY_STORAGE_VERSION,
+    CONF_WEBHOOK_ENABLED,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -185,9 +192,14 @@ class OuraFlowHandler(
 
         if self.source == SOURCE_REAUTH:
             self._abort_if_unique_id_mismatch(reason="wrong_account")
-            return self.async_update_reload_and_abort(
-                self._get_reauth_entry(), data=data
-            )
+            reauth_entry = self._get_reauth_entry()
+            # New credentials may grant scopes that were missing; re-probe every endpoint
+            await Store(
+                self.hass,
+                CAPABILITY_STORAGE_VERSION,
+                CAPABILITY_STORAGE_KEY.format(entry_id=reauth_entry.entry_id),
+            ).async_remove()
+            return self.async_update_reload_and_abort(reauth_entry, data=data)
 
         self._abort_if_unique_id_configured()
 
@@ -237,6 +249,22 @@ class OuraOptionsFlowHandler(config_entries.OptionsFlow):
                         vol.Coerce(int),
                         vol.Range(min=MIN_UPDATE_INTERVAL, max=MAX_UPDATE_INTERVAL),
                     ),
+                    **{
+                        vol.Optional(
+                            option,
+                            default=self.config_entry.options.get(
+                                option, DEFAULT_POLL_INTERVALS[poll_class]
+                            ),
+                        ): vol.All(
+                            vol.Coerce(int),
+                            vol.Range(min=MIN_UPDATE_INTERVAL, max=MAX_POLL_INTERVAL),
+                        )
+                        for poll_class, option in POLL_CLASS_OPTIONS.items()
+                    },
+                    vol.Optional(
+                        CONF_WEBHOOK_ENABLED,
+                        default=self.config_entry.options.get(CONF_WEBHOOK_ENABLED, False),
+                    ): bool,
                     vol.Optional(
                         CONF_HISTORICAL_MONTHS,
                         default=self.config_entry.options.get(
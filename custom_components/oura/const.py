@@ -15,6 +15,10 @@ METERS_PER_MILE: Final = 1609.344  # Precise conversion factor
 CONF_UPDATE_INTERVAL: Final = "update_interval"
 CONF_HISTORICAL_MONTHS: Final = "historical_months"
 CONF_HISTORICAL_DATA_IMPORTED: Final = "historical_data_imported"
+CONF_INTRADAY_POLL_INTERVAL: Final = "intraday_poll_interval"
+CONF_DAILY_POLL_INTERVAL: Final = "daily_poll_interval"
+CONF_SLOW_POLL_INTERVAL: Final = "slow_poll_interval"
+CONF_WEBHOOK_ENABLED: Final = "webhook_enabled"
 
 # Authentication
 CONF_AUTH_METHOD: Final = "auth_method"
@@ -39,12 +43,104 @@ OAUTH2_SCOPES: Final = [
     "heart_health",
 ]
 API_BASE_URL: Final = "https://api.ouraring.com/v2/usercollection"
+# Point the client at another server (e.g. scripts/mock_server.py) for load testing
+ENV_API_BASE_URL: Final = "OURA_API_BASE_URL"
 
 # Update interval
 DEFAULT_UPDATE_INTERVAL: Final = 5  # minutes
 MIN_UPDATE_INTERVAL: Final = 1  # minimum 1 minute to respect API rate limits
 MAX_UPDATE_INTERVAL: Final = 60  # maximum 1 hour
 
+# Per-endpoint polling cadence, grouped by how often the underlying data changes.
+# "realtime" endpoints follow the update interval above; the others use their own.
+POLL_CLASS_REALTIME: Final = "realtime"  # heart rate samples
+POLL_CLASS_INTRADAY: Final = "intraday"  # accumulates through the day
+POLL_CLASS_DAILY: Final = "daily"  # arrives once per day after the ring syncs
+POLL_CLASS_SLOW: Final = "slow"  # long-term estimates that rarely change
+
+ENDPOINT_POLL_CLASSES: Final = {
+    "heartrate": POLL_CLASS_REALTIME,
+    "activity": POLL_CLASS_INTRADAY,
+    "stress": POLL_CLASS_INTRADAY,
+    "workout": POLL_CLASS_INTRADAY,
+    "session": POLL_CLASS_INTRADAY,
+    "tag": POLL_CLASS_INTRADAY,
+    "enhanced_tag": POLL_CLASS_INTRADAY,
+    "rest_mode": POLL_CLASS_INTRADAY,
+    "sleep": POLL_CLASS_DAILY,
+    "readiness": POLL_CLASS_DAILY,
+    "sleep_detail": POLL_CLASS_DAILY,
+    "resilience": POLL_CLASS_DAILY,
+    "spo2": POLL_CLASS_DAILY,
+    "vo2_max": POLL_CLASS_SLOW,
+    "cardiovascular_age": POLL_CLASS_SLOW,
+    "sleep_time": POLL_CLASS_SLOW,
+}
+
+# Option key and default cadence (minutes) for each non-realtime poll class
+POLL_CLASS_OPTIONS: Final = {
+    POLL_CLASS_INTRADAY: CONF_INTRADAY_POLL_INTERVAL,
+    POLL_CLASS_DAILY: CONF_DAILY_POLL_INTERVAL,
+    POLL_CLASS_SLOW: CONF_SLOW_POLL_INTERVAL,
+}
+DEFAULT_POLL_INTERVALS: Final = {
+    POLL_CLASS_INTRADAY: 15,
+    POLL_CLASS_DAILY: 30,
+    POLL_CLASS_SLOW: 360,
+}
+MAX_POLL_INTERVAL: Final = 1440  # maximum 1 day
+
+# Adaptive polling of daily endpoints around the learned wake-up time
+ADAPTIVE_WAKE_LEAD: Final = timedelta(minutes=30)  # start polling before expected wake-up
+ADAPTIVE_WAKE_WINDOW: Final = timedelta(hours=3)  # keep polling every tick this long after
+ADAPTIVE_IDLE_INTERVAL: Final = timedelta(hours=3)  # overnight, and once today's data arrived
+ADAPTIVE_WAKE_HISTORY: Final = 14  # nights used to learn the wake-up time
+ADAPTIVE_MIN_WAKE_SAMPLES: Final = 3  # flat polling until this many nights are known
+
+# Incremental sync state (per-endpoint cursors persisted between restarts)
+SYNC_STORAGE_VERSION: Final = 1
+SYNC_STORAGE_KEY: Final = DOMAIN + ".{entry_id}.sync"
+SYNC_STORAGE_SAVE_DELAY: Final = 30  # seconds
+
+# Endpoint capabilities (scope-gated endpoints that answered 401 are skipped
+# until they are re-probed, or until the entry is re-authenticated)
+CAPABILITY_STORAGE_VERSION: Final = 1
+CAPABILITY_STORAGE_KEY: Final = DOMAIN + ".{entry_id}.capabilities"
+CAPABILITY_REPROBE_INTERVAL: Final = timedelta(hours=24)
+
+# Last successful responses, restored on startup so sensors are available before
+# the first poll; older caches are ignored
+RESPONSE_CACHE_STORAGE_VERSION: Final = 1
+RESPONSE_CACHE_STORAGE_KEY: Final = DOMAIN + ".{entry_id}.responses"
+RESPONSE_CACHE_MAX_AGE: Final = timedelta(days=2)
+
+# Webhook push mode (OAuth2 only; subscriptions use the OAuth app's client credentials)
+WEBHOOK_API_URL: Final = "https://api.ouraring.com/v2/webhook/subscription"
+WEBHOOK_STORAGE_VERSION: Final = 1
+WEBHOOK_STORAGE_KEY: Final = DOMAIN + ".{entry_id}.webhook"
+WEBHOOK_EVENT_TYPES: Final = ("create", "update", "delete")
+# Oura webhook data type -> API_ENDPOINTS key (heart rate has no webhook and stays polled)
+WEBHOOK_DATA_TYPES: Final = {
+    "daily_sleep": "sleep",
+    "daily_readiness": "readiness",
+    "daily_activity": "activity",
+    "sleep": "sleep_detail",
+    "daily_stress": "stress",
+    "daily_resilience": "resilience",
+    "daily_spo2": "spo2",
+    "vo2_max": "vo2_max",
+    "daily_cardiovascular_age": "cardiovascular_age",
+    "sleep_time": "sleep_time",
+    "workout": "workout",
+    "session": "session",
+    "tag": "tag",
+    "enhanced_tag": "enhanced_tag",
+    "rest_mode_period": "rest_mode",
+}
+WEBHOOK_RENEW_CHECK_INTERVAL: Final = timedelta(hours=12)
+WEBHOOK_RENEW_BEFORE: Final = timedelta(days=2)  # renew subscriptions expiring within this
+WEBHOOK_FALLBACK_POLL_INTERVAL: Final = 360  # minutes; safety-net polling for pushed endpoints
+
 # Historical data loading
 DEFAULT_HISTORICAL_MONTHS: Final = 3  # Fetch 3 months by default (90 days)
 MIN_HISTORICAL_MONTHS: Final = 1  # Minimum 1 month
@@ -59,7 +155,7 @@ SENSOR_TYPES: Final = {
     "rem_sleep_duration": {"name": "REM Sleep Duration", "icon": "mdi:sleep", "unit": "h", "device_class": "duration", "state_class": "total", "entity_category": None, "data_category": "sleep_detail"},
     "light_sleep_duration": {"name": "Light Sleep Duration", "icon": "mdi:sleep", "unit": "h", "device_class": "duration", "state_class": "total", "entity_category": None, "data_category": "sleep_detail"},
     "awake_time": {"name": "Awake Time", "icon": "mdi:eye", "unit": "h", "device_class": "duration", "state_class": "total", "entity_category": None, "data_category": "sleep_detail"},
-    "sleep_efficiency": {"name": "Sleep Efficiency", "icon": "mdi:percent", "unit": "%", "device_class": None, "state_class": "measurement", "entity_category": None, "data_category": "sleep"},
+    "sleep_efficiency": {"name": "Sleep Efficiency", "icon": "mdi:percent", "unit": "%", "device_class": None, "state_class": "measurement", "entity_category": None, "data_category": "sleep_detail"},
     "restfulness": {"name": "Restfulness", "icon": "mdi:bed", "unit": "%", "device_class": None, "state_class": "measurement", "entity_category": None, "data_category": "sleep"},
     "sleep_latency": {"name": "Sleep Latency", "icon": "mdi:timer", "unit": "min", "device_class": "duration", "state_class": "measurement", "entity_category": None, "data_category": "sleep_detail"},
     "sleep_timing": {"name": "Sleep Timing", "icon": "mdi:clock-check", "unit": None, "device_class": None, "state_class": "measurement", "entity_category": None, "data_category": "sleep"},
@@ -140,4 +236,7 @@ SENSOR_TYPES: Final = {
     # Rest Mode timestamp sensors
     "rest_mode_start": {"name": "Rest Mode Start", "icon": "mdi:bed-clock", "unit": None, "device_class": "timestamp", "state_class": None, "entity_category": None, "data_category": "rest_mode"},
     "rest_mode_end": {"name": "Rest Mode End", "icon": "mdi:bed-clock-outline", "unit": None, "device_class": "timestamp", "state_class": None, "entity_category": None, "data_category": "rest_mode"},
+
+    # Integration diagnostics
+    "api_requests_remaining": {"name": "API Requests Remaining", "icon": "mdi:api", "unit": "requests", "device_class": None, "state_class": "measurement", "entity_category": EntityCategory.DIAGNOSTIC, "data_category": "diagnostics"},
 }
@@ -1,23 +1,201 @@
 """DataUpdateCoordinator for Oura Ring."""
 from __future__ import annotations
 
-from datetime import datetime, timedelta, timezone
+import asyncio
+import base64
+from collections import deque
+from collections.abc import Iterable, Mapping
+from datetime import date, datetime, timedelta, timezone
+import json
 import logging
 from typing import Any
+import zlib
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.util import dt as dt_util
 
-from .api import OuraApiClient
-from .const import DOMAIN, DEFAULT_UPDATE_INTERVAL, METERS_PER_MILE
-from .statistics import async_import_statistics
+from .api import API_ENDPOINTS, ENDPOINT_PATHS, UNSUPPORTED_KEY, OuraApiClient
+from .const import (
+    DOMAIN,
+    CAPABILITY_REPROBE_INTERVAL,
+    CAPABILITY_STORAGE_KEY,
+    CAPABILITY_STORAGE_VERSION,
+    DEFAULT_POLL_INTERVALS,
+    DEFAULT_UPDATE_INTERVAL,
+    ENDPOINT_POLL_CLASSES,
+    METERS_PER_MILE,
+    POLL_CLASS_DAILY,
+    POLL_CLASS_REALTIME,
+    RESPONSE_CACHE_MAX_AGE,
+    RESPONSE_CACHE_STORAGE_KEY,
+    RESPONSE_CACHE_STORAGE_VERSION,
+    SENSOR_TYPES,
+    SYNC_STORAGE_SAVE_DELAY,
+    SYNC_STORAGE_KEY,
+    SYNC_STORAGE_VERSION,
+    WEBHOOK_FALLBACK_POLL_INTERVAL,
+)
+from .extraction import extract_latest
+from .models import PATH_MODELS, decode_documents
+from .polling import OuraWakeSchedule
+from .snapshot import (
+    EnhancedTagSummary,
+    OuraSnapshot,
+    RestModeSummary,
+    TagSummary,
+    WorkoutSummary,
+    category_keys,
+)
+from .statistics import (
+    DailyHeartRateAggregator,
+    async_import_heartrate_statistics,
+    async_import_source_statistics,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
-
-class OuraDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
+# Documents per endpoint kept from a historical backfill to seed sensor states.
+# Covers a full day of 5-minute heart rate samples plus today's workouts/tags.
+HISTORICAL_STATE_DOCUMENTS = 300
+# Documents imported as statistics at a time during a backfill (whole days only)
+HISTORICAL_IMPORT_CHUNK = 500
+
+# Heart rate samples kept in the rolling buffer (two days of 5-minute samples)
+HEARTRATE_BUFFER_SAMPLES = 2 * 24 * 12
+
+# Processing step that turns each endpoint's raw documents into sensor values
+ENDPOINT_PROCESSORS = {
+    "sleep": "_process_sleep_scores",
+    "sleep_detail": "_process_sleep_details",
+    "readiness": "_process_readiness",
+    "activity": "_process_activity",
+    "heartrate": "_process_heart_rate",
+    "stress": "_process_stress",
+    "resilience": "_process_resilience",
+    "spo2": "_process_spo2",
+    "vo2_max": "_process_vo2_max",
+    "cardiovascular_age": "_process_cardiovascular_age",
+    "sleep_time": "_process_sleep_time",
+    "workout": "_process_workout",
+    "session": "_process_session",
+    "tag": "_process_tag",
+    "enhanced_tag": "_process_enhanced_tag",
+    "rest_mode": "_process_rest_mode",
+}
+
+# Processing steps whose output also depends on the current day (today's
+# workouts, sessions and tags) or on the current time (active rest mode)
+DAY_DEPENDENT_ENDPOINTS = frozenset({"workout", "session", "tag", "enhanced_tag"})
+TIME_DEPENDENT_ENDPOINTS = frozenset({"rest_mode"})
+
+# Non-sensor keys that are an entity's state rather than an attribute
+CATEGORY_STATE_KEYS = {"rest_mode": frozenset({"rest_mode_active"})}
+
+# Coordinator ticks can fire slightly early; treat endpoints due within this as due
+POLL_SCHEDULE_TOLERANCE = timedelta(seconds=30)
+
+
+def _document_day(document: dict[str, Any]) -> str:
+    """Return the ISO day a document belongs to."""
+    return (
+        document.get("day")
+        or document.get("start_day")
+        or (document.get("timestamp") or "")[:10]
+    )
+
+
+def _document_key(document: dict[str, Any]) -> str:
+    """Return a stable identity for a document (heart rate samples have no id)."""
+    return document.get("id") or document.get("timestamp") or repr(sorted(document.items()))
+
+
+def _document_sort_key(document: dict[str, Any]) -> tuple[str, str]:
+    """Order documents chronologically so the latest one is last."""
+    return (
+        _document_day(document),
+        document.get("timestamp")
+        or document.get("start_datetime")
+        or document.get("bedtime_start")
+        or document.get("start_time")
+        or "",
+    )
+
+
+def _merge_documents(
+    cached: list[dict[str, Any]],
+    fetched: list[dict[str, Any]],
+    cutoff: str,
+) -> list[dict[str, Any]]:
+    """Merge a delta fetch into cached documents.
+
+    Fetched documents replace cached ones with the same identity. Cached documents
+    older than the cutoff day are dropped; anything the API just returned is kept.
+    """
+    merged = {
+        _document_key(document): document
+        for document in cached
+        if _document_day(document) >= cutoff
+    }
+    for document in fetched:
+        merged[_document_key(document)] = document
+    return sorted(merged.values(), key=_document_sort_key)
+
+
+def _revises_documents(cached: list[Any], fetched: list[Any]) -> bool:
+    """Return whether fetched documents change the content of cached ones with the same identity.
+
+    Daily documents keep their id and day while they are updated during the
+    day (steps, scores), which the payload fingerprint alone can't see.
+    """
+    if not cached or not fetched:
+        return False
+    by_key = {_document_key(document): document for document in cached}
+    return any(
+        (previous := by_key.get(_document_key(document))) is not None and previous != document
+        for document in fetched
+    )
+
+
+def _payload_fingerprint(documents: list[Any]) -> int:
+    """Return a cheap fingerprint of an endpoint's documents: ids plus timestamp or day."""
+    return hash(tuple(
+        (document.get("id"), document.get("timestamp") or document.get("day"))
+        for document in documents
+    ))
+
+
+def _compress_documents(documents: list[Any]) -> str:
+    """Serialize documents (dicts or models) into a compressed, storable string."""
+    encoded = json.dumps(documents, separators=(",", ":"), default=dict).encode()
+    return base64.b64encode(zlib.compress(encoded)).decode("ascii")
+
+
+def _decompress_documents(endpoint: str, blob: str) -> list[Any]:
+    """Restore documents stored by _compress_documents, decoded into their model."""
+    documents = json.loads(zlib.decompress(base64.b64decode(blob)))
+    if model := PATH_MODELS.get(ENDPOINT_PATHS[endpoint]):
+        return decode_documents(model, documents)
+    return documents
+
+
+def _append_samples(buffer: list[dict[str, Any]], fetched: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Append heart rate samples newer than the buffer's last one, in place.
+
+    Delta polls return samples in order and overlap the buffer by at most the
+    sample they started from, so only the new tail is appended and the oldest
+    samples are dropped once the buffer is full.
+    """
+    last = (buffer[-1].get("timestamp") or "") if buffer else ""
+    buffer.extend(sample for sample in fetched if (sample.get("timestamp") or "") > last)
+    if len(buffer) > HEARTRATE_BUFFER_SAMPLES:
+        del buffer[:-HEARTRATE_BUFFER_SAMPLES]
+    return buffer
+
+
+class OuraDataUpdateCoordinator(DataUpdateCoordinator[OuraSnapshot]):
     """Class to manage fetching Oura Ring data."""
 
     def __init__(
@@ -26,8 +204,18 @@ class OuraDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         api_client: OuraApiClient,
         entry: ConfigEntry,
         update_interval_minutes: int = DEFAULT_UPDATE_INTERVAL,
+        poll_intervals: Mapping[str, int] | None = None,
     ) -> None:
-        """Initialize."""
+        """Initialize.
+
+        Args:
+            hass: Home Assistant instance
+            api_client: Oura API client
+            entry: Config entry
+            update_interval_minutes: Coordinator tick, also used for realtime endpoints
+            poll_intervals: Minutes per poll class (see ENDPOINT_POLL_CLASSES);
+                classes left out use DEFAULT_POLL_INTERVALS
+        """
         super().__init__(
             hass,
             _LOGGER,
@@ -38,12 +226,105 @@ class OuraDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self.entry = entry
         self.historical_data_loaded = False
 
-    async def _async_update_data(self) -> dict[str, Any]:
+        # Per-endpoint cadence; an endpoint is only fetched on ticks where it is due
+        self._class_intervals = {**DEFAULT_POLL_INTERVALS, **(poll_intervals or {})}
+        self._endpoint_intervals: dict[str, timedelta] = {
+            endpoint: self._class_interval(endpoint) for endpoint in API_ENDPOINTS
+        }
+        self._next_poll: dict[str, datetime] = {}
+        # Daily endpoints follow the learned wake-up time instead of a flat interval
+        self._wake_schedule = OuraWakeSchedule()
+        self._push_endpoints: set[str] = set()
+        # Per data category coordinators the entities subscribe to
+        self._categories: dict[str, OuraCategoryCoordinator] = {}
+        self._requested_endpoints: set[str] | None = None
+        # Entity updates skipped because nothing the entity reads changed
+        self.suppressed_writes = 0
+        # Last processing output per endpoint, keyed by its payload fingerprint
+        self._processed_endpoints: dict[str, tuple[Any, dict[str, Any]]] = {}
+        # Bumped when a fetch revises documents in place (same id and day)
+        self._payload_revisions: dict[str, int] = {}
+        # Processing steps skipped because their endpoint's payload was unchanged
+        self.reused_endpoints = 0
+
+        # Rolling window of raw documents per endpoint, merged from incremental fetches
+        self._raw_data: dict[str, dict[str, Any]] = {}
+        # Per-endpoint sync cursors ({"day": ..., "timestamp": ...}), persisted across restarts
+        self._sync_cursors: dict[str, dict[str, str]] | None = None
+        self._sync_store: Store[dict[str, Any]] = Store(
+            hass, SYNC_STORAGE_VERSION, SYNC_STORAGE_KEY.format(entry_id=entry.entry_id)
+        )
+        # Endpoints the account can't access, mapped to when they were last probed
+        self._unsupported_endpoints: dict[str, str] = {}
+        self._capability_store: Store[dict[str, Any]] = Store(
+            hass, CAPABILITY_STORAGE_VERSION, CAPABILITY_STORAGE_KEY.format(entry_id=entry.entry_id)
+        )
+        # Compressed copy of the raw documents, published right away after a restart
+        self._response_store: Store[dict[str, Any]] = Store(
+            hass,
+            RESPONSE_CACHE_STORAGE_VERSION,
+            RESPONSE_CACHE_STORAGE_KEY.format(entry_id=entry.entry_id),
+        )
+        # Compressed documents per endpoint, keyed by the state they were compressed from
+        self._stored_responses: dict[str, tuple[Any, str]] = {}
+        self._response_save_lock = asyncio.Lock()
+
+    @callback
+    def async_category(self, category: str) -> OuraCategoryCoordinator:
+        """Return the coordinator for one data category (SENSOR_TYPES data_category)."""
+        if (coordinator := self._categories.get(category)) is None:
+            coordinator = OuraCategoryCoordinator(self, category)
+            self._categories[category] = coordinator
+            self.entry.async_on_unload(self.async_add_listener(coordinator.async_handle_hub_update))
+        return coordinator
+
+    async def async_refresh_endpoints(self, endpoints: Iterable[str]) -> None:
+        """Fetch the given endpoints right away, regardless of their cadence."""
+        self._next_poll.update({endpoint: dt_util.utcnow() for endpoint in endpoints})
+        self._requested_endpoints = set(endpoints)
+        try:
+            await self.async_refresh()
+        finally:
+            self._requested_endpoints = None
+
+    def as_diagnostics(self) -> dict[str, Any]:
+        """Return the sync state for diagnostics."""
+        return {
+            "last_update_success": self.last_update_success,
+            "cursors": dict(self._sync_cursors or {}),
+            "next_poll": {
+                endpoint: next_poll.isoformat() for endpoint, next_poll in self._next_poll.items()
+            },
+            "unsupported_endpoints": dict(self._unsupported_endpoints),
+            "suppressed_writes": self.suppressed_writes,
+            "reused_endpoints": self.reused_endpoints,
+        }
+
+    async def _async_update_data(self) -> OuraSnapshot:
         """Update data via API."""
         try:
-            # For regular updates, only fetch 1 day of data
-            data = await self.api_client.async_get_data(days_back=1)
-            processed_data = self._process_data(data)
+            if self._sync_cursors is None:
+                await self._async_load_sync_state()
+
+            # Only request endpoints whose cadence is due, and only the delta
+            # since each endpoint's last successful sync
+            now = dt_util.utcnow()
+            due_endpoints = self._due_endpoints(now)
+            if self._requested_endpoints is not None:
+                due_endpoints = [
+                    endpoint for endpoint in due_endpoints if endpoint in self._requested_endpoints
+                ]
+            today = (await self.api_client.async_now()).date()
+            data = await self.api_client.async_get_data(
+                days_back=1,
+                since=self._cursor_start_dates(today),
+                endpoints=due_endpoints,
+                heartrate_since=(self._sync_cursors or {}).get("heartrate", {}).get("timestamp"),
+            )
+            self._update_capabilities(data, now)
+            self._merge_raw_data(data)
+            self._schedule_next_polls(data, now)
+            processed_data = self._process_changed_endpoints()
 
             # Check if we got any actual data back
             # If all endpoints failed, processed_data will be empty
@@ -59,7 +340,8 @@ class OuraDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 # If no existing data, this is a problem
                 raise UpdateFailed("No data available from API")
 
-            return processed_data
+            processed_data["api_requests_remaining"] = self.api_client.rate_limiter.remaining
+            return OuraSnapshot.from_dict(processed_data)
 
         except Exception as err:
             # Log the error but keep existing data to maintain sensor states
@@ -78,34 +360,434 @@ class OuraDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             # If no existing data (first run), raise the error
             raise UpdateFailed(f"Error communicating with API: {err}") from err
 
+    def _due_endpoints(self, now: datetime) -> list[str]:
+        """Return the endpoints whose polling cadence has elapsed.
+
+        Unsupported endpoints are left out until their re-probe is due.
+        """
+        # Allow a little slack so a tick that fires slightly early isn't skipped
+        now = now + POLL_SCHEDULE_TOLERANCE
+        return [
+            endpoint
+            for endpoint in API_ENDPOINTS
+            if ((next_poll := self._next_poll.get(endpoint)) is None or next_poll <= now)
+            and not self._is_unsupported(endpoint, now)
+        ]
+
+    def _is_unsupported(self, endpoint: str, now: datetime) -> bool:
+        """Return whether an endpoint is known unsupported and not due for a re-probe."""
+        if (probed_at := self._unsupported_endpoints.get(endpoint)) is None:
+            return False
+        try:
+            return now < datetime.fromisoformat(probed_at) + CAPABILITY_REPROBE_INTERVAL
+        except ValueError:
+            return False
+
+    def _update_capabilities(self, data: dict[str, Any], now: datetime) -> None:
+        """Record which scope-gated endpoints answered as unsupported this cycle."""
+        changed = False
+        for endpoint, payload in data.items():
+            if payload.get(UNSUPPORTED_KEY):
+                if endpoint not in self._unsupported_endpoints:
+                    _LOGGER.info(
+                        "Oura %s data is not available for this account; "
+                        "checking again in %s",
+                        endpoint, CAPABILITY_REPROBE_INTERVAL,
+                    )
+                self._unsupported_endpoints[endpoint] = now.isoformat()
+                changed = True
+            elif "data" in payload and self._unsupported_endpoints.pop(endpoint, None):
+                _LOGGER.info("Oura %s data is now available", endpoint)
+                changed = True
+
+        if changed:
+            self._capability_store.async_delay_save(
+                self._capabilities_to_store, SYNC_STORAGE_SAVE_DELAY
+            )
+
+    @callback
+    def _capabilities_to_store(self) -> dict[str, Any]:
+        """Return the capability map to persist."""
+        return {"unsupported": self._unsupported_endpoints}
+
+    def _schedule_next_polls(self, data: dict[str, Any], now: datetime) -> None:
+        """Schedule the next poll for endpoints that were fetched successfully.
+
+        Failed endpoints (empty dict) stay due and are retried on the next tick.
+        Daily endpoints that aren't pushed by webhook are timed around the
+        expected wake-up (see OuraWakeSchedule).
+        """
+        today = dt_util.as_local(now).date().isoformat()
+        for endpoint, payload in data.items():
+            if "data" not in payload:
+                continue
+            interval = self._endpoint_intervals[endpoint]
+            if (
+                ENDPOINT_POLL_CLASSES.get(endpoint) == POLL_CLASS_DAILY
+                and endpoint not in self._push_endpoints
+            ):
+                documents = self._raw_data.get(endpoint, {}).get("data") or []
+                has_today = bool(documents) and _document_day(documents[-1]) >= today
+                self._next_poll[endpoint] = self._wake_schedule.next_poll(now, interval, has_today)
+            else:
+                self._next_poll[endpoint] = now + interval
+
+    async def _async_load_sync_state(self) -> None:
+        """Load persisted sync cursors and endpoint capabilities."""
+        stored = await self._sync_store.async_load() or {}
+        self._sync_cursors = stored.get("cursors", {})
+        self._wake_schedule = OuraWakeSchedule(stored.get("wake_times"))
+        capabilities = await self._capability_store.async_load() or {}
+        self._unsupported_endpoints = capabilities.get("unsupported", {})
+
+    def _cursor_start_dates(self, today: date) -> dict[str, date]:
+        """Return the first day each endpoint still needs to be fetched from.
+
+        The last synced day is always re-requested because Oura keeps updating
+        the current day's documents (activity, stress, heart rate) until it ends.
+        Cursors older than the regular one-day window fall back to that window,
+        and cursors past today (synced after the recording a cassette replays)
+        start today.
+
+        Args:
+            today: The API client's current day (the recording day when replaying)
+        """
+        earliest = today - timedelta(days=1)
+        start_dates = {}
+        for endpoint, cursor in (self._sync_cursors or {}).items():
+            try:
+                start_dates[endpoint] = min(max(date.fromisoformat(cursor["day"]), earliest), today)
+            except (KeyError, TypeError, ValueError):
+                continue
+        return start_dates
+
+    def _merge_raw_data(self, data: dict[str, Any]) -> None:
+        """Merge freshly fetched documents into the rolling raw data window.
+
+        Endpoints that failed this cycle (empty dict) keep their cached documents
+        and cursor so the next poll retries the same delta.
+        """
+        if self._sync_cursors is None:
+            self._sync_cursors = {}
+
+        cutoff = (dt_util.now().date() - timedelta(days=1)).isoformat()
+
+        for endpoint, payload in data.items():
+            if "data" not in payload:
+                continue
+
+            cached = self._raw_data.get(endpoint, {}).get("data", [])
+            if endpoint == "heartrate":
+                documents = _append_samples(cached, payload["data"] or [])
+            else:
+                if _revises_documents(cached, payload["data"]):
+                    self._payload_revisions[endpoint] = self._payload_revisions.get(endpoint, 0) + 1
+                documents = _merge_documents(cached, payload["data"] or [], cutoff)
+            self._raw_data[endpoint] = {"data": documents}
+            if endpoint == "sleep_detail":
+                self._wake_schedule.learn(payload["data"] or [])
+
+            if documents:
+                latest = documents[-1]
+                cursor = {"day": _document_day(latest)}
+                if timestamp := latest.get("timestamp"):
+                    cursor["timestamp"] = timestamp
+                self._sync_cursors[endpoint] = cursor
+
+        self._sync_store.async_delay_save(self._sync_state_to_store, SYNC_STORAGE_SAVE_DELAY)
+        self._async_schedule_response_save()
+
+    @callback
+    def _sync_state_to_store(self) -> dict[str, Any]:
+        """Return the sync state to persist."""
+        return {"cursors": self._sync_cursors or {}, "wake_times": self._wake_schedule.wake_times}
+
+    def _response_key(self, endpoint: str, documents: list[Any]) -> Any:
+        """Return what identifies the state of an endpoint's cached documents."""
+        if endpoint == "heartrate":
+            # Append-only buffer trimmed at the front: its length and ends identify it
+            if not documents:
+                return None
+            return (len(documents), documents[0].get("timestamp"), documents[-1].get("timestamp"))
+        return (_payload_fingerprint(documents), self._payload_revisions.get(endpoint, 0))
+
+    @callback
+    def _async_schedule_response_save(self) -> None:
+        """Update the persisted copy of the raw documents in the background."""
+        self.entry.async_create_background_task(
+            self.hass, self._async_save_responses(), name=f"{DOMAIN} save cached responses"
+        )
+
+    async def _async_save_responses(self) -> None:
+        """Compress the endpoints whose documents changed, then schedule the write.
+
+        Unchanged endpoints keep their previous blob, and compression runs in the
+        executor so the heart rate buffer is not serialized in the event loop.
+        """
+        async with self._response_save_lock:
+            for endpoint, payload in list(self._raw_data.items()):
+                documents = payload.get("data") or []
+                key = self._response_key(endpoint, documents)
+                if (stored := self._stored_responses.get(endpoint)) is not None and stored[0] == key:
+                    continue
+                # Copy the list: the heart rate buffer is appended to in place
+                blob = await self.hass.async_add_executor_job(_compress_documents, list(documents))
+                self._stored_responses[endpoint] = (key, blob)
+        self._response_store.async_delay_save(self._responses_to_store, SYNC_STORAGE_SAVE_DELAY)
+
+    @callback
+    def _responses_to_store(self) -> dict[str, Any]:
+        """Return the compressed raw documents and poll schedule to persist."""
+        return {
+            "saved_at": dt_util.utcnow().isoformat(),
+            "endpoints": {
+                endpoint: blob
+                for endpoint, (_, blob) in self._stored_responses.items()
+                if endpoint in self._raw_data
+            },
+            "next_poll": {
+                endpoint: next_poll.isoformat() for endpoint, next_poll in self._next_poll.items()
+            },
+        }
+
+    async def async_restore_cached_data(self) -> bool:
+        """Publish the documents cached before the last restart.
+
+        The poll schedule is restored with them, so the background refresh that
+        follows only requests endpoints whose cadence has actually elapsed.
+
+        Returns:
+            True if cached state was published, False if a full first refresh is needed.
+        """
+        if self._sync_cursors is None:
+            await self._async_load_sync_state()
+
+        try:
+            stored = await self._response_store.async_load()
+        except (NotImplementedError, ValueError) as err:
+            # Written by another cache version, or unreadable
+            _LOGGER.debug("Ignoring cached Oura responses: %s", err)
+            return False
+        if not stored:
+            return False
+
+        saved_at = dt_util.parse_datetime(stored.get("saved_at") or "")
+        if saved_at is None or dt_util.utcnow() - saved_at > RESPONSE_CACHE_MAX_AGE:
+            return False
+
+        raw_data: dict[str, dict[str, Any]] = {}
+        for endpoint, blob in stored.get("endpoints", {}).items():
+            if endpoint not in API_ENDPOINTS:
+                continue
+            try:
+                raw_data[endpoint] = {"data": _decompress_documents(endpoint, blob)}
+            except (ValueError, TypeError, zlib.error) as err:
+                _LOGGER.debug("Ignoring cached Oura %s responses: %s", endpoint, err)
+
+        if not (processed_data := self._process_data(raw_data)):
+            return False
+
+        self._raw_data = raw_data
+        # The restored blobs stay valid until their endpoint's documents change
+        self._stored_responses = {
+            endpoint: (self._response_key(endpoint, payload["data"]), stored["endpoints"][endpoint])
+            for endpoint, payload in raw_data.items()
+        }
+        for endpoint, next_poll in stored.get("next_poll", {}).items():
+            if endpoint in raw_data and (parsed := dt_util.parse_datetime(next_poll)):
+                self._next_poll[endpoint] = parsed
+
+        processed_data["api_requests_remaining"] = self.api_client.rate_limiter.remaining
+        self.async_set_updated_data(OuraSnapshot.from_dict(processed_data))
+        _LOGGER.debug("Restored cached Oura data saved at %s", saved_at)
+        return True
+
+    def _class_interval(self, endpoint: str) -> timedelta:
+        """Return the regular polling interval of an endpoint's poll class."""
+        if ENDPOINT_POLL_CLASSES.get(endpoint, POLL_CLASS_REALTIME) == POLL_CLASS_REALTIME:
+            return self.update_interval
+        return timedelta(minutes=self._class_intervals[ENDPOINT_POLL_CLASSES[endpoint]])
+
+    @callback
+    def async_set_push_endpoints(self, endpoints: Iterable[str]) -> None:
+        """Poll endpoints that receive webhook pushes only as a slow safety net.
+
+        Called with the full set of currently subscribed endpoints; endpoints
+        that lost their subscription go back to their poll class's interval
+        and are polled again within it.
+        """
+        fallback = timedelta(minutes=WEBHOOK_FALLBACK_POLL_INTERVAL)
+        self._push_endpoints = set(endpoints)
+        now = dt_util.utcnow()
+        for endpoint in API_ENDPOINTS:
+            interval = self._class_interval(endpoint)
+            if endpoint in self._push_endpoints:
+                self._endpoint_intervals[endpoint] = max(interval, fallback)
+                continue
+            self._endpoint_intervals[endpoint] = interval
+            if (next_poll := self._next_poll.get(endpoint)) and next_poll > now + interval:
+                self._next_poll[endpoint] = now + interval
+
+    @callback
+    def async_merge_document(self, endpoint: str, document: dict[str, Any]) -> None:
+        """Merge one changed document and re-run only the processing step it feeds."""
+        before = self._process_endpoint(endpoint)
+        self._merge_raw_data({endpoint: {"data": [document]}})
+        self._async_publish_endpoint(endpoint, before)
+
+    @callback
+    def async_remove_document(self, endpoint: str, document_id: str) -> None:
+        """Drop a document the API reported as deleted and update sensors."""
+        cached = self._raw_data.get(endpoint, {}).get("data", [])
+        remaining = [document for document in cached if document.get("id") != document_id]
+        if len(remaining) == len(cached):
+            return
+        before = self._process_endpoint(endpoint)
+        self._raw_data[endpoint] = {"data": remaining}
+        self._async_schedule_response_save()
+        self._async_publish_endpoint(endpoint, before)
+
+    async def async_refresh_document(self, endpoint: str, document_id: str) -> None:
+        """Fetch one document by id and merge it, without reloading its collection."""
+        if (document := await self.api_client.async_get_document(endpoint, document_id)) is None:
+            # Gone since it was reported; treat it as deleted
+            self.async_remove_document(endpoint, document_id)
+            return
+        self.async_merge_document(endpoint, document)
+
+    def _process_endpoint(self, endpoint: str) -> dict[str, Any]:
+        """Run the processing step for one endpoint on the current raw data."""
+        processed: dict[str, Any] = {}
+        getattr(self, ENDPOINT_PROCESSORS[endpoint])(self._raw_data, processed)
+        return processed
+
+    @callback
+    def _async_publish_endpoint(self, endpoint: str, before: dict[str, Any]) -> None:
+        """Replace one endpoint's sensor values in the current data and notify listeners.
+
+        Args:
+            endpoint: Endpoint whose raw documents changed
+            before: Output of the endpoint's processing step before the change;
+                its keys are cleared so values that disappeared don't linger
+        """
+        if self.data is None:
+            processed_data = self._process_data(self._raw_data)
+        else:
+            processed_data = {key: value for key, value in self.data.items() if key not in before}
+            processed_data.update(self._process_endpoint(endpoint))
+        processed_data["api_requests_remaining"] = self.api_client.rate_limiter.remaining
+        self.async_set_updated_data(OuraSnapshot.from_dict(processed_data))
+
     async def async_load_historical_data(self, days: int) -> None:
         """Load historical data on first setup.
 
+        Each endpoint is streamed page by page and imported as statistics in
+        bounded chunks as documents arrive, so a multi-year backfill is never
+        held in memory, not even for a single endpoint.
+
         Args:
             days: Number of days of historical data to fetch
         """
         try:
             _LOGGER.info("Loading %d days of historical data...", days)
-            historical_data = await self.api_client.async_get_data(days_back=days)
+            today = (await self.api_client.async_now()).date()
+            start_date = today - timedelta(days=days)
+            end_date = today + timedelta(days=1)  # Exclusive end, so +1 to include today
+
+            # Only the most recent documents are kept for current sensor states
+            recent_data: dict[str, Any] = {}
+            total_stats = 0
+
+            for endpoint in API_ENDPOINTS:
+                if endpoint == "heartrate":
+                    # Hundreds of thousands of samples: aggregate per day while streaming
+                    total_stats += await self._async_load_historical_heartrate(
+                        start_date, end_date, recent_data
+                    )
+                    continue
+
+                total_stats += await self._async_load_historical_endpoint(
+                    endpoint, start_date, end_date, recent_data
+                )
 
-            # Import historical data as long-term statistics
-            try:
-                await async_import_statistics(self.hass, historical_data, self.entry)
-                _LOGGER.info("Historical data loaded successfully")
-            except Exception as stats_err:
-                _LOGGER.error("Failed to import statistics: %s", stats_err)
-                raise
+            _LOGGER.info(
+                "Historical data loaded successfully (%d statistics data points)", total_stats
+            )
+
+            # Seed the rolling window and sync cursors from the backfill tail
+            self._merge_raw_data(recent_data)
 
             # Process and store the LATEST day's data for current sensor states
-            processed_data = self._process_data(historical_data)
+            processed_data = self._process_data(self._raw_data)
 
             # Update the coordinator's data with current information
-            self.data = processed_data
+            self.data = OuraSnapshot.from_dict(processed_data)
             self.historical_data_loaded = True
         except Exception as err:
             _LOGGER.error("Failed to fetch historical data: %s", err)
             raise
 
+    async def _async_load_historical_endpoint(
+        self, endpoint: str, start_date: date, end_date: date, recent_data: dict[str, Any]
+    ) -> int:
+        """Stream one endpoint's backfill into statistics, a chunk of whole days at a time.
+
+        Chunks only end where the day changes, so daily aggregates (workouts,
+        sessions, tags) are never split across imports. Only the most recent
+        documents are kept to seed the sensor states and sync cursor.
+        """
+        recent: deque[Any] = deque(maxlen=HISTORICAL_STATE_DOCUMENTS)
+        chunk: list[Any] = []
+        stats_count = 0
+        # Fetch errors propagate: a partial backfill must not be marked as imported
+        async for document in self.api_client.async_iter_documents(endpoint, start_date, end_date):
+            if len(chunk) >= HISTORICAL_IMPORT_CHUNK and _document_day(document) != _document_day(chunk[-1]):
+                stats_count += await self._async_import_historical_chunk(endpoint, chunk)
+                chunk = []
+            chunk.append(document)
+            recent.append(document)
+
+        if chunk:
+            stats_count += await self._async_import_historical_chunk(endpoint, chunk)
+        recent_data[endpoint] = {"data": list(recent)} if recent else {}
+        return stats_count
+
+    async def _async_import_historical_chunk(self, endpoint: str, documents: list[Any]) -> int:
+        """Import a chunk of historical documents as long-term statistics."""
+        try:
+            return await async_import_source_statistics(self.hass, endpoint, documents, self.entry)
+        except Exception as stats_err:
+            _LOGGER.error("Failed to import statistics: %s", stats_err)
+            raise
+
+    async def _async_load_historical_heartrate(
+        self, start_date: date, end_date: date, recent_data: dict[str, Any]
+    ) -> int:
+        """Stream the heart rate backfill into daily aggregates.
+
+        Samples are folded into per-day statistics as each window arrives and
+        then dropped, so memory stays flat however many months are requested.
+        Only the most recent samples are kept to seed the sensor states.
+        """
+        aggregator = DailyHeartRateAggregator()
+        recent: deque[Any] = deque(maxlen=HISTORICAL_STATE_DOCUMENTS)
+        async for sample in self.api_client.async_iter_documents(
+            "heartrate", start_date, end_date
+        ):
+            aggregator.add(sample)
+            recent.append(sample)
+
+        try:
+            stats_count = await async_import_heartrate_statistics(
+                self.hass, aggregator, self.entry
+            )
+        except Exception as stats_err:
+            _LOGGER.error("Failed to import statistics: %s", stats_err)
+            raise
+
+        recent_data["heartrate"] = {"data": list(recent)}
+        return stats_count
+
     def _process_data(self, data: dict[str, Any]) -> dict[str, Any]:
         """Process the raw API data into sensor values.
 
@@ -133,120 +815,50 @@ class OuraDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         return processed
 
+    def _process_changed_endpoints(self) -> dict[str, Any]:
+        """Process the raw data, re-running only endpoints whose payload changed.
+
+        Each endpoint's documents are fingerprinted by ids plus timestamp or day
+        (and in-place revisions); unchanged endpoints reuse their previous output.
+        Steps that filter by today or by the current time are re-run when those change.
+        """
+        today = dt_util.now().date()
+        processed: dict[str, Any] = {}
+        for endpoint, processor in ENDPOINT_PROCESSORS.items():
+            documents = self._raw_data.get(endpoint, {}).get("data") or []
+            fingerprint = None
+            if endpoint not in TIME_DEPENDENT_ENDPOINTS:
+                fingerprint = (
+                    _payload_fingerprint(documents),
+                    self._payload_revisions.get(endpoint, 0),
+                    today if endpoint in DAY_DEPENDENT_ENDPOINTS else None,
+                )
+            previous = self._processed_endpoints.get(endpoint)
+            if fingerprint is not None and previous is not None and previous[0] == fingerprint:
+                self.reused_endpoints += 1
+                output = previous[1]
+            else:
+                output = {}
+                getattr(self, processor)(self._raw_data, output)
+                self._processed_endpoints[endpoint] = (fingerprint, output)
+            processed.update(output)
+        return processed
+
     def _process_sleep_scores(self, data: dict[str, Any], processed: dict[str, Any]) -> None:
         """Process sleep scores (contribution scores, not durations)."""
-        if sleep_data := data.get("sleep", {}).get("data"):
-            if sleep_data and len(sleep_data) > 0:
-                latest_sleep = sleep_data[-1]
-                processed["sleep_score"] = latest_sleep.get("score")
-                # Store the data date for verification
-                if day := latest_sleep.get("day"):
-                    processed["_data_date"] = day
-                if contributors := latest_sleep.get("contributors"):
-                    # Note: contributors.efficiency is the contributor score (0-100),
-                    # NOT the actual sleep efficiency percentage.
-                    # The actual efficiency percentage comes from the sleep_detail endpoint.
-                    processed["restfulness"] = contributors.get("restfulness")
-                    processed["sleep_timing"] = contributors.get("timing")
+        extract_latest(data, "sleep", processed)
 
     def _process_sleep_details(self, data: dict[str, Any], processed: dict[str, Any]) -> None:
         """Process detailed sleep data (actual durations and HRV)."""
-        if sleep_detail_data := data.get("sleep_detail", {}).get("data"):
-            if sleep_detail_data and len(sleep_detail_data) > 0:
-                latest_sleep_detail = sleep_detail_data[-1]
-
-                # Sleep efficiency (actual percentage, not contributor score)
-                if efficiency := latest_sleep_detail.get("efficiency"):
-                    processed["sleep_efficiency"] = efficiency
-
-                # Extract duration values
-                total_sleep_seconds = latest_sleep_detail.get("total_sleep_duration")
-                deep_sleep_seconds = latest_sleep_detail.get("deep_sleep_duration")
-                rem_sleep_seconds = latest_sleep_detail.get("rem_sleep_duration")
-                light_sleep_seconds = latest_sleep_detail.get("light_sleep_duration")
-
-                # Convert durations from seconds to hours (0 is valid for sleep durations)
-                if total_sleep_seconds is not None:
-                    processed["total_sleep_duration"] = total_sleep_seconds / 3600
-                if deep_sleep_seconds is not None:
-                    processed["deep_sleep_duration"] = deep_sleep_seconds / 3600
-                if rem_sleep_seconds is not None:
-                    processed["rem_sleep_duration"] = rem_sleep_seconds / 3600
-                if light_sleep_seconds is not None:
-                    processed["light_sleep_duration"] = light_sleep_seconds / 3600
-                if (awake := latest_sleep_detail.get("awake_time")) is not None:
-                    processed["awake_time"] = awake / 3600
-                if (latency := latest_sleep_detail.get("latency")) is not None:
-                    processed["sleep_latency"] = latency / 60  # Convert to minutes
-                if (time_in_bed := latest_sleep_detail.get("time_in_bed")) is not None:
-                    processed["time_in_bed"] = time_in_bed / 3600
-
-                # Calculate sleep stage percentages
-                if total_sleep_seconds and total_sleep_seconds > 0:
-                    if deep_sleep_seconds is not None:
-                        processed["deep_sleep_percentage"] = round(
-                            (deep_sleep_seconds / total_sleep_seconds) * 100, 1
-                        )
-                    if rem_sleep_seconds is not None:
-                        processed["rem_sleep_percentage"] = round(
-                            (rem_sleep_seconds / total_sleep_seconds) * 100, 1
-                        )
-
-                # HRV during sleep
-                if average_hrv := latest_sleep_detail.get("average_hrv"):
-                    processed["average_sleep_hrv"] = average_hrv
-
-                # Bedtime timestamps (when you went to sleep and woke up)
-                # Parse ISO 8601 datetime strings (e.g., "2024-01-15T23:30:00+00:00") to datetime objects
-                if bedtime_start := latest_sleep_detail.get("bedtime_start"):
-                    try:
-                        processed["bedtime_start"] = datetime.fromisoformat(bedtime_start.replace('Z', '+00:00'))
-                    except (ValueError, AttributeError) as e:
-                        _LOGGER.debug("Error parsing bedtime_start '%s': %s", bedtime_start, e)
-
-                if bedtime_end := latest_sleep_detail.get("bedtime_end"):
-                    try:
-                        processed["bedtime_end"] = datetime.fromisoformat(bedtime_end.replace('Z', '+00:00'))
-                    except (ValueError, AttributeError) as e:
-                        _LOGGER.debug("Error parsing bedtime_end '%s': %s", bedtime_end, e)
-
-
-                if lowest_heart_rate := latest_sleep_detail.get("lowest_heart_rate"):
-                    processed["lowest_sleep_heart_rate"] = lowest_heart_rate
-                if average_heart_rate := latest_sleep_detail.get("average_heart_rate"):
-                    processed["average_sleep_heart_rate"] = average_heart_rate
-
-                # Low battery alert flag (always set, defaults to False)
-                processed["low_battery_alert"] = latest_sleep_detail.get("low_battery_alert", False)
+        extract_latest(data, "sleep_detail", processed)
 
     def _process_readiness(self, data: dict[str, Any], processed: dict[str, Any]) -> None:
         """Process readiness data (contributors are scores 1-100)."""
-        if readiness_data := data.get("readiness", {}).get("data"):
-            if readiness_data and len(readiness_data) > 0:
-                latest_readiness = readiness_data[-1]
-                processed["readiness_score"] = latest_readiness.get("score")
-                processed["temperature_deviation"] = latest_readiness.get("temperature_deviation")
-
-                if contributors := latest_readiness.get("contributors"):
-                    processed["resting_heart_rate"] = contributors.get("resting_heart_rate")
-                    processed["hrv_balance"] = contributors.get("hrv_balance")
-                    # Sleep regularity is a separate contributor in the readiness data
-                    if sleep_regularity := contributors.get("sleep_regularity"):
-                        processed["sleep_regularity"] = sleep_regularity
+        extract_latest(data, "readiness", processed)
 
     def _process_activity(self, data: dict[str, Any], processed: dict[str, Any]) -> None:
         """Process activity data (steps, calories, MET minutes)."""
-        if activity_data := data.get("activity", {}).get("data"):
-            if activity_data and len(activity_data) > 0:
-                latest_activity = activity_data[-1]
-                processed["activity_score"] = latest_activity.get("score")
-                processed["steps"] = latest_activity.get("steps")
-                processed["active_calories"] = latest_activity.get("active_calories")
-                processed["total_calories"] = latest_activity.get("total_calories")
-                processed["target_calories"] = latest_activity.get("target_calories")
-                processed["met_min_high"] = latest_activity.get("high_activity_met_minutes")
-                processed["met_min_medium"] = latest_activity.get("medium_activity_met_minutes")
-                processed["met_min_low"] = latest_activity.get("low_activity_met_minutes")
+        extract_latest(data, "activity", processed)
 
     def _process_heart_rate(self, data: dict[str, Any], processed: dict[str, Any]) -> None:
         """Process heart rate data with aggregation from recent readings."""
@@ -255,7 +867,6 @@ class OuraDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 # Latest reading
                 latest_hr = heartrate_data[-1]
                 processed["current_heart_rate"] = latest_hr.get("bpm")
-                processed["heart_rate_timestamp"] = latest_hr.get("timestamp")
 
                 # Aggregate recent readings
                 recent_readings = [hr.get("bpm") for hr in heartrate_data[-10:] if hr.get("bpm")]
@@ -266,81 +877,30 @@ class OuraDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
     def _process_stress(self, data: dict[str, Any], processed: dict[str, Any]) -> None:
         """Process stress data (durations and day summary)."""
-        if stress_data := data.get("stress", {}).get("data"):
-            if stress_data and len(stress_data) > 0:
-                latest_stress = stress_data[-1]
-                # Convert from seconds to minutes - 0 is valid for stress durations
-                if (stress_high := latest_stress.get("stress_high")) is not None:
-                    processed["stress_high_duration"] = stress_high / 60
-                if (recovery_high := latest_stress.get("recovery_high")) is not None:
-                    processed["recovery_high_duration"] = recovery_high / 60
-                processed["stress_day_summary"] = latest_stress.get("day_summary")
+        extract_latest(data, "stress", processed)
 
     def _process_resilience(self, data: dict[str, Any], processed: dict[str, Any]) -> None:
         """Process resilience data (level and recovery scores)."""
-        if resilience_data := data.get("resilience", {}).get("data"):
-            if resilience_data and len(resilience_data) > 0:
-                latest_resilience = resilience_data[-1]
-                processed["resilience_level"] = latest_resilience.get("level")
-
-                if contributors := latest_resilience.get("contributors"):
-                    processed["sleep_recovery_score"] = contributors.get("sleep_recovery")
-                    processed["daytime_recovery_score"] = contributors.get("daytime_recovery")
-                    processed["stress_resilience_score"] = contributors.get("stress")
+        extract_latest(data, "resilience", processed)
 
     def _process_spo2(self, data: dict[str, Any], processed: dict[str, Any]) -> None:
         """Process SpO2 data (blood oxygen - Gen3 and Oura Ring 4 only)."""
-        if spo2_data := data.get("spo2", {}).get("data"):
-            if spo2_data and len(spo2_data) > 0:
-                latest_spo2 = spo2_data[-1]
-                if spo2_percentage := latest_spo2.get("spo2_percentage"):
-                    processed["spo2_average"] = spo2_percentage.get("average")
-                processed["breathing_disturbance_index"] = latest_spo2.get("breathing_disturbance_index")
+        extract_latest(data, "spo2", processed)
 
     def _process_vo2_max(self, data: dict[str, Any], processed: dict[str, Any]) -> None:
         """Process VO2 Max fitness data."""
-        if vo2_max_data := data.get("vo2_max", {}).get("data"):
-            if vo2_max_data and len(vo2_max_data) > 0:
-                latest_vo2 = vo2_max_data[-1]
-                processed["vo2_max"] = latest_vo2.get("vo2_max")
+        extract_latest(data, "vo2_max", processed)
 
     def _process_cardiovascular_age(self, data: dict[str, Any], processed: dict[str, Any]) -> None:
         """Process cardiovascular age data."""
-        if cardiovascular_age_data := data.get("cardiovascular_age", {}).get("data"):
-            if cardiovascular_age_data and len(cardiovascular_age_data) > 0:
-                latest_cv_age = cardiovascular_age_data[-1]
-                processed["cardiovascular_age"] = latest_cv_age.get("vascular_age")
+        extract_latest(data, "cardiovascular_age", processed)
 
     def _process_sleep_time(self, data: dict[str, Any], processed: dict[str, Any]) -> None:
         """Process sleep time recommendations (optimal bedtime windows).
 
         Converts seconds-from-midnight offsets to UTC datetime using the day_tz timezone offset.
         """
-        if sleep_time_data := data.get("sleep_time", {}).get("data"):
-            if sleep_time_data and len(sleep_time_data) > 0:
-                latest_sleep_time = sleep_time_data[-1]
-
-                if optimal_bedtime := latest_sleep_time.get("optimal_bedtime"):
-                    day_str = latest_sleep_time.get("day")
-                    day_tz = optimal_bedtime.get("day_tz", 0)
-                    start_offset = optimal_bedtime.get("start_offset")
-                    end_offset = optimal_bedtime.get("end_offset")
-
-                    if day_str and start_offset is not None:
-                        try:
-                            date_obj = datetime.strptime(day_str, "%Y-%m-%d")
-                            # Convert offsets (seconds from midnight local time) to UTC
-                            start_dt = date_obj + timedelta(seconds=start_offset) - timedelta(seconds=day_tz)
-                            end_dt = date_obj + timedelta(seconds=end_offset) - timedelta(seconds=day_tz)
-
-                            # Make timezone-aware for Home Assistant
-                            start_dt = start_dt.replace(tzinfo=timezone.utc)
-                            end_dt = end_dt.replace(tzinfo=timezone.utc)
-
-                            processed["optimal_bedtime_start"] = start_dt
-                            processed["optimal_bedtime_end"] = end_dt
-                        except Exception as e:
-                            _LOGGER.warning("Error calculating sleep time: %s", e)
+        extract_latest(data, "sleep_time", processed)
 
     def _process_workout(self, data: dict[str, Any], processed: dict[str, Any]) -> None:
         """Process workout data (count, type, distance, calories, intensity, duration)."""
@@ -398,8 +958,8 @@ class OuraDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                     except (ValueError, AttributeError) as e:
                         _LOGGER.debug("Error calculating workout duration: %s", e)
 
-                # Store raw workout data for sensor attributes
-                processed["_last_workout_raw"] = latest_workout
+                # Keep only the workout fields shown as sensor attributes
+                processed["_last_workout"] = WorkoutSummary.from_document(latest_workout)
 
     def _process_session(self, data: dict[str, Any], processed: dict[str, Any]) -> None:
         """Process session data (mindfulness, meditation, breathing)."""
@@ -466,12 +1026,12 @@ class OuraDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 # Store as comma-separated string (HA sensor states must be string/number/date/datetime/None)
                 # The list is also stored in attributes for programmatic access
                 processed["tags_today"] = ", ".join(unique_tags) if unique_tags else ""
-                processed["_tags_today_list"] = unique_tags  # Store list for attributes
+                processed["_tags_today_list"] = tuple(unique_tags)  # Store list for attributes
                 processed["tag_count_today"] = len(unique_tags)
 
                 # Store latest tag entry for attributes
                 if tag_data:
-                    processed["_latest_tag_entry"] = tag_data[-1]
+                    processed["_latest_tag"] = TagSummary.from_document(tag_data[-1])
 
     def _process_enhanced_tag(self, data: dict[str, Any], processed: dict[str, Any]) -> None:
         """Process enhanced tag data (provides tag_type_code, start_time, end_time, comment)."""
@@ -487,13 +1047,15 @@ class OuraDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                         try:
                             tag_date = datetime.strptime(day_str, "%Y-%m-%d").date()
                             if tag_date == today:
-                                today_enhanced_tags.append(enhanced_tag_entry)
+                                today_enhanced_tags.append(
+                                    EnhancedTagSummary.from_document(enhanced_tag_entry)
+                                )
                         except ValueError:
                             _LOGGER.debug("Error parsing enhanced tag day: %s", day_str)
 
                 # Store enhanced tag data for sensor attributes
                 # This provides rich metadata: tag_type_code, start_time, end_time, comment
-                processed["_enhanced_tags_today"] = today_enhanced_tags
+                processed["_enhanced_tags_today"] = tuple(today_enhanced_tags)
 
     def _process_rest_mode(self, data: dict[str, Any], processed: dict[str, Any]) -> None:
         """Process rest mode period data."""
@@ -537,4 +1099,83 @@ class OuraDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 if is_active and active_period:
                     processed["rest_mode_start"] = active_start_time
                     processed["rest_mode_end"] = active_end_time
-                    processed["_active_rest_mode_raw"] = active_period
+                    processed["_active_rest_mode"] = RestModeSummary.from_document(active_period)
+
+
+class OuraCategoryCoordinator(DataUpdateCoordinator[OuraSnapshot]):
+    """Coordinator for the entities of one data category.
+
+    The hub coordinator fetches and processes every endpoint; each category
+    shares its data but only notifies its own entities when a value they read
+    changed, so a heart rate poll no longer rewrites the state of every sleep,
+    readiness and activity sensor, nor an unchanged heart rate sensor. Refreshing a category (e.g. through
+    homeassistant.update_entity) fetches only its own endpoint.
+    """
+
+    def __init__(self, hub: OuraDataUpdateCoordinator, category: str) -> None:
+        """Initialize.
+
+        Args:
+            hub: Coordinator that fetches and processes the data
+            category: Data category (SENSOR_TYPES data_category, mostly an endpoint key)
+        """
+        super().__init__(hub.hass, _LOGGER, name=f"{DOMAIN} {category}")
+        self.hub = hub
+        self.entry = hub.entry
+        self.category = category
+        self.keys = category_keys(category)
+        self._sensor_keys = frozenset(
+            key for key, info in SENSOR_TYPES.items() if info.get("data_category") == category
+        ) | CATEGORY_STATE_KEYS.get(category, frozenset())
+        self.data = hub.data
+        self.last_update_success = hub.last_update_success
+        self._values: tuple[Any, ...] | None = None
+
+    @callback
+    def async_handle_hub_update(self) -> None:
+        """Pass a hub update on to the entities whose data changed.
+
+        Entities subscribe with their data key as listener context. Each is only
+        notified when that key changed, when an attribute key of the category
+        changed, or when availability flipped; every skipped notification is a
+        state write saved and is counted on the hub.
+        """
+        hub = self.hub
+        previous = self._values
+        values = OuraSnapshot.from_dict(hub.data or {}).category_values(self.category)
+        force = (
+            previous is None
+            or hub.last_update_success != self.last_update_success
+            or self.data is None
+        )
+        if previous is None:
+            changed = set(self.keys)
+        elif values == previous:
+            changed = set()
+        else:
+            changed = {
+                key for key, value, old in zip(self.keys, values, previous) if value != old
+            }
+
+        self.data = hub.data
+        self.last_update_success = hub.last_update_success
+        self.last_exception = hub.last_exception
+        self._values = values
+
+        # Attribute keys are shared by the category's entities
+        force = force or not changed <= self._sensor_keys
+        for update_callback, context in list(self._listeners.values()):
+            if force or context in changed or (context is None and changed):
+                update_callback()
+            else:
+                hub.suppressed_writes += 1
+
+    async def _async_update_data(self) -> OuraSnapshot:
+        """Fetch this category's endpoint through the hub."""
+        if self.category in API_ENDPOINTS:
+            await self.hub.async_refresh_endpoints([self.category])
+        else:
+            await self.hub.async_refresh()
+        if not self.hub.last_update_success:
+            raise UpdateFailed(f"Error updating Oura {self.category} data")
+        return self.hub.data
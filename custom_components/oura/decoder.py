@@ -0,0 +1,44 @@
+"""JSON decoding for Oura API payloads.
+
+Heart rate windows and detailed sleep documents are large enough that decoding
+dominates CPU time on low-power hosts. orjson (shipped with Home Assistant core)
+is used when it can be imported; otherwise the standard library decoder is used.
+"""
+from __future__ import annotations
+
+from collections.abc import Callable
+import json
+import logging
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+JsonLoads = Callable[[bytes | str], Any]
+
+DECODER_ORJSON = "orjson"
+DECODER_STDLIB = "json"
+
+
+def get_json_loads(name: str | None = None) -> tuple[str, JsonLoads]:
+    """Return the name and loads function of a JSON decoder.
+
+    Args:
+        name: Decoder to use (DECODER_ORJSON or DECODER_STDLIB). By default the
+            fastest available decoder is picked.
+    """
+    if name in (None, DECODER_ORJSON):
+        try:
+            import orjson
+        except ImportError:
+            if name == DECODER_ORJSON:
+                raise
+            _LOGGER.debug("orjson not available, using the standard library JSON decoder")
+        else:
+            return DECODER_ORJSON, orjson.loads
+
+    if name not in (None, DECODER_STDLIB):
+        raise ValueError(f"Unknown JSON decoder: {name}")
+    return DECODER_STDLIB, json.loads
+
+
+DECODER_NAME, json_loads = get_json_loads()
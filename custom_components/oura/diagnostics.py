@@ -0,0 +1,35 @@
+"""Diagnostics support for Oura Ring."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_PERSONAL_ACCESS_TOKEN, DOMAIN
+from .coordinator import OuraDataUpdateCoordinator
+
+TO_REDACT = {"token", "access_token", "refresh_token", CONF_PERSONAL_ACCESS_TOKEN, "unique_id"}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: OuraDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    api_client = coordinator.api_client
+
+    return {
+        "entry": async_redact_data(entry.as_dict(), TO_REDACT),
+        "api": {
+            "requests_remaining": api_client.rate_limiter.remaining,
+            "requests": api_client.metrics.as_dict(),
+            "circuit_breakers": {
+                endpoint: breaker.as_dict()
+                for endpoint, breaker in api_client.circuit_breakers.items()
+            },
+        },
+        "sync": coordinator.as_diagnostics(),
+        "data": coordinator.data,
+    }
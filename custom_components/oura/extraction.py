@@ -0,0 +1,278 @@
+"""Field extraction shared by the sensor states and the statistics import.
+
+Each data source declares once which document fields feed which sensor, with
+an optional unit transform. The schema is compiled at import into one accessor
+closure per field, so processing a document no longer splits paths or looks up
+transforms by name, and the live coordinator and the historical statistics
+import read the documents the same way.
+
+Field options:
+    sensor_key: Key of the processed value (SENSOR_TYPES / STATISTICS_METADATA)
+    api_path: Dot-separated path into the document
+    compute: Callable taking the document, used instead of api_path
+    transform: Name of a TRANSFORMS entry applied to the raw value
+    skip_zero: Treat 0 as not measured
+    statistics: False for values that are only shown as sensor states
+"""
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from datetime import datetime, timedelta, timezone
+import logging
+from typing import Any
+
+from .models import attribute_name
+
+_LOGGER = logging.getLogger(__name__)
+
+Accessor = Callable[[Mapping[str, Any]], Any]
+_UNSET: Any = object()
+
+
+def _iso_to_datetime(value: Any) -> Any:
+    """Parse an ISO 8601 string (with a Z or offset suffix) to a datetime."""
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except (ValueError, AttributeError):
+            return None
+    return value
+
+
+TRANSFORMS: dict[str, Callable[[Any], Any]] = {
+    "seconds_to_hours": lambda value: value / 3600,
+    "seconds_to_minutes": lambda value: value / 60,
+    "iso_to_datetime": _iso_to_datetime,
+}
+
+
+def compute_percentage(entry: Mapping[str, Any], numerator_key: str, denominator_key: str) -> float | None:
+    """Compute a percentage from two entry fields.
+
+    Args:
+        entry: Data entry
+        numerator_key: Key for numerator value
+        denominator_key: Key for denominator value
+
+    Returns:
+        Percentage value rounded to 1 decimal, or None if can't compute
+    """
+    numerator = entry.get(numerator_key)
+    denominator = entry.get(denominator_key)
+
+    if numerator is None or denominator is None or denominator == 0:
+        return None
+
+    return round((numerator / denominator) * 100, 1)
+
+
+def _optimal_bedtime(entry: Mapping[str, Any], offset_key: str) -> datetime | None:
+    """Convert an optimal bedtime offset (seconds from local midnight) to UTC."""
+    optimal_bedtime = entry.get("optimal_bedtime")
+    day_str = entry.get("day")
+    if not optimal_bedtime or not day_str:
+        return None
+    if (offset := optimal_bedtime.get(offset_key)) is None:
+        return None
+    try:
+        date_obj = datetime.strptime(day_str, "%Y-%m-%d")
+        local = date_obj + timedelta(seconds=offset)
+        return (local - timedelta(seconds=optimal_bedtime.get("day_tz", 0))).replace(tzinfo=timezone.utc)
+    except (TypeError, ValueError) as err:
+        _LOGGER.warning("Error calculating sleep time: %s", err)
+        return None
+
+
+# Data source (endpoint key) -> fields read from its latest / each daily document
+EXTRACTION_SCHEMA: dict[str, list[dict[str, Any]]] = {
+    "sleep": [
+        {"sensor_key": "sleep_score", "api_path": "score"},
+        # Note: sleep_efficiency comes from sleep_detail (actual %, not contributor score)
+        {"sensor_key": "restfulness", "api_path": "contributors.restfulness"},
+        {"sensor_key": "sleep_timing", "api_path": "contributors.timing"},
+        # Store the data date for verification
+        {"sensor_key": "_data_date", "api_path": "day", "statistics": False},
+    ],
+    "sleep_detail": [
+        {"sensor_key": "sleep_efficiency", "api_path": "efficiency", "skip_zero": True},  # Actual sleep efficiency %
+        {"sensor_key": "total_sleep_duration", "api_path": "total_sleep_duration", "transform": "seconds_to_hours"},
+        {"sensor_key": "deep_sleep_duration", "api_path": "deep_sleep_duration", "transform": "seconds_to_hours"},
+        {"sensor_key": "rem_sleep_duration", "api_path": "rem_sleep_duration", "transform": "seconds_to_hours"},
+        {"sensor_key": "light_sleep_duration", "api_path": "light_sleep_duration", "transform": "seconds_to_hours"},
+        {"sensor_key": "awake_time", "api_path": "awake_time", "transform": "seconds_to_hours"},
+        {"sensor_key": "sleep_latency", "api_path": "latency", "transform": "seconds_to_minutes"},
+        {"sensor_key": "time_in_bed", "api_path": "time_in_bed", "transform": "seconds_to_hours"},
+        {"sensor_key": "average_sleep_hrv", "api_path": "average_hrv", "skip_zero": True},
+        {"sensor_key": "lowest_sleep_heart_rate", "api_path": "lowest_heart_rate", "skip_zero": True},
+        {"sensor_key": "average_sleep_heart_rate", "api_path": "average_heart_rate", "skip_zero": True},
+        {"sensor_key": "bedtime_start", "api_path": "bedtime_start", "transform": "iso_to_datetime"},
+        {"sensor_key": "bedtime_end", "api_path": "bedtime_end", "transform": "iso_to_datetime"},
+        {
+            "sensor_key": "deep_sleep_percentage",
+            "compute": lambda entry: compute_percentage(entry, "deep_sleep_duration", "total_sleep_duration"),
+        },
+        {
+            "sensor_key": "rem_sleep_percentage",
+            "compute": lambda entry: compute_percentage(entry, "rem_sleep_duration", "total_sleep_duration"),
+        },
+        # Low battery alert flag (always set, defaults to False)
+        {
+            "sensor_key": "low_battery_alert",
+            "compute": lambda entry: entry.get("low_battery_alert") is True,
+            "statistics": False,
+        },
+    ],
+    "readiness": [
+        {"sensor_key": "readiness_score", "api_path": "score"},
+        {"sensor_key": "temperature_deviation", "api_path": "temperature_deviation"},
+        {"sensor_key": "resting_heart_rate", "api_path": "contributors.resting_heart_rate"},
+        {"sensor_key": "hrv_balance", "api_path": "contributors.hrv_balance"},
+        {"sensor_key": "sleep_regularity", "api_path": "contributors.sleep_regularity", "skip_zero": True},
+    ],
+    "activity": [
+        {"sensor_key": "activity_score", "api_path": "score"},
+        {"sensor_key": "steps", "api_path": "steps"},
+        {"sensor_key": "active_calories", "api_path": "active_calories"},
+        {"sensor_key": "total_calories", "api_path": "total_calories"},
+        {"sensor_key": "target_calories", "api_path": "target_calories"},
+        {"sensor_key": "met_min_high", "api_path": "high_activity_met_minutes"},
+        {"sensor_key": "met_min_medium", "api_path": "medium_activity_met_minutes"},
+        {"sensor_key": "met_min_low", "api_path": "low_activity_met_minutes"},
+    ],
+    "stress": [
+        {"sensor_key": "stress_high_duration", "api_path": "stress_high", "transform": "seconds_to_minutes"},
+        {"sensor_key": "recovery_high_duration", "api_path": "recovery_high", "transform": "seconds_to_minutes"},
+        {"sensor_key": "stress_day_summary", "api_path": "day_summary"},
+    ],
+    "resilience": [
+        {"sensor_key": "resilience_level", "api_path": "level"},
+        {"sensor_key": "sleep_recovery_score", "api_path": "contributors.sleep_recovery"},
+        {"sensor_key": "daytime_recovery_score", "api_path": "contributors.daytime_recovery"},
+        {"sensor_key": "stress_resilience_score", "api_path": "contributors.stress"},
+    ],
+    "spo2": [
+        {"sensor_key": "spo2_average", "api_path": "spo2_percentage.average"},
+        {"sensor_key": "breathing_disturbance_index", "api_path": "breathing_disturbance_index"},
+    ],
+    "vo2_max": [
+        {"sensor_key": "vo2_max", "api_path": "vo2_max"},
+    ],
+    "cardiovascular_age": [
+        {"sensor_key": "cardiovascular_age", "api_path": "vascular_age"},
+    ],
+    "sleep_time": [
+        # Recommendations, not measurements: shown as states only
+        {
+            "sensor_key": "optimal_bedtime_start",
+            "compute": lambda entry: _optimal_bedtime(entry, "start_offset"),
+            "statistics": False,
+        },
+        {
+            "sensor_key": "optimal_bedtime_end",
+            "compute": lambda entry: _optimal_bedtime(entry, "end_offset"),
+            "statistics": False,
+        },
+    ],
+}
+
+
+def _compile_key(key: str) -> Accessor:
+    """Compile a getter for one field of a raw dict or a decoded model.
+
+    Decoded models are read by attribute, which is several times faster than
+    their Mapping.get. Other mappings fall back to get; non-mappings (e.g. a
+    scalar where an object was expected) yield None.
+    """
+    attribute = attribute_name(key)
+
+    def get_field(document: Any) -> Any:
+        if document.__class__ is dict:
+            return document.get(key)
+        if (value := getattr(document, attribute, _UNSET)) is not _UNSET:
+            return value
+        return document.get(key) if isinstance(document, Mapping) else None
+
+    return get_field
+
+
+def compile_path(path: str) -> Accessor:
+    """Compile a dot-separated path into a getter returning None when missing."""
+    getters = tuple(_compile_key(key) for key in path.split("."))
+    if len(getters) == 1:
+        return getters[0]
+    if len(getters) == 2:
+        get_outer, get_inner = getters
+
+        def get_nested(document: Mapping[str, Any]) -> Any:
+            parent = get_outer(document)
+            return None if parent is None else get_inner(parent)
+
+        return get_nested
+
+    def get_deep(document: Mapping[str, Any]) -> Any:
+        value: Any = document
+        for getter in getters:
+            if (value := getter(value)) is None:
+                return None
+        return value
+
+    return get_deep
+
+
+def _compile_field(field: Mapping[str, Any]) -> Accessor:
+    """Compile a schema field into one accessor (path or compute, transform, zero check)."""
+    getter = field.get("compute") or compile_path(field["api_path"])
+    transform = TRANSFORMS[field["transform"]] if "transform" in field else None
+    skip_zero = field.get("skip_zero", False)
+    if transform is None and not skip_zero:
+        return getter
+
+    def accessor(document: Mapping[str, Any]) -> Any:
+        value = getter(document)
+        if value is None or (skip_zero and not value):
+            return None
+        return value if transform is None else transform(value)
+
+    return accessor
+
+
+class ExtractionPlan:
+    """Compiled accessors for the fields of one data source."""
+
+    __slots__ = ("source", "fields")
+
+    def __init__(self, source: str, fields: list[Mapping[str, Any]]) -> None:
+        """Compile the schema fields of a data source."""
+        self.source = source
+        self.fields: tuple[tuple[str, Accessor], ...] = tuple(
+            (field["sensor_key"], _compile_field(field)) for field in fields
+        )
+
+    @property
+    def sensor_keys(self) -> tuple[str, ...]:
+        """Return the keys this plan produces."""
+        return tuple(sensor_key for sensor_key, _ in self.fields)
+
+    def extract(self, document: Mapping[str, Any], into: dict[str, Any]) -> None:
+        """Store the document's values that are set."""
+        for sensor_key, accessor in self.fields:
+            if (value := accessor(document)) is not None:
+                into[sensor_key] = value
+
+
+# Plans for the sensor states (all fields) and for the statistics import
+LIVE_PLANS = {
+    source: ExtractionPlan(source, fields) for source, fields in EXTRACTION_SCHEMA.items()
+}
+STATISTICS_PLANS = {
+    source: ExtractionPlan(
+        source, [field for field in fields if field.get("statistics", True)]
+    )
+    for source, fields in EXTRACTION_SCHEMA.items()
+}
+
+
+def extract_latest(data: Mapping[str, Any], source: str, processed: dict[str, Any]) -> None:
+    """Extract the sensor values of a source's latest document."""
+    if documents := (data.get(source) or {}).get("data"):
+        LIVE_PLANS[source].extract(documents[-1], processed)
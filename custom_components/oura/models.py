@@ -0,0 +1,1612 @@
+"""Typed Oura API document models.
+
+Generated from docs/Oura API/openapi-1.28.json by scripts/generate_models.py; do not
+edit by hand.
+
+Documents are decoded into slotted, frozen dataclasses at the API boundary:
+missing or null fields become None, while values of the wrong type raise
+OuraModelError. Enum values are kept as plain strings so new values from the API
+don't break decoding. Every model is also a read-only Mapping keyed by the JSON
+field names (null fields are treated as absent), so code written against the raw
+dicts keeps working while new code can use attribute access. Array fields are
+decoded into tuples, so a model compares equal to the equivalent dict only if
+the dict holds tuples too; decoding a model's fields again gives an equal model.
+"""
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator, Mapping
+from dataclasses import dataclass
+import logging
+from typing import Any, ClassVar
+
+_LOGGER = logging.getLogger(__name__)
+
+# JSON keys that would shadow Mapping methods get a trailing underscore as attribute
+RESERVED_ATTRIBUTES = frozenset({"get", "items", "keys", "values"})
+
+
+def attribute_name(key: str) -> str:
+    """Return the model attribute holding a JSON field."""
+    return f"{key}_" if key in RESERVED_ATTRIBUTES else key
+
+
+class OuraModelError(ValueError):
+    """Raised when a document does not match its schema."""
+
+
+class OuraModel(Mapping[str, Any]):
+    """Base class for decoded documents."""
+
+    __slots__ = ()
+
+    # JSON key -> attribute name, filled in by each generated model
+    _attributes: ClassVar[dict[str, str]] = {}
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> OuraModel:
+        """Decode and validate a raw document."""
+        raise NotImplementedError
+
+    def __getitem__(self, key: str) -> Any:
+        """Return a field by its JSON name."""
+        attribute = self._attributes.get(key)
+        if attribute is None or (value := getattr(self, attribute)) is None:
+            raise KeyError(key)
+        return value
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return a field by its JSON name, or default if it is missing or null."""
+        attribute = self._attributes.get(key)
+        if attribute is None or (value := getattr(self, attribute)) is None:
+            return default
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the JSON names of the fields that are set."""
+        return (
+            key
+            for key, attribute in self._attributes.items()
+            if getattr(self, attribute) is not None
+        )
+
+    def __len__(self) -> int:
+        """Return the number of fields that are set."""
+        return sum(1 for _ in self)
+
+
+def _fail(field: str, expected: str, value: Any) -> OuraModelError:
+    return OuraModelError(f"{field}: expected {expected}, got {type(value).__name__}")
+
+
+def _str(value: Any, field: str) -> str | None:
+    if value is None or isinstance(value, str):
+        return value
+    raise _fail(field, "string", value)
+
+
+def _int(value: Any, field: str) -> int | None:
+    if value is None or (isinstance(value, int) and not isinstance(value, bool)):
+        return value
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    raise _fail(field, "integer", value)
+
+
+def _float(value: Any, field: str) -> float | None:
+    if value is None or (isinstance(value, (int, float)) and not isinstance(value, bool)):
+        return value
+    raise _fail(field, "number", value)
+
+
+def _bool(value: Any, field: str) -> bool | None:
+    if value is None or isinstance(value, bool):
+        return value
+    raise _fail(field, "boolean", value)
+
+
+# Item check -> item classes it accepts unchanged, for the array fast path
+_ITEM_CLASSES: dict[Callable[[Any, str], Any], tuple[type, ...]] = {
+    _str: (str, type(None)),
+    _int: (int, type(None)),
+    _float: (float, int, type(None)),
+    _bool: (bool, type(None)),
+}
+
+
+def _array(
+    value: Any, field: str, item: Callable[[Any, str], Any]
+) -> tuple[Any, ...] | None:
+    if value is None:
+        return None
+    if not isinstance(value, (list, tuple)):
+        raise _fail(field, "array", value)
+    # Series such as hrv.items are checked in one pass; only mismatches go through item
+    if (classes := _ITEM_CLASSES.get(item)) and all(
+        element.__class__ in classes for element in value
+    ):
+        return tuple(value)
+    return tuple(item(element, field) for element in value)
+
+
+def _model(value: Any, field: str, model: type[OuraModel]) -> OuraModel | None:
+    if value is None or isinstance(value, model):
+        return value
+    if not isinstance(value, Mapping):
+        raise _fail(field, "object", value)
+    return model.from_dict(value)
+
+
+@dataclass(slots=True, frozen=True, eq=False)
+class TagModel(OuraModel):
+    """A TagModel maps to an ASSANote. An ASSANote in ExtAPIV2 is called a Tag."""
+
+    id: str | None = None
+    day: str | None = None
+    text: str | None = None
+    timestamp: str | None = None
+    tags: tuple[str | None, ...] | None = None
+
+    _attributes: ClassVar[dict[str, str]] = {
+        "id": "id",
+        "day": "day",
+        "text": "text",
+        "timestamp": "timestamp",
+        "tags": "tags",
+    }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> TagModel:
+        """Decode and validate a raw document."""
+        id = data.get("id")
+        if id.__class__ is not str and id is not None:
+            id = _str(id, "TagModel.id")
+        day = data.get("day")
+        if day.__class__ is not str and day is not None:
+            day = _str(day, "TagModel.day")
+        text = data.get("text")
+        if text.__class__ is not str and text is not None:
+            text = _str(text, "TagModel.text")
+        timestamp = data.get("timestamp")
+        if timestamp.__class__ is not str and timestamp is not None:
+            timestamp = _str(timestamp, "TagModel.timestamp")
+        tags = data.get("tags")
+        tags = _array(tags, "TagModel.tags", _str)
+        return cls(
+            id,
+            day,
+            text,
+            timestamp,
+            tags,
+        )
+
+
+@dataclass(slots=True, frozen=True, eq=False)
+class EnhancedTagModel(OuraModel):
+    """An EnhancedTagModel maps an ASSATag. An ASSATag in ExtAPIV2 is called a EnhancedTag."""
+
+    id: str | None = None
+    tag_type_code: str | None = None
+    start_time: str | None = None
+    end_time: str | None = None
+    start_day: str | None = None
+    end_day: str | None = None
+    comment: str | None = None
+    custom_name: str | None = None
+
+    _attributes: ClassVar[dict[str, str]] = {
+        "id": "id",
+        "tag_type_code": "tag_type_code",
+        "start_time": "start_time",
+        "end_time": "end_time",
+        "start_day": "start_day",
+        "end_day": "end_day",
+        "comment": "comment",
+        "custom_name": "custom_name",
+    }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> EnhancedTagModel:
+        """Decode and validate a raw document."""
+        id = data.get("id")
+        if id.__class__ is not str and id is not None:
+            id = _str(id, "EnhancedTagModel.id")
+        tag_type_code = data.get("tag_type_code")
+        if tag_type_code.__class__ is not str and tag_type_code is not None:
+            tag_type_code = _str(tag_type_code, "EnhancedTagModel.tag_type_code")
+        start_time = data.get("start_time")
+        if start_time.__class__ is not str and start_time is not None:
+            start_time = _str(start_time, "EnhancedTagModel.start_time")
+        end_time = data.get("end_time")
+        if end_time.__class__ is not str and end_time is not None:
+            end_time = _str(end_time, "EnhancedTagModel.end_time")
+        start_day = data.get("start_day")
+        if start_day.__class__ is not str and start_day is not None:
+            start_day = _str(start_day, "EnhancedTagModel.start_day")
+        end_day = data.get("end_day")
+        if end_day.__class__ is not str and end_day is not None:
+            end_day = _str(end_day, "EnhancedTagModel.end_day")
+        comment = data.get("comment")
+        if comment.__class__ is not str and comment is not None:
+            comment = _str(comment, "EnhancedTagModel.comment")
+        custom_name = data.get("custom_name")
+        if custom_name.__class__ is not str and custom_name is not None:
+            custom_name = _str(custom_name, "EnhancedTagModel.custom_name")
+        return cls(
+            id,
+            tag_type_code,
+            start_time,
+            end_time,
+            start_day,
+            end_day,
+            comment,
+            custom_name,
+        )
+
+
+@dataclass(slots=True, frozen=True, eq=False)
+class PublicWorkout(OuraModel):
+    """Public model for Workout."""
+
+    id: str | None = None
+    activity: str | None = None
+    calories: float | None = None
+    day: str | None = None
+    distance: float | None = None
+    end_datetime: str | None = None
+    intensity: str | None = None
+    label: str | None = None
+    source: str | None = None
+    start_datetime: str | None = None
+
+    _attributes: ClassVar[dict[str, str]] = {
+        "id": "id",
+        "activity": "activity",
+        "calories": "calories",
+        "day": "day",
+        "distance": "distance",
+        "end_datetime": "end_datetime",
+        "intensity": "intensity",
+        "label": "label",
+        "source": "source",
+        "start_datetime": "start_datetime",
+    }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> PublicWorkout:
+        """Decode and validate a raw document."""
+        id = data.get("id")
+        if id.__class__ is not str and id is not None:
+            id = _str(id, "PublicWorkout.id")
+        activity = data.get("activity")
+        if activity.__class__ is not str and activity is not None:
+            activity = _str(activity, "PublicWorkout.activity")
+        calories = data.get("calories")
+        if calories.__class__ is not float and calories is not None:
+            calories = _float(calories, "PublicWorkout.calories")
+        day = data.get("day")
+        if day.__class__ is not str and day is not None:
+            day = _str(day, "PublicWorkout.day")
+        distance = data.get("distance")
+        if distance.__class__ is not float and distance is not None:
+            distance = _float(distance, "PublicWorkout.distance")
+        end_datetime = data.get("end_datetime")
+        if end_datetime.__class__ is not str and end_datetime is not None:
+            end_datetime = _str(end_datetime, "PublicWorkout.end_datetime")
+        intensity = data.get("intensity")
+        if intensity.__class__ is not str and intensity is not None:
+            intensity = _str(intensity, "PublicWorkout.intensity")
+        label = data.get("label")
+        if label.__class__ is not str and label is not None:
+            label = _str(label, "PublicWorkout.label")
+        source = data.get("source")
+        if source.__class__ is not str and source is not None:
+            source = _str(source, "PublicWorkout.source")
+        start_datetime = data.get("start_datetime")
+        if start_datetime.__class__ is not str and start_datetime is not None:
+            start_datetime = _str(start_datetime, "PublicWorkout.start_datetime")
+        return cls(
+            id,
+            activity,
+            calories,
+            day,
+            distance,
+            end_datetime,
+            intensity,
+            label,
+            source,
+            start_datetime,
+        )
+
+
+@dataclass(slots=True, frozen=True, eq=False)
+class SampleModel(OuraModel):
+    """SampleModel."""
+
+    interval: float | None = None
+    items_: tuple[float | None, ...] | None = None
+    timestamp: str | None = None
+
+    _attributes: ClassVar[dict[str, str]] = {
+        "interval": "interval",
+        "items": "items_",
+        "timestamp": "timestamp",
+    }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> SampleModel:
+        """Decode and validate a raw document."""
+        interval = data.get("interval")
+        if interval.__class__ is not float and interval is not None:
+            interval = _float(interval, "SampleModel.interval")
+        items_ = data.get("items")
+        items_ = _array(items_, "SampleModel.items", _float)
+        timestamp = data.get("timestamp")
+        if timestamp.__class__ is not str and timestamp is not None:
+            timestamp = _str(timestamp, "SampleModel.timestamp")
+        return cls(
+            interval,
+            items_,
+            timestamp,
+        )
+
+
+@dataclass(slots=True, frozen=True, eq=False)
+class SessionModel(OuraModel):
+    """SessionModel."""
+
+    id: str | None = None
+    day: str | None = None
+    start_datetime: str | None = None
+    end_datetime: str | None = None
+    type: str | None = None
+    heart_rate: SampleModel | None = None
+    heart_rate_variability: SampleModel | None = None
+    mood: str | None = None
+    motion_count: SampleModel | None = None
+
+    _attributes: ClassVar[dict[str, str]] = {
+        "id": "id",
+        "day": "day",
+        "start_datetime": "start_datetime",
+        "end_datetime": "end_datetime",
+        "type": "type",
+        "heart_rate": "heart_rate",
+        "heart_rate_variability": "heart_rate_variability",
+        "mood": "mood",
+        "motion_count": "motion_count",
+    }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> SessionModel:
+        """Decode and validate a raw document."""
+        id = data.get("id")
+        if id.__class__ is not str and id is not None:
+            id = _str(id, "SessionModel.id")
+        day = data.get("day")
+        if day.__class__ is not str and day is not None:
+            day = _str(day, "SessionModel.day")
+        start_datetime = data.get("start_datetime")
+        if start_datetime.__class__ is not str and start_datetime is not None:
+            start_datetime = _str(start_datetime, "SessionModel.start_datetime")
+        end_datetime = data.get("end_datetime")
+        if end_datetime.__class__ is not str and end_datetime is not None:
+            end_datetime = _str(end_datetime, "SessionModel.end_datetime")
+        type = data.get("type")
+        if type.__class__ is not str and type is not None:
+            type = _str(type, "SessionModel.type")
+        heart_rate = data.get("heart_rate")
+        heart_rate = _model(heart_rate, "SessionModel.heart_rate", SampleModel)
+        heart_rate_variability = data.get("heart_rate_variability")
+        heart_rate_variability = _model(heart_rate_variability, "SessionModel.heart_rate_variability", SampleModel)
+        mood = data.get("mood")
+        if mood.__class__ is not str and mood is not None:
+            mood = _str(mood, "SessionModel.mood")
+        motion_count = data.get("motion_count")
+        motion_count = _model(motion_count, "SessionModel.motion_count", SampleModel)
+        return cls(
+            id,
+            day,
+            start_datetime,
+            end_datetime,
+            type,
+            heart_rate,
+            heart_rate_variability,
+            mood,
+            motion_count,
+        )
+
+
+@dataclass(slots=True, frozen=True, eq=False)
+class ActivityContributors(OuraModel):
+    """Object defining activity score contributors."""
+
+    meet_daily_targets: int | None = None
+    move_every_hour: int | None = None
+    recovery_time: int | None = None
+    stay_active: int | None = None
+    training_frequency: int | None = None
+    training_volume: int | None = None
+
+    _attributes: ClassVar[dict[str, str]] = {
+        "meet_daily_targets": "meet_daily_targets",
+        "move_every_hour": "move_every_hour",
+        "recovery_time": "recovery_time",
+        "stay_active": "stay_active",
+        "training_frequency": "training_frequency",
+        "training_volume": "training_volume",
+    }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> ActivityContributors:
+        """Decode and validate a raw document."""
+        meet_daily_targets = data.get("meet_daily_targets")
+        if meet_daily_targets.__class__ is not int and meet_daily_targets is not None:
+            meet_daily_targets = _int(meet_daily_targets, "ActivityContributors.meet_daily_targets")
+        move_every_hour = data.get("move_every_hour")
+        if move_every_hour.__class__ is not int and move_every_hour is not None:
+            move_every_hour = _int(move_every_hour, "ActivityContributors.move_every_hour")
+        recovery_time = data.get("recovery_time")
+        if recovery_time.__class__ is not int and recovery_time is not None:
+            recovery_time = _int(recovery_time, "ActivityContributors.recovery_time")
+        stay_active = data.get("stay_active")
+        if stay_active.__class__ is not int and stay_active is not None:
+            stay_active = _int(stay_active, "ActivityContributors.stay_active")
+        training_frequency = data.get("training_frequency")
+        if training_frequency.__class__ is not int and training_frequency is not None:
+            training_frequency = _int(training_frequency, "ActivityContributors.training_frequency")
+        training_volume = data.get("training_volume")
+        if training_volume.__class__ is not int and training_volume is not None:
+            training_volume = _int(training_volume, "ActivityContributors.training_volume")
+        return cls(
+            meet_daily_targets,
+            move_every_hour,
+            recovery_time,
+            stay_active,
+            training_frequency,
+            training_volume,
+        )
+
+
+@dataclass(slots=True, frozen=True, eq=False)
+class DailyActivityModel(OuraModel):
+    """DailyActivityModel."""
+
+    id: str | None = None
+    class_5_min: str | None = None
+    score: int | None = None
+    active_calories: int | None = None
+    average_met_minutes: float | None = None
+    contributors: ActivityContributors | None = None
+    equivalent_walking_distance: int | None = None
+    high_activity_met_minutes: int | None = None
+    high_activity_time: int | None = None
+    inactivity_alerts: int | None = None
+    low_activity_met_minutes: int | None = None
+    low_activity_time: int | None = None
+    medium_activity_met_minutes: int | None = None
+    medium_activity_time: int | None = None
+    met: SampleModel | None = None
+    meters_to_target: int | None = None
+    non_wear_time: int | None = None
+    resting_time: int | None = None
+    sedentary_met_minutes: int | None = None
+    sedentary_time: int | None = None
+    steps: int | None = None
+    target_calories: int | None = None
+    target_meters: int | None = None
+    total_calories: int | None = None
+    day: str | None = None
+    timestamp: str | None = None
+
+    _attributes: ClassVar[dict[str, str]] = {
+        "id": "id",
+        "class_5_min": "class_5_min",
+        "score": "score",
+        "active_calories": "active_calories",
+        "average_met_minutes": "average_met_minutes",
+        "contributors": "contributors",
+        "equivalent_walking_distance": "equivalent_walking_distance",
+        "high_activity_met_minutes": "high_activity_met_minutes",
+        "high_activity_time": "high_activity_time",
+        "inactivity_alerts": "inactivity_alerts",
+        "low_activity_met_minutes": "low_activity_met_minutes",
+        "low_activity_time": "low_activity_time",
+        "medium_activity_met_minutes": "medium_activity_met_minutes",
+        "medium_activity_time": "medium_activity_time",
+        "met": "met",
+        "meters_to_target": "meters_to_target",
+        "non_wear_time": "non_wear_time",
+        "resting_time": "resting_time",
+        "sedentary_met_minutes": "sedentary_met_minutes",
+        "sedentary_time": "sedentary_time",
+        "steps": "steps",
+        "target_calories": "target_calories",
+        "target_meters": "target_meters",
+        "total_calories": "total_calories",
+        "day": "day",
+        "timestamp": "timestamp",
+    }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> DailyActivityModel:
+        """Decode and validate a raw document."""
+        id = data.get("id")
+        if id.__class__ is not str and id is not None:
+            id = _str(id, "DailyActivityModel.id")
+        class_5_min = data.get("class_5_min")
+        if class_5_min.__class__ is not str and class_5_min is not None:
+            class_5_min = _str(class_5_min, "DailyActivityModel.class_5_min")
+        score = data.get("score")
+        if score.__class__ is not int and score is not None:
+            score = _int(score, "DailyActivityModel.score")
+        active_calories = data.get("active_calories")
+        if active_calories.__class__ is not int and active_calories is not None:
+            active_calories = _int(active_calories, "DailyActivityModel.active_calories")
+        average_met_minutes = data.get("average_met_minutes")
+        if average_met_minutes.__class__ is not float and average_met_minutes is not None:
+            average_met_minutes = _float(average_met_minutes, "DailyActivityModel.average_met_minutes")
+        contributors = data.get("contributors")
+        contributors = _model(contributors, "DailyActivityModel.contributors", ActivityContributors)
+        equivalent_walking_distance = data.get("equivalent_walking_distance")
+        if equivalent_walking_distance.__class__ is not int and equivalent_walking_distance is not None:
+            equivalent_walking_distance = _int(equivalent_walking_distance, "DailyActivityModel.equivalent_walking_distance")
+        high_activity_met_minutes = data.get("high_activity_met_minutes")
+        if high_activity_met_minutes.__class__ is not int and high_activity_met_minutes is not None:
+            high_activity_met_minutes = _int(high_activity_met_minutes, "DailyActivityModel.high_activity_met_minutes")
+        high_activity_time = data.get("high_activity_time")
+        if high_activity_time.__class__ is not int and high_activity_time is not None:
+            high_activity_time = _int(high_activity_time, "DailyActivityModel.high_activity_time")
+        inactivity_alerts = data.get("inactivity_alerts")
+        if inactivity_alerts.__class__ is not int and inactivity_alerts is not None:
+            inactivity_alerts = _int(inactivity_alerts, "DailyActivityModel.inactivity_alerts")
+        low_activity_met_minutes = data.get("low_activity_met_minutes")
+        if low_activity_met_minutes.__class__ is not int and low_activity_met_minutes is not None:
+            low_activity_met_minutes = _int(low_activity_met_minutes, "DailyActivityModel.low_activity_met_minutes")
+        low_activity_time = data.get("low_activity_time")
+        if low_activity_time.__class__ is not int and low_activity_time is not None:
+            low_activity_time = _int(low_activity_time, "DailyActivityModel.low_activity_time")
+        medium_activity_met_minutes = data.get("medium_activity_met_minutes")
+        if medium_activity_met_minutes.__class__ is not int and medium_activity_met_minutes is not None:
+            medium_activity_met_minutes = _int(medium_activity_met_minutes, "DailyActivityModel.medium_activity_met_minutes")
+        medium_activity_time = data.get("medium_activity_time")
+        if medium_activity_time.__class__ is not int and medium_activity_time is not None:
+            medium_activity_time = _int(medium_activity_time, "DailyActivityModel.medium_activity_time")
+        met = data.get("met")
+        met = _model(met, "DailyActivityModel.met", SampleModel)
+        meters_to_target = data.get("meters_to_target")
+        if meters_to_target.__class__ is not int and meters_to_target is not None:
+            meters_to_target = _int(meters_to_target, "DailyActivityModel.meters_to_target")
+        non_wear_time = data.get("non_wear_time")
+        if non_wear_time.__class__ is not int and non_wear_time is not None:
+            non_wear_time = _int(non_wear_time, "DailyActivityModel.non_wear_time")
+        resting_time = data.get("resting_time")
+        if resting_time.__class__ is not int and resting_time is not None:
+            resting_time = _int(resting_time, "DailyActivityModel.resting_time")
+        sedentary_met_minutes = data.get("sedentary_met_minutes")
+        if sedentary_met_minutes.__class__ is not int and sedentary_met_minutes is not None:
+            sedentary_met_minutes = _int(sedentary_met_minutes, "DailyActivityModel.sedentary_met_minutes")
+        sedentary_time = data.get("sedentary_time")
+        if sedentary_time.__class__ is not int and sedentary_time is not None:
+            sedentary_time = _int(sedentary_time, "DailyActivityModel.sedentary_time")
+        steps = data.get("steps")
+        if steps.__class__ is not int and steps is not None:
+            steps = _int(steps, "DailyActivityModel.steps")
+        target_calories = data.get("target_calories")
+        if target_calories.__class__ is not int and target_calories is not None:
+            target_calories = _int(target_calories, "DailyActivityModel.target_calories")
+        target_meters = data.get("target_meters")
+        if target_meters.__class__ is not int and target_meters is not None:
+            target_meters = _int(target_meters, "DailyActivityModel.target_meters")
+        total_calories = data.get("total_calories")
+        if total_calories.__class__ is not int and total_calories is not None:
+            total_calories = _int(total_calories, "DailyActivityModel.total_calories")
+        day = data.get("day")
+        if day.__class__ is not str and day is not None:
+            day = _str(day, "DailyActivityModel.day")
+        timestamp = data.get("timestamp")
+        if timestamp.__class__ is not str and timestamp is not None:
+            timestamp = _str(timestamp, "DailyActivityModel.timestamp")
+        return cls(
+            id,
+            class_5_min,
+            score,
+            active_calories,
+            average_met_minutes,
+            contributors,
+            equivalent_walking_distance,
+            high_activity_met_minutes,
+            high_activity_time,
+            inactivity_alerts,
+            low_activity_met_minutes,
+            low_activity_time,
+            medium_activity_met_minutes,
+            medium_activity_time,
+            met,
+            meters_to_target,
+            non_wear_time,
+            resting_time,
+            sedentary_met_minutes,
+            sedentary_time,
+            steps,
+            target_calories,
+            target_meters,
+            total_calories,
+            day,
+            timestamp,
+        )
+
+
+@dataclass(slots=True, frozen=True, eq=False)
+class SleepContributors(OuraModel):
+    """Object defining sleep score contributors."""
+
+    deep_sleep: int | None = None
+    efficiency: int | None = None
+    latency: int | None = None
+    rem_sleep: int | None = None
+    restfulness: int | None = None
+    timing: int | None = None
+    total_sleep: int | None = None
+
+    _attributes: ClassVar[dict[str, str]] = {
+        "deep_sleep": "deep_sleep",
+        "efficiency": "efficiency",
+        "latency": "latency",
+        "rem_sleep": "rem_sleep",
+        "restfulness": "restfulness",
+        "timing": "timing",
+        "total_sleep": "total_sleep",
+    }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> SleepContributors:
+        """Decode and validate a raw document."""
+        deep_sleep = data.get("deep_sleep")
+        if deep_sleep.__class__ is not int and deep_sleep is not None:
+            deep_sleep = _int(deep_sleep, "SleepContributors.deep_sleep")
+        efficiency = data.get("efficiency")
+        if efficiency.__class__ is not int and efficiency is not None:
+            efficiency = _int(efficiency, "SleepContributors.efficiency")
+        latency = data.get("latency")
+        if latency.__class__ is not int and latency is not None:
+            latency = _int(latency, "SleepContributors.latency")
+        rem_sleep = data.get("rem_sleep")
+        if rem_sleep.__class__ is not int and rem_sleep is not None:
+            rem_sleep = _int(rem_sleep, "SleepContributors.rem_sleep")
+        restfulness = data.get("restfulness")
+        if restfulness.__class__ is not int and restfulness is not None:
+            restfulness = _int(restfulness, "SleepContributors.restfulness")
+        timing = data.get("timing")
+        if timing.__class__ is not int and timing is not None:
+            timing = _int(timing, "SleepContributors.timing")
+        total_sleep = data.get("total_sleep")
+        if total_sleep.__class__ is not int and total_sleep is not None:
+            total_sleep = _int(total_sleep, "SleepContributors.total_sleep")
+        return cls(
+            deep_sleep,
+            efficiency,
+            latency,
+            rem_sleep,
+            restfulness,
+            timing,
+            total_sleep,
+        )
+
+
+@dataclass(slots=True, frozen=True, eq=False)
+class DailySleepModel(OuraModel):
+    """Object defining daily sleep."""
+
+    id: str | None = None
+    contributors: SleepContributors | None = None
+    day: str | None = None
+    score: int | None = None
+    timestamp: str | None = None
+
+    _attributes: ClassVar[dict[str, str]] = {
+        "id": "id",
+        "contributors": "contributors",
+        "day": "day",
+        "score": "score",
+        "timestamp": "timestamp",
+    }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> DailySleepModel:
+        """Decode and validate a raw document."""
+        id = data.get("id")
+        if id.__class__ is not str and id is not None:
+            id = _str(id, "DailySleepModel.id")
+        contributors = data.get("contributors")
+        contributors = _model(contributors, "DailySleepModel.contributors", SleepContributors)
+        day = data.get("day")
+        if day.__class__ is not str and day is not None:
+            day = _str(day, "DailySleepModel.day")
+        score = data.get("score")
+        if score.__class__ is not int and score is not None:
+            score = _int(score, "DailySleepModel.score")
+        timestamp = data.get("timestamp")
+        if timestamp.__class__ is not str and timestamp is not None:
+            timestamp = _str(timestamp, "DailySleepModel.timestamp")
+        return cls(
+            id,
+            contributors,
+            day,
+            score,
+            timestamp,
+        )
+
+
+@dataclass(slots=True, frozen=True, eq=False)
+class DailySpO2AggregatedValuesModel(OuraModel):
+    """DailySpO2AggregatedValuesModel."""
+
+    average: float | None = None
+
+    _attributes: ClassVar[dict[str, str]] = {
+        "average": "average",
+    }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> DailySpO2AggregatedValuesModel:
+        """Decode and validate a raw document."""
+        average = data.get("average")
+        if average.__class__ is not float and average is not None:
+            average = _float(average, "DailySpO2AggregatedValuesModel.average")
+        return cls(
+            average,
+        )
+
+
+@dataclass(slots=True, frozen=True, eq=False)
+class DailySpO2Model(OuraModel):
+    """DailySpO2Model."""
+
+    id: str | None = None
+    day: str | None = None
+    spo2_percentage: DailySpO2AggregatedValuesModel | None = None
+    breathing_disturbance_index: int | None = None
+
+    _attributes: ClassVar[dict[str, str]] = {
+        "id": "id",
+        "day": "day",
+        "spo2_percentage": "spo2_percentage",
+        "breathing_disturbance_index": "breathing_disturbance_index",
+    }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> DailySpO2Model:
+        """Decode and validate a raw document."""
+        id = data.get("id")
+        if id.__class__ is not str and id is not None:
+            id = _str(id, "DailySpO2Model.id")
+        day = data.get("day")
+        if day.__class__ is not str and day is not None:
+            day = _str(day, "DailySpO2Model.day")
+        spo2_percentage = data.get("spo2_percentage")
+        spo2_percentage = _model(spo2_percentage, "DailySpO2Model.spo2_percentage", DailySpO2AggregatedValuesModel)
+        breathing_disturbance_index = data.get("breathing_disturbance_index")
+        if breathing_disturbance_index.__class__ is not int and breathing_disturbance_index is not None:
+            breathing_disturbance_index = _int(breathing_disturbance_index, "DailySpO2Model.breathing_disturbance_index")
+        return cls(
+            id,
+            day,
+            spo2_percentage,
+            breathing_disturbance_index,
+        )
+
+
+@dataclass(slots=True, frozen=True, eq=False)
+class ReadinessContributors(OuraModel):
+    """Object defining readiness score contributors."""
+
+    activity_balance: int | None = None
+    body_temperature: int | None = None
+    hrv_balance: int | None = None
+    previous_day_activity: int | None = None
+    previous_night: int | None = None
+    recovery_index: int | None = None
+    resting_heart_rate: int | None = None
+    sleep_balance: int | None = None
+    sleep_regularity: int | None = None
+
+    _attributes: ClassVar[dict[str, str]] = {
+        "activity_balance": "activity_balance",
+        "body_temperature": "body_temperature",
+        "hrv_balance": "hrv_balance",
+        "previous_day_activity": "previous_day_activity",
+        "previous_night": "previous_night",
+        "recovery_index": "recovery_index",
+        "resting_heart_rate": "resting_heart_rate",
+        "sleep_balance": "sleep_balance",
+        "sleep_regularity": "sleep_regularity",
+    }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> ReadinessContributors:
+        """Decode and validate a raw document."""
+        activity_balance = data.get("activity_balance")
+        if activity_balance.__class__ is not int and activity_balance is not None:
+            activity_balance = _int(activity_balance, "ReadinessContributors.activity_balance")
+        body_temperature = data.get("body_temperature")
+        if body_temperature.__class__ is not int and body_temperature is not None:
+            body_temperature = _int(body_temperature, "ReadinessContributors.body_temperature")
+        hrv_balance = data.get("hrv_balance")
+        if hrv_balance.__class__ is not int and hrv_balance is not None:
+            hrv_balance = _int(hrv_balance, "ReadinessContributors.hrv_balance")
+        previous_day_activity = data.get("previous_day_activity")
+        if previous_day_activity.__class__ is not int and previous_day_activity is not None:
+            previous_day_activity = _int(previous_day_activity, "ReadinessContributors.previous_day_activity")
+        previous_night = data.get("previous_night")
+        if previous_night.__class__ is not int and previous_night is not None:
+            previous_night = _int(previous_night, "ReadinessContributors.previous_night")
+        recovery_index = data.get("recovery_index")
+        if recovery_index.__class__ is not int and recovery_index is not None:
+            recovery_index = _int(recovery_index, "ReadinessContributors.recovery_index")
+        resting_heart_rate = data.get("resting_heart_rate")
+        if resting_heart_rate.__class__ is not int and resting_heart_rate is not None:
+            resting_heart_rate = _int(resting_heart_rate, "ReadinessContributors.resting_heart_rate")
+        sleep_balance = data.get("sleep_balance")
+        if sleep_balance.__class__ is not int and sleep_balance is not None:
+            sleep_balance = _int(sleep_balance, "ReadinessContributors.sleep_balance")
+        sleep_regularity = data.get("sleep_regularity")
+        if sleep_regularity.__class__ is not int and sleep_regularity is not None:
+            sleep_regularity = _int(sleep_regularity, "ReadinessContributors.sleep_regularity")
+        return cls(
+            activity_balance,
+            body_temperature,
+            hrv_balance,
+            previous_day_activity,
+            previous_night,
+            recovery_index,
+            resting_heart_rate,
+            sleep_balance,
+            sleep_regularity,
+        )
+
+
+@dataclass(slots=True, frozen=True, eq=False)
+class DailyReadinessModel(OuraModel):
+    """DailyReadinessModel."""
+
+    id: str | None = None
+    contributors: ReadinessContributors | None = None
+    day: str | None = None
+    score: int | None = None
+    temperature_deviation: float | None = None
+    temperature_trend_deviation: float | None = None
+    timestamp: str | None = None
+
+    _attributes: ClassVar[dict[str, str]] = {
+        "id": "id",
+        "contributors": "contributors",
+        "day": "day",
+        "score": "score",
+        "temperature_deviation": "temperature_deviation",
+        "temperature_trend_deviation": "temperature_trend_deviation",
+        "timestamp": "timestamp",
+    }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> DailyReadinessModel:
+        """Decode and validate a raw document."""
+        id = data.get("id")
+        if id.__class__ is not str and id is not None:
+            id = _str(id, "DailyReadinessModel.id")
+        contributors = data.get("contributors")
+        contributors = _model(contributors, "DailyReadinessModel.contributors", ReadinessContributors)
+        day = data.get("day")
+        if day.__class__ is not str and day is not None:
+            day = _str(day, "DailyReadinessModel.day")
+        score = data.get("score")
+        if score.__class__ is not int and score is not None:
+            score = _int(score, "DailyReadinessModel.score")
+        temperature_deviation = data.get("temperature_deviation")
+        if temperature_deviation.__class__ is not float and temperature_deviation is not None:
+            temperature_deviation = _float(temperature_deviation, "DailyReadinessModel.temperature_deviation")
+        temperature_trend_deviation = data.get("temperature_trend_deviation")
+        if temperature_trend_deviation.__class__ is not float and temperature_trend_deviation is not None:
+            temperature_trend_deviation = _float(temperature_trend_deviation, "DailyReadinessModel.temperature_trend_deviation")
+        timestamp = data.get("timestamp")
+        if timestamp.__class__ is not str and timestamp is not None:
+            timestamp = _str(timestamp, "DailyReadinessModel.timestamp")
+        return cls(
+            id,
+            contributors,
+            day,
+            score,
+            temperature_deviation,
+            temperature_trend_deviation,
+            timestamp,
+        )
+
+
+@dataclass(slots=True, frozen=True, eq=False)
+class ReadinessSummary(OuraModel):
+    """ReadinessSummary."""
+
+    contributors: ReadinessContributors | None = None
+    score: int | None = None
+    temperature_deviation: float | None = None
+    temperature_trend_deviation: float | None = None
+
+    _attributes: ClassVar[dict[str, str]] = {
+        "contributors": "contributors",
+        "score": "score",
+        "temperature_deviation": "temperature_deviation",
+        "temperature_trend_deviation": "temperature_trend_deviation",
+    }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> ReadinessSummary:
+        """Decode and validate a raw document."""
+        contributors = data.get("contributors")
+        contributors = _model(contributors, "ReadinessSummary.contributors", ReadinessContributors)
+        score = data.get("score")
+        if score.__class__ is not int and score is not None:
+            score = _int(score, "ReadinessSummary.score")
+        temperature_deviation = data.get("temperature_deviation")
+        if temperature_deviation.__class__ is not float and temperature_deviation is not None:
+            temperature_deviation = _float(temperature_deviation, "ReadinessSummary.temperature_deviation")
+        temperature_trend_deviation = data.get("temperature_trend_deviation")
+        if temperature_trend_deviation.__class__ is not float and temperature_trend_deviation is not None:
+            temperature_trend_deviation = _float(temperature_trend_deviation, "ReadinessSummary.temperature_trend_deviation")
+        return cls(
+            contributors,
+            score,
+            temperature_deviation,
+            temperature_trend_deviation,
+        )
+
+
+@dataclass(slots=True, frozen=True, eq=False)
+class SleepModel(OuraModel):
+    """SleepModel."""
+
+    id: str | None = None
+    average_breath: float | None = None
+    average_heart_rate: float | None = None
+    average_hrv: int | None = None
+    awake_time: int | None = None
+    bedtime_end: str | None = None
+    bedtime_start: str | None = None
+    day: str | None = None
+    deep_sleep_duration: int | None = None
+    efficiency: int | None = None
+    heart_rate: SampleModel | None = None
+    hrv: SampleModel | None = None
+    latency: int | None = None
+    light_sleep_duration: int | None = None
+    low_battery_alert: bool | None = None
+    lowest_heart_rate: int | None = None
+    movement_30_sec: str | None = None
+    period: int | None = None
+    readiness: ReadinessSummary | None = None
+    readiness_score_delta: int | None = None
+    rem_sleep_duration: int | None = None
+    restless_periods: int | None = None
+    sleep_phase_5_min: str | None = None
+    sleep_score_delta: int | None = None
+    sleep_algorithm_version: str | None = None
+    sleep_analysis_reason: str | None = None
+    time_in_bed: int | None = None
+    total_sleep_duration: int | None = None
+    type: str | None = None
+
+    _attributes: ClassVar[dict[str, str]] = {
+        "id": "id",
+        "average_breath": "average_breath",
+        "average_heart_rate": "average_heart_rate",
+        "average_hrv": "average_hrv",
+        "awake_time": "awake_time",
+        "bedtime_end": "bedtime_end",
+        "bedtime_start": "bedtime_start",
+        "day": "day",
+        "deep_sleep_duration": "deep_sleep_duration",
+        "efficiency": "efficiency",
+        "heart_rate": "heart_rate",
+        "hrv": "hrv",
+        "latency": "latency",
+        "light_sleep_duration": "light_sleep_duration",
+        "low_battery_alert": "low_battery_alert",
+        "lowest_heart_rate": "lowest_heart_rate",
+        "movement_30_sec": "movement_30_sec",
+        "period": "period",
+        "readiness": "readiness",
+        "readiness_score_delta": "readiness_score_delta",
+        "rem_sleep_duration": "rem_sleep_duration",
+        "restless_periods": "restless_periods",
+        "sleep_phase_5_min": "sleep_phase_5_min",
+        "sleep_score_delta": "sleep_score_delta",
+        "sleep_algorithm_version": "sleep_algorithm_version",
+        "sleep_analysis_reason": "sleep_analysis_reason",
+        "time_in_bed": "time_in_bed",
+        "total_sleep_duration": "total_sleep_duration",
+        "type": "type",
+    }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> SleepModel:
+        """Decode and validate a raw document."""
+        id = data.get("id")
+        if id.__class__ is not str and id is not None:
+            id = _str(id, "SleepModel.id")
+        average_breath = data.get("average_breath")
+        if average_breath.__class__ is not float and average_breath is not None:
+            average_breath = _float(average_breath, "SleepModel.average_breath")
+        average_heart_rate = data.get("average_heart_rate")
+        if average_heart_rate.__class__ is not float and average_heart_rate is not None:
+            average_heart_rate = _float(average_heart_rate, "SleepModel.average_heart_rate")
+        average_hrv = data.get("average_hrv")
+        if average_hrv.__class__ is not int and average_hrv is not None:
+            average_hrv = _int(average_hrv, "SleepModel.average_hrv")
+        awake_time = data.get("awake_time")
+        if awake_time.__class__ is not int and awake_time is not None:
+            awake_time = _int(awake_time, "SleepModel.awake_time")
+        bedtime_end = data.get("bedtime_end")
+        if bedtime_end.__class__ is not str and bedtime_end is not None:
+            bedtime_end = _str(bedtime_end, "SleepModel.bedtime_end")
+        bedtime_start = data.get("bedtime_start")
+        if bedtime_start.__class__ is not str and bedtime_start is not None:
+            bedtime_start = _str(bedtime_start, "SleepModel.bedtime_start")
+        day = data.get("day")
+        if day.__class__ is not str and day is not None:
+            day = _str(day, "SleepModel.day")
+        deep_sleep_duration = data.get("deep_sleep_duration")
+        if deep_sleep_duration.__class__ is not int and deep_sleep_duration is not None:
+            deep_sleep_duration = _int(deep_sleep_duration, "SleepModel.deep_sleep_duration")
+        efficiency = data.get("efficiency")
+        if efficiency.__class__ is not int and efficiency is not None:
+            efficiency = _int(efficiency, "SleepModel.efficiency")
+        heart_rate = data.get("heart_rate")
+        heart_rate = _model(heart_rate, "SleepModel.heart_rate", SampleModel)
+        hrv = data.get("hrv")
+        hrv = _model(hrv, "SleepModel.hrv", SampleModel)
+        latency = data.get("latency")
+        if latency.__class__ is not int and latency is not None:
+            latency = _int(latency, "SleepModel.latency")
+        light_sleep_duration = data.get("light_sleep_duration")
+        if light_sleep_duration.__class__ is not int and light_sleep_duration is not None:
+            light_sleep_duration = _int(light_sleep_duration, "SleepModel.light_sleep_duration")
+        low_battery_alert = data.get("low_battery_alert")
+        if low_battery_alert.__class__ is not bool and low_battery_alert is not None:
+            low_battery_alert = _bool(low_battery_alert, "SleepModel.low_battery_alert")
+        lowest_heart_rate = data.get("lowest_heart_rate")
+        if lowest_heart_rate.__class__ is not int and lowest_heart_rate is not None:
+            lowest_heart_rate = _int(lowest_heart_rate, "SleepModel.lowest_heart_rate")
+        movement_30_sec = data.get("movement_30_sec")
+        if movement_30_sec.__class__ is not str and movement_30_sec is not None:
+            movement_30_sec = _str(movement_30_sec, "SleepModel.movement_30_sec")
+        period = data.get("period")
+        if period.__class__ is not int and period is not None:
+            period = _int(period, "SleepModel.period")
+        readiness = data.get("readiness")
+        readiness = _model(readiness, "SleepModel.readiness", ReadinessSummary)
+        readiness_score_delta = data.get("readiness_score_delta")
+        if readiness_score_delta.__class__ is not int and readiness_score_delta is not None:
+            readiness_score_delta = _int(readiness_score_delta, "SleepModel.readiness_score_delta")
+        rem_sleep_duration = data.get("rem_sleep_duration")
+        if rem_sleep_duration.__class__ is not int and rem_sleep_duration is not None:
+            rem_sleep_duration = _int(rem_sleep_duration, "SleepModel.rem_sleep_duration")
+        restless_periods = data.get("restless_periods")
+        if restless_periods.__class__ is not int and restless_periods is not None:
+            restless_periods = _int(restless_periods, "SleepModel.restless_periods")
+        sleep_phase_5_min = data.get("sleep_phase_5_min")
+        if sleep_phase_5_min.__class__ is not str and sleep_phase_5_min is not None:
+            sleep_phase_5_min = _str(sleep_phase_5_min, "SleepModel.sleep_phase_5_min")
+        sleep_score_delta = data.get("sleep_score_delta")
+        if sleep_score_delta.__class__ is not int and sleep_score_delta is not None:
+            sleep_score_delta = _int(sleep_score_delta, "SleepModel.sleep_score_delta")
+        sleep_algorithm_version = data.get("sleep_algorithm_version")
+        if sleep_algorithm_version.__class__ is not str and sleep_algorithm_version is not None:
+            sleep_algorithm_version = _str(sleep_algorithm_version, "SleepModel.sleep_algorithm_version")
+        sleep_analysis_reason = data.get("sleep_analysis_reason")
+        if sleep_analysis_reason.__class__ is not str and sleep_analysis_reason is not None:
+            sleep_analysis_reason = _str(sleep_analysis_reason, "SleepModel.sleep_analysis_reason")
+        time_in_bed = data.get("time_in_bed")
+        if time_in_bed.__class__ is not int and time_in_bed is not None:
+            time_in_bed = _int(time_in_bed, "SleepModel.time_in_bed")
+        total_sleep_duration = data.get("total_sleep_duration")
+        if total_sleep_duration.__class__ is not int and total_sleep_duration is not None:
+            total_sleep_duration = _int(total_sleep_duration, "SleepModel.total_sleep_duration")
+        type = data.get("type")
+        if type.__class__ is not str and type is not None:
+            type = _str(type, "SleepModel.type")
+        return cls(
+            id,
+            average_breath,
+            average_heart_rate,
+            average_hrv,
+            awake_time,
+            bedtime_end,
+            bedtime_start,
+            day,
+            deep_sleep_duration,
+            efficiency,
+            heart_rate,
+            hrv,
+            latency,
+            light_sleep_duration,
+            low_battery_alert,
+            lowest_heart_rate,
+            movement_30_sec,
+            period,
+            readiness,
+            readiness_score_delta,
+            rem_sleep_duration,
+            restless_periods,
+            sleep_phase_5_min,
+            sleep_score_delta,
+            sleep_algorithm_version,
+            sleep_analysis_reason,
+            time_in_bed,
+            total_sleep_duration,
+            type,
+        )
+
+
+@dataclass(slots=True, frozen=True, eq=False)
+class SleepTimeWindow(OuraModel):
+    """Object defining sleep time window."""
+
+    day_tz: int | None = None
+    end_offset: int | None = None
+    start_offset: int | None = None
+
+    _attributes: ClassVar[dict[str, str]] = {
+        "day_tz": "day_tz",
+        "end_offset": "end_offset",
+        "start_offset": "start_offset",
+    }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> SleepTimeWindow:
+        """Decode and validate a raw document."""
+        day_tz = data.get("day_tz")
+        if day_tz.__class__ is not int and day_tz is not None:
+            day_tz = _int(day_tz, "SleepTimeWindow.day_tz")
+        end_offset = data.get("end_offset")
+        if end_offset.__class__ is not int and end_offset is not None:
+            end_offset = _int(end_offset, "SleepTimeWindow.end_offset")
+        start_offset = data.get("start_offset")
+        if start_offset.__class__ is not int and start_offset is not None:
+            start_offset = _int(start_offset, "SleepTimeWindow.start_offset")
+        return cls(
+            day_tz,
+            end_offset,
+            start_offset,
+        )
+
+
+@dataclass(slots=True, frozen=True, eq=False)
+class SleepTimeModel(OuraModel):
+    """Object contains suggested bedtime for the user."""
+
+    id: str | None = None
+    day: str | None = None
+    optimal_bedtime: SleepTimeWindow | None = None
+    recommendation: str | None = None
+    status: str | None = None
+
+    _attributes: ClassVar[dict[str, str]] = {
+        "id": "id",
+        "day": "day",
+        "optimal_bedtime": "optimal_bedtime",
+        "recommendation": "recommendation",
+        "status": "status",
+    }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> SleepTimeModel:
+        """Decode and validate a raw document."""
+        id = data.get("id")
+        if id.__class__ is not str and id is not None:
+            id = _str(id, "SleepTimeModel.id")
+        day = data.get("day")
+        if day.__class__ is not str and day is not None:
+            day = _str(day, "SleepTimeModel.day")
+        optimal_bedtime = data.get("optimal_bedtime")
+        optimal_bedtime = _model(optimal_bedtime, "SleepTimeModel.optimal_bedtime", SleepTimeWindow)
+        recommendation = data.get("recommendation")
+        if recommendation.__class__ is not str and recommendation is not None:
+            recommendation = _str(recommendation, "SleepTimeModel.recommendation")
+        status = data.get("status")
+        if status.__class__ is not str and status is not None:
+            status = _str(status, "SleepTimeModel.status")
+        return cls(
+            id,
+            day,
+            optimal_bedtime,
+            recommendation,
+            status,
+        )
+
+
+@dataclass(slots=True, frozen=True, eq=False)
+class RestModeEpisode(OuraModel):
+    """Object defining a Rest Mode episode."""
+
+    tags: tuple[str | None, ...] | None = None
+    timestamp: str | None = None
+
+    _attributes: ClassVar[dict[str, str]] = {
+        "tags": "tags",
+        "timestamp": "timestamp",
+    }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> RestModeEpisode:
+        """Decode and validate a raw document."""
+        tags = data.get("tags")
+        tags = _array(tags, "RestModeEpisode.tags", _str)
+        timestamp = data.get("timestamp")
+        if timestamp.__class__ is not str and timestamp is not None:
+            timestamp = _str(timestamp, "RestModeEpisode.timestamp")
+        return cls(
+            tags,
+            timestamp,
+        )
+
+
+@dataclass(slots=True, frozen=True, eq=False)
+class RestModePeriodModel(OuraModel):
+    """Object contains information about rest mode episode."""
+
+    id: str | None = None
+    end_day: str | None = None
+    end_time: str | None = None
+    episodes: tuple[RestModeEpisode, ...] | None = None
+    start_day: str | None = None
+    start_time: str | None = None
+
+    _attributes: ClassVar[dict[str, str]] = {
+        "id": "id",
+        "end_day": "end_day",
+        "end_time": "end_time",
+        "episodes": "episodes",
+        "start_day": "start_day",
+        "start_time": "start_time",
+    }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> RestModePeriodModel:
+        """Decode and validate a raw document."""
+        id = data.get("id")
+        if id.__class__ is not str and id is not None:
+            id = _str(id, "RestModePeriodModel.id")
+        end_day = data.get("end_day")
+        if end_day.__class__ is not str and end_day is not None:
+            end_day = _str(end_day, "RestModePeriodModel.end_day")
+        end_time = data.get("end_time")
+        if end_time.__class__ is not str and end_time is not None:
+            end_time = _str(end_time, "RestModePeriodModel.end_time")
+        episodes = data.get("episodes")
+        episodes = _array(episodes, "RestModePeriodModel.episodes", lambda v, f: _model(v, f, RestModeEpisode))
+        start_day = data.get("start_day")
+        if start_day.__class__ is not str and start_day is not None:
+            start_day = _str(start_day, "RestModePeriodModel.start_day")
+        start_time = data.get("start_time")
+        if start_time.__class__ is not str and start_time is not None:
+            start_time = _str(start_time, "RestModePeriodModel.start_time")
+        return cls(
+            id,
+            end_day,
+            end_time,
+            episodes,
+            start_day,
+            start_time,
+        )
+
+
+@dataclass(slots=True, frozen=True, eq=False)
+class RingConfigurationModel(OuraModel):
+    """RingConfigurationModel."""
+
+    id: str | None = None
+    color: str | None = None
+    design: str | None = None
+    firmware_version: str | None = None
+    hardware_type: str | None = None
+    set_up_at: str | None = None
+    size: int | None = None
+
+    _attributes: ClassVar[dict[str, str]] = {
+        "id": "id",
+        "color": "color",
+        "design": "design",
+        "firmware_version": "firmware_version",
+        "hardware_type": "hardware_type",
+        "set_up_at": "set_up_at",
+        "size": "size",
+    }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> RingConfigurationModel:
+        """Decode and validate a raw document."""
+        id = data.get("id")
+        if id.__class__ is not str and id is not None:
+            id = _str(id, "RingConfigurationModel.id")
+        color = data.get("color")
+        if color.__class__ is not str and color is not None:
+            color = _str(color, "RingConfigurationModel.color")
+        design = data.get("design")
+        if design.__class__ is not str and design is not None:
+            design = _str(design, "RingConfigurationModel.design")
+        firmware_version = data.get("firmware_version")
+        if firmware_version.__class__ is not str and firmware_version is not None:
+            firmware_version = _str(firmware_version, "RingConfigurationModel.firmware_version")
+        hardware_type = data.get("hardware_type")
+        if hardware_type.__class__ is not str and hardware_type is not None:
+            hardware_type = _str(hardware_type, "RingConfigurationModel.hardware_type")
+        set_up_at = data.get("set_up_at")
+        if set_up_at.__class__ is not str and set_up_at is not None:
+            set_up_at = _str(set_up_at, "RingConfigurationModel.set_up_at")
+        size = data.get("size")
+        if size.__class__ is not int and size is not None:
+            size = _int(size, "RingConfigurationModel.size")
+        return cls(
+            id,
+            color,
+            design,
+            firmware_version,
+            hardware_type,
+            set_up_at,
+            size,
+        )
+
+
+@dataclass(slots=True, frozen=True, eq=False)
+class DailyStressModel(OuraModel):
+    """Object defining daily stress."""
+
+    id: str | None = None
+    day: str | None = None
+    stress_high: int | None = None
+    recovery_high: int | None = None
+    day_summary: str | None = None
+
+    _attributes: ClassVar[dict[str, str]] = {
+        "id": "id",
+        "day": "day",
+        "stress_high": "stress_high",
+        "recovery_high": "recovery_high",
+        "day_summary": "day_summary",
+    }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> DailyStressModel:
+        """Decode and validate a raw document."""
+        id = data.get("id")
+        if id.__class__ is not str and id is not None:
+            id = _str(id, "DailyStressModel.id")
+        day = data.get("day")
+        if day.__class__ is not str and day is not None:
+            day = _str(day, "DailyStressModel.day")
+        stress_high = data.get("stress_high")
+        if stress_high.__class__ is not int and stress_high is not None:
+            stress_high = _int(stress_high, "DailyStressModel.stress_high")
+        recovery_high = data.get("recovery_high")
+        if recovery_high.__class__ is not int and recovery_high is not None:
+            recovery_high = _int(recovery_high, "DailyStressModel.recovery_high")
+        day_summary = data.get("day_summary")
+        if day_summary.__class__ is not str and day_summary is not None:
+            day_summary = _str(day_summary, "DailyStressModel.day_summary")
+        return cls(
+            id,
+            day,
+            stress_high,
+            recovery_high,
+            day_summary,
+        )
+
+
+@dataclass(slots=True, frozen=True, eq=False)
+class ResilienceContributors(OuraModel):
+    """ResilienceContributors."""
+
+    sleep_recovery: float | None = None
+    daytime_recovery: float | None = None
+    stress: float | None = None
+
+    _attributes: ClassVar[dict[str, str]] = {
+        "sleep_recovery": "sleep_recovery",
+        "daytime_recovery": "daytime_recovery",
+        "stress": "stress",
+    }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> ResilienceContributors:
+        """Decode and validate a raw document."""
+        sleep_recovery = data.get("sleep_recovery")
+        if sleep_recovery.__class__ is not float and sleep_recovery is not None:
+            sleep_recovery = _float(sleep_recovery, "ResilienceContributors.sleep_recovery")
+        daytime_recovery = data.get("daytime_recovery")
+        if daytime_recovery.__class__ is not float and daytime_recovery is not None:
+            daytime_recovery = _float(daytime_recovery, "ResilienceContributors.daytime_recovery")
+        stress = data.get("stress")
+        if stress.__class__ is not float and stress is not None:
+            stress = _float(stress, "ResilienceContributors.stress")
+        return cls(
+            sleep_recovery,
+            daytime_recovery,
+            stress,
+        )
+
+
+@dataclass(slots=True, frozen=True, eq=False)
+class DailyResilienceModel(OuraModel):
+    """DailyResilienceModel."""
+
+    id: str | None = None
+    day: str | None = None
+    contributors: ResilienceContributors | None = None
+    level: str | None = None
+
+    _attributes: ClassVar[dict[str, str]] = {
+        "id": "id",
+        "day": "day",
+        "contributors": "contributors",
+        "level": "level",
+    }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> DailyResilienceModel:
+        """Decode and validate a raw document."""
+        id = data.get("id")
+        if id.__class__ is not str and id is not None:
+            id = _str(id, "DailyResilienceModel.id")
+        day = data.get("day")
+        if day.__class__ is not str and day is not None:
+            day = _str(day, "DailyResilienceModel.day")
+        contributors = data.get("contributors")
+        contributors = _model(contributors, "DailyResilienceModel.contributors", ResilienceContributors)
+        level = data.get("level")
+        if level.__class__ is not str and level is not None:
+            level = _str(level, "DailyResilienceModel.level")
+        return cls(
+            id,
+            day,
+            contributors,
+            level,
+        )
+
+
+@dataclass(slots=True, frozen=True, eq=False)
+class DailyCardiovascularAgeModel(OuraModel):
+    """DailyCardiovascularAgeModel."""
+
+    day: str | None = None
+    vascular_age: int | None = None
+
+    _attributes: ClassVar[dict[str, str]] = {
+        "day": "day",
+        "vascular_age": "vascular_age",
+    }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> DailyCardiovascularAgeModel:
+        """Decode and validate a raw document."""
+        day = data.get("day")
+        if day.__class__ is not str and day is not None:
+            day = _str(day, "DailyCardiovascularAgeModel.day")
+        vascular_age = data.get("vascular_age")
+        if vascular_age.__class__ is not int and vascular_age is not None:
+            vascular_age = _int(vascular_age, "DailyCardiovascularAgeModel.vascular_age")
+        return cls(
+            day,
+            vascular_age,
+        )
+
+
+@dataclass(slots=True, frozen=True, eq=False)
+class VO2MaxModel(OuraModel):
+    """VO2MaxModel."""
+
+    id: str | None = None
+    day: str | None = None
+    timestamp: str | None = None
+    vo2_max: float | None = None
+
+    _attributes: ClassVar[dict[str, str]] = {
+        "id": "id",
+        "day": "day",
+        "timestamp": "timestamp",
+        "vo2_max": "vo2_max",
+    }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> VO2MaxModel:
+        """Decode and validate a raw document."""
+        id = data.get("id")
+        if id.__class__ is not str and id is not None:
+            id = _str(id, "VO2MaxModel.id")
+        day = data.get("day")
+        if day.__class__ is not str and day is not None:
+            day = _str(day, "VO2MaxModel.day")
+        timestamp = data.get("timestamp")
+        if timestamp.__class__ is not str and timestamp is not None:
+            timestamp = _str(timestamp, "VO2MaxModel.timestamp")
+        vo2_max = data.get("vo2_max")
+        if vo2_max.__class__ is not float and vo2_max is not None:
+            vo2_max = _float(vo2_max, "VO2MaxModel.vo2_max")
+        return cls(
+            id,
+            day,
+            timestamp,
+            vo2_max,
+        )
+
+
+@dataclass(slots=True, frozen=True, eq=False)
+class HeartRateModel(OuraModel):
+    """HeartRateModel."""
+
+    bpm: int | None = None
+    source: str | None = None
+    timestamp: str | None = None
+
+    _attributes: ClassVar[dict[str, str]] = {
+        "bpm": "bpm",
+        "source": "source",
+        "timestamp": "timestamp",
+    }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> HeartRateModel:
+        """Decode and validate a raw document."""
+        bpm = data.get("bpm")
+        if bpm.__class__ is not int and bpm is not None:
+            bpm = _int(bpm, "HeartRateModel.bpm")
+        source = data.get("source")
+        if source.__class__ is not str and source is not None:
+            source = _str(source, "HeartRateModel.source")
+        timestamp = data.get("timestamp")
+        if timestamp.__class__ is not str and timestamp is not None:
+            timestamp = _str(timestamp, "HeartRateModel.timestamp")
+        return cls(
+            bpm,
+            source,
+            timestamp,
+        )
+
+
+# Document model per collection path (the segment after API_BASE_URL); heart rate
+# samples are not listed and stay plain dicts
+PATH_MODELS: dict[str, type[OuraModel]] = {
+    "tag": TagModel,
+    "enhanced_tag": EnhancedTagModel,
+    "workout": PublicWorkout,
+    "session": SessionModel,
+    "daily_activity": DailyActivityModel,
+    "daily_sleep": DailySleepModel,
+    "daily_spo2": DailySpO2Model,
+    "daily_readiness": DailyReadinessModel,
+    "sleep": SleepModel,
+    "sleep_time": SleepTimeModel,
+    "rest_mode_period": RestModePeriodModel,
+    "ring_configuration": RingConfigurationModel,
+    "daily_stress": DailyStressModel,
+    "daily_resilience": DailyResilienceModel,
+    "daily_cardiovascular_age": DailyCardiovascularAgeModel,
+    "vO2_max": VO2MaxModel,
+}
+
+
+def decode_document(model: type[OuraModel], document: Any) -> OuraModel:
+    """Decode one raw document, raising OuraModelError if it is malformed."""
+    if isinstance(document, model):
+        return document
+    if not isinstance(document, Mapping):
+        raise OuraModelError(f"{model.__name__}: expected object, got {type(document).__name__}")
+    return model.from_dict(document)
+
+
+def decode_documents(model: type[OuraModel], documents: list[Any]) -> list[OuraModel]:
+    """Decode a page of documents, dropping (and logging) malformed ones."""
+    decoded = []
+    for document in documents:
+        try:
+            decoded.append(decode_document(model, document))
+        except OuraModelError as err:
+            _LOGGER.warning("Skipping malformed %s document: %s", model.__name__, err)
+    return decoded
@@ -0,0 +1,118 @@
+"""Adaptive polling for data that arrives after the morning ring sync.
+
+Daily sleep, readiness and the other daily documents only appear once the ring
+syncs after the user wakes up. Polling them at a flat interval wastes requests
+through the night and the rest of the day, while the data still shows up late
+in the morning. The wake schedule learns the usual wake-up time from past
+`bedtime_end` values, polls every tick from shortly before the expected wake-up
+until today's documents arrive, and backs off sharply otherwise.
+"""
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from datetime import datetime, timedelta
+import statistics
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    ADAPTIVE_IDLE_INTERVAL,
+    ADAPTIVE_MIN_WAKE_SAMPLES,
+    ADAPTIVE_WAKE_HISTORY,
+    ADAPTIVE_WAKE_LEAD,
+    ADAPTIVE_WAKE_WINDOW,
+)
+
+MINUTES_PER_DAY = 24 * 60
+
+
+class OuraWakeSchedule:
+    """Learns the usual wake-up time and picks the next poll of daily endpoints."""
+
+    def __init__(self, wake_times: Mapping[str, int] | None = None) -> None:
+        """Initialize the schedule.
+
+        Args:
+            wake_times: Previously learned wake-up times, as local minutes after
+                midnight keyed by the day of the sleep
+        """
+        self._wake_times: dict[str, int] = {}
+        self._add(wake_times or {})
+
+    @property
+    def wake_times(self) -> dict[str, int]:
+        """Return the learned wake-up times to persist."""
+        return dict(self._wake_times)
+
+    def learn(self, sleep_documents: Iterable[Mapping[str, Any]]) -> bool:
+        """Learn wake-up times from detailed sleep documents.
+
+        Only the main sleep of each day counts; naps and rest periods are ignored.
+        Returns whether anything changed.
+        """
+        learned = {}
+        for document in sleep_documents:
+            if document.get("type") not in (None, "long_sleep"):
+                continue
+            day = document.get("day")
+            bedtime_end = dt_util.parse_datetime(document.get("bedtime_end") or "")
+            if day and bedtime_end is not None:
+                learned[day] = bedtime_end.hour * 60 + bedtime_end.minute
+        before = self._wake_times
+        self._add(learned)
+        return self._wake_times != before
+
+    def _add(self, wake_times: Mapping[str, int]) -> None:
+        """Merge wake-up times, keeping only the most recent days."""
+        merged = {**self._wake_times, **wake_times}
+        self._wake_times = dict(sorted(merged.items())[-ADAPTIVE_WAKE_HISTORY:])
+
+    def expected_wake(self, now: datetime) -> datetime | None:
+        """Return today's expected wake-up time, or None until enough nights are known."""
+        if len(self._wake_times) < ADAPTIVE_MIN_WAKE_SAMPLES:
+            return None
+        minutes = _circular_median(self._wake_times.values())
+        local_now = dt_util.as_local(now)
+        midnight = local_now.replace(hour=0, minute=0, second=0, microsecond=0)
+        return midnight + timedelta(minutes=minutes)
+
+    def next_poll(self, now: datetime, interval: timedelta, has_today: bool) -> datetime:
+        """Return when a daily endpoint should be polled next.
+
+        Args:
+            now: Time of the poll that just succeeded
+            interval: The endpoint's regular interval, used until wake times are known
+            has_today: Whether today's documents have already arrived
+        """
+        if (wake := self.expected_wake(now)) is None:
+            return now + interval
+
+        window_start = wake - ADAPTIVE_WAKE_LEAD
+        window_end = wake + ADAPTIVE_WAKE_WINDOW
+
+        if has_today:
+            # Today's data is in; nothing new until tomorrow's sync
+            return min(now + ADAPTIVE_IDLE_INTERVAL, window_start + timedelta(days=1))
+        if now < window_start:
+            # Still asleep; wake up for the window
+            return min(now + ADAPTIVE_IDLE_INTERVAL, window_start)
+        if now < window_end:
+            # Poll on every coordinator tick until the morning sync shows up
+            return now
+        # Later than usual; keep checking at the regular interval
+        return now + interval
+
+
+def _circular_median(minutes: Iterable[int]) -> int:
+    """Return the median time of day, treating times around midnight as adjacent."""
+    values = sorted(minutes)
+    # Rotate the day so it starts at the widest gap between wake-up times
+    gaps = [
+        ((values[(index + 1) % len(values)] - value) % MINUTES_PER_DAY, index)
+        for index, value in enumerate(values)
+    ]
+    _, widest = max(gaps)
+    offset = values[(widest + 1) % len(values)]
+    rotated = [(value - offset) % MINUTES_PER_DAY for value in values]
+    return (int(statistics.median(rotated)) + offset) % MINUTES_PER_DAY
@@ -10,7 +10,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import ATTRIBUTION, DOMAIN, SENSOR_TYPES
-from .coordinator import OuraDataUpdateCoordinator
+from .coordinator import OuraCategoryCoordinator, OuraDataUpdateCoordinator
 
 
 async def async_setup_entry(
@@ -21,15 +21,16 @@ async def async_setup_entry(
     """Set up Oura Ring sensors."""
     coordinator: OuraDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
 
+    # Each sensor follows its data category, so it is only written when its data changes
     entities = [
-        OuraSensor(coordinator, sensor_type, sensor_info)
+        OuraSensor(coordinator.async_category(sensor_info["data_category"]), sensor_type, sensor_info)
         for sensor_type, sensor_info in SENSOR_TYPES.items()
     ]
 
     async_add_entities(entities)
 
 
-class OuraSensor(CoordinatorEntity[OuraDataUpdateCoordinator], SensorEntity):
+class OuraSensor(CoordinatorEntity[OuraCategoryCoordinator], SensorEntity):
     """Representation of an Oura Ring sensor."""
 
     _attr_attribution = ATTRIBUTION
@@ -37,12 +38,13 @@ class OuraSensor(CoordinatorEntity[OuraDataUpdateCoordinator], SensorEntity):
 
     def __init__(
         self,
-        coordinator: OuraDataUpdateCoordinator,
+        coordinator: OuraCategoryCoordinator,
         sensor_type: str,
         sensor_info: dict,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
+        # The sensor key as context: the coordinator only notifies us when it changed
+        super().__init__(coordinator, context=sensor_type)
         self._sensor_type = sensor_type
         self._attr_name = sensor_info['name']
         self._attr_unique_id = f"{coordinator.entry.entry_id}_{sensor_type}"
@@ -88,45 +90,40 @@ class OuraSensor(CoordinatorEntity[OuraDataUpdateCoordinator], SensorEntity):
 
         # Include workout-specific attributes for last_workout_* sensors
         if self._sensor_type.startswith("last_workout_") and self.coordinator.data:
-            if workout_raw := self.coordinator.data.get("_last_workout_raw"):
+            if workout := self.coordinator.data.get("_last_workout"):
                 # Add useful workout metadata
-                if source := workout_raw.get("source"):
-                    attrs["source"] = source
-                if label := workout_raw.get("label"):
-                    attrs["label"] = label
-                if start_time := workout_raw.get("start_datetime"):
-                    attrs["start_time"] = start_time
-                if end_time := workout_raw.get("end_datetime"):
-                    attrs["end_time"] = end_time
-                if day := workout_raw.get("day"):
-                    attrs["day"] = day
+                if workout.source:
+                    attrs["source"] = workout.source
+                if workout.label:
+                    attrs["label"] = workout.label
+                if workout.start_datetime:
+                    attrs["start_time"] = workout.start_datetime
+                if workout.end_datetime:
+                    attrs["end_time"] = workout.end_datetime
+                if workout.day:
+                    attrs["day"] = workout.day
 
         # Include tag-specific attributes with enhanced tag metadata
         if self._sensor_type == "tags_today" and self.coordinator.data:
             # Expose tags as a list in attributes for programmatic access
             if tags_list := self.coordinator.data.get("_tags_today_list"):
-                attrs["tags_list"] = tags_list
+                attrs["tags_list"] = list(tags_list)
 
-            if latest_tag := self.coordinator.data.get("_latest_tag_entry"):
-                if timestamp := latest_tag.get("timestamp"):
-                    attrs["latest_timestamp"] = timestamp
-                if text := latest_tag.get("text"):
-                    attrs["latest_text"] = text
+            if latest_tag := self.coordinator.data.get("_latest_tag"):
+                if latest_tag.timestamp:
+                    attrs["latest_timestamp"] = latest_tag.timestamp
+                if latest_tag.text:
+                    attrs["latest_text"] = latest_tag.text
 
             # Add enhanced tag metadata (tag_type_code, start_time, end_time, comment)
             if enhanced_tags := self.coordinator.data.get("_enhanced_tags_today"):
-                attrs["enhanced_tags"] = enhanced_tags
+                attrs["enhanced_tags"] = [tag.as_dict() for tag in enhanced_tags]
                 attrs["enhanced_tag_count"] = len(enhanced_tags)
 
         # Include rest mode-specific attributes
         if self._sensor_type in ("rest_mode_start", "rest_mode_end") and self.coordinator.data:
-            if rest_mode_raw := self.coordinator.data.get("_active_rest_mode_raw"):
-                if rest_mode_id := rest_mode_raw.get("id"):
-                    attrs["id"] = rest_mode_id
-                if start_day := rest_mode_raw.get("start_day"):
-                    attrs["start_day"] = start_day
-                if end_day := rest_mode_raw.get("end_day"):
-                    attrs["end_day"] = end_day
+            if rest_mode := self.coordinator.data.get("_active_rest_mode"):
+                attrs.update(rest_mode.as_dict())
 
         return attrs if attrs else None
 
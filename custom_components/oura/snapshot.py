@@ -0,0 +1,232 @@
+"""Compact, immutable snapshot of the processed sensor data.
+
+The processing step used to hand entities a free-form dict that also held whole
+raw documents (the latest workout, tag and rest mode period) just to read a few
+attributes from them. The snapshot instead stores one tuple of values per data
+category, laid out by SENSOR_TYPES, and keeps small projections of only the
+document fields entities show. It is a read-only Mapping, so entities keep
+using `data.get(key)`, and two snapshots (or one category of them) compare by
+their value tuples, which is what change detection needs.
+"""
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass, fields
+from typing import Any
+
+from .const import SENSOR_TYPES
+
+# Data keys read for entity attributes, per data category (on top of its sensors' own keys).
+# Only keys an entity exposes belong here: a change to any of them rewrites every
+# entity of the category.
+CATEGORY_ATTRIBUTE_KEYS = {
+    "workout": ("_last_workout",),
+    "tag": ("_tags_today_list", "_latest_tag", "_enhanced_tags_today"),
+    "rest_mode": ("rest_mode_active", "_active_rest_mode"),
+}
+# Read by every sensor's data_date attribute
+SHARED_DATA_KEYS = ("_data_date",)
+SHARED_SECTION = "_shared"
+
+
+class _Missing:
+    """Marks a key the processing step did not set (distinct from a None value)."""
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "<missing>"
+
+    def __reduce__(self) -> str:
+        # Copies and pickles refer to the module singleton
+        return "MISSING"
+
+
+MISSING: Any = _Missing()
+
+
+def _build_layout() -> dict[str, tuple[str, ...]]:
+    """Group the data keys into one section per data category."""
+    layout: dict[str, list[str]] = {SHARED_SECTION: list(SHARED_DATA_KEYS)}
+    for key, info in SENSOR_TYPES.items():
+        layout.setdefault(info["data_category"], []).append(key)
+    for category, keys in CATEGORY_ATTRIBUTE_KEYS.items():
+        layout.setdefault(category, []).extend(keys)
+    return {category: tuple(keys) for category, keys in layout.items()}
+
+
+SNAPSHOT_LAYOUT = _build_layout()
+_SECTIONS = {category: index for index, category in enumerate(SNAPSHOT_LAYOUT)}
+# Data key -> (section index, position in the section)
+_POSITIONS = {
+    key: (index, position)
+    for index, keys in enumerate(SNAPSHOT_LAYOUT.values())
+    for position, key in enumerate(keys)
+}
+
+
+def category_keys(category: str) -> tuple[str, ...]:
+    """Return the data keys the entities of a data category read.
+
+    The order matches OuraSnapshot.category_values.
+    """
+    return SNAPSHOT_LAYOUT.get(category, ()) + SNAPSHOT_LAYOUT[SHARED_SECTION]
+
+
+class OuraSnapshot(Mapping[str, Any]):
+    """Processed sensor data for one coordinator update."""
+
+    __slots__ = ("_sections",)
+
+    _sections: tuple[tuple[Any, ...], ...]
+
+    def __init__(self, sections: tuple[tuple[Any, ...], ...]) -> None:
+        """Initialize from value tuples laid out by SNAPSHOT_LAYOUT; use from_dict instead."""
+        object.__setattr__(self, "_sections", sections)
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> OuraSnapshot:
+        """Build a snapshot from processed sensor values.
+
+        Raises:
+            KeyError: If a key is not part of the layout
+        """
+        if isinstance(data, OuraSnapshot):
+            return data
+        sections = [[MISSING] * len(keys) for keys in SNAPSHOT_LAYOUT.values()]
+        for key, value in data.items():
+            if (position := _POSITIONS.get(key)) is None:
+                raise KeyError(f"Unknown Oura data key: {key}")
+            sections[position[0]][position[1]] = value
+        return cls(tuple(tuple(section) for section in sections))
+
+    def section(self, category: str) -> tuple[Any, ...]:
+        """Return the values of one data category, MISSING where unset."""
+        if (index := _SECTIONS.get(category)) is None:
+            return ()
+        return self._sections[index]
+
+    def category_values(self, category: str) -> tuple[Any, ...]:
+        """Return the values a data category's entities read, ordered as category_keys."""
+        return self.section(category) + self._sections[0]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the set values as a plain dict (used when serializing)."""
+        return dict(self.items())
+
+    def __getitem__(self, key: str) -> Any:
+        """Return a value by its data key."""
+        if (position := _POSITIONS.get(key)) is None:
+            raise KeyError(key)
+        if (value := self._sections[position[0]][position[1]]) is MISSING:
+            raise KeyError(key)
+        return value
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return a value by its data key, or default if it is not set."""
+        if (position := _POSITIONS.get(key)) is None:
+            return default
+        if (value := self._sections[position[0]][position[1]]) is MISSING:
+            return default
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        """Return whether a data key is set."""
+        return self.get(key, MISSING) is not MISSING  # type: ignore[arg-type]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the data keys that are set."""
+        for keys, values in zip(SNAPSHOT_LAYOUT.values(), self._sections):
+            for key, value in zip(keys, values):
+                if value is not MISSING:
+                    yield key
+
+    def __len__(self) -> int:
+        """Return the number of data keys that are set."""
+        return sum(
+            1 for values in self._sections for value in values if value is not MISSING
+        )
+
+    def __eq__(self, other: object) -> bool:
+        """Compare value tuples with another snapshot, or items with a mapping."""
+        if isinstance(other, OuraSnapshot):
+            return self._sections == other._sections
+        return Mapping.__eq__(self, other)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Reject changes; build a new snapshot instead."""
+        raise AttributeError("OuraSnapshot is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        """Reject changes; build a new snapshot instead."""
+        raise AttributeError("OuraSnapshot is immutable")
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Support copying and pickling despite the immutability guard."""
+        return (type(self), (self._sections,))
+
+    def __repr__(self) -> str:
+        """Return the set values."""
+        return f"OuraSnapshot({self.as_dict()!r})"
+
+
+class OuraProjection:
+    """Base class for the document fields kept for entity attributes."""
+
+    __slots__ = ()
+
+    @classmethod
+    def from_document(cls, document: Mapping[str, Any]) -> OuraProjection:
+        """Keep the projected fields of a raw or decoded document."""
+        return cls(*(document.get(field.name) for field in fields(cls)))  # type: ignore[arg-type]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the set fields (used for attributes and serializing)."""
+        return {
+            field.name: value
+            for field in fields(self)  # type: ignore[arg-type]
+            if (value := getattr(self, field.name)) is not None
+        }
+
+
+@dataclass(slots=True, frozen=True)
+class WorkoutSummary(OuraProjection):
+    """Attributes of the latest workout."""
+
+    source: str | None = None
+    label: str | None = None
+    start_datetime: str | None = None
+    end_datetime: str | None = None
+    day: str | None = None
+
+
+@dataclass(slots=True, frozen=True)
+class TagSummary(OuraProjection):
+    """Attributes of the latest tag."""
+
+    timestamp: str | None = None
+    text: str | None = None
+
+
+@dataclass(slots=True, frozen=True)
+class EnhancedTagSummary(OuraProjection):
+    """Attributes of an enhanced tag logged today."""
+
+    tag_type_code: str | None = None
+    start_time: str | None = None
+    end_time: str | None = None
+    start_day: str | None = None
+    end_day: str | None = None
+    comment: str | None = None
+    custom_name: str | None = None
+
+
+@dataclass(slots=True, frozen=True)
+class RestModeSummary(OuraProjection):
+    """Attributes of the active rest mode period."""
+
+    id: str | None = None
+    start_day: str | None = None
+    end_day: str | None = None
@@ -5,6 +5,7 @@ as Home Assistant long-term statistics, significantly reducing code duplication.
 """
 from __future__ import annotations
 
+from collections.abc import Mapping
 from datetime import datetime, timezone
 import logging
 from typing import Any, Callable
@@ -28,6 +29,7 @@ from homeassistant.const import (
 )
 
 from .const import DOMAIN, METERS_PER_MILE
+from .extraction import STATISTICS_PLANS, ExtractionPlan
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -121,125 +123,31 @@ STATISTICS_METADATA = {
     "daily_rest_mode_count": {"name": "Daily Rest Mode Periods", "unit": None, "has_mean": False, "has_sum": True},
 }
 
-# Configuration mapping API data sources to sensor mappings
+# Configuration mapping API data sources to their statistics. Daily sources run
+# the extraction plan shared with the sensor states; the rest aggregate per day.
+# Heart rate is streamed into a DailyHeartRateAggregator instead (see
+# async_import_heartrate_statistics).
 DATA_SOURCE_CONFIG = {
-    "sleep": {
-        "mappings": [
-            {"sensor_key": "sleep_score", "api_path": "score"},
-            # Note: sleep_efficiency moved to sleep_detail (actual %, not contributor score)
-            {"sensor_key": "restfulness", "api_path": "contributors.restfulness"},
-            {"sensor_key": "sleep_timing", "api_path": "contributors.timing"},
-        ],
-    },
-    "sleep_detail": {
-        "mappings": [
-            {"sensor_key": "sleep_efficiency", "api_path": "efficiency"},  # Actual sleep efficiency %
-            {"sensor_key": "total_sleep_duration", "api_path": "total_sleep_duration", "transform": "seconds_to_hours"},
-            {"sensor_key": "deep_sleep_duration", "api_path": "deep_sleep_duration", "transform": "seconds_to_hours"},
-            {"sensor_key": "rem_sleep_duration", "api_path": "rem_sleep_duration", "transform": "seconds_to_hours"},
-            {"sensor_key": "light_sleep_duration", "api_path": "light_sleep_duration", "transform": "seconds_to_hours"},
-            {"sensor_key": "awake_time", "api_path": "awake_time", "transform": "seconds_to_hours"},
-            {"sensor_key": "sleep_latency", "api_path": "latency", "transform": "seconds_to_minutes"},
-            {"sensor_key": "time_in_bed", "api_path": "time_in_bed", "transform": "seconds_to_hours"},
-            {"sensor_key": "average_sleep_hrv", "api_path": "average_hrv"},
-            {"sensor_key": "lowest_sleep_heart_rate", "api_path": "lowest_heart_rate"},
-            {"sensor_key": "average_sleep_heart_rate", "api_path": "average_heart_rate"},
-            {"sensor_key": "bedtime_start", "api_path": "bedtime_start", "transform": "iso_to_datetime"},
-            {"sensor_key": "bedtime_end", "api_path": "bedtime_end", "transform": "iso_to_datetime"},
-        ],
-        "computed": [
-            {
-                "sensor_key": "deep_sleep_percentage",
-                "compute": lambda entry: _compute_percentage(entry, "deep_sleep_duration", "total_sleep_duration"),
-            },
-            {
-                "sensor_key": "rem_sleep_percentage",
-                "compute": lambda entry: _compute_percentage(entry, "rem_sleep_duration", "total_sleep_duration"),
-            },
-        ],
-    },
-    "readiness": {
-        "mappings": [
-            {"sensor_key": "readiness_score", "api_path": "score"},
-            {"sensor_key": "temperature_deviation", "api_path": "temperature_deviation"},
-            {"sensor_key": "resting_heart_rate", "api_path": "contributors.resting_heart_rate"},
-            {"sensor_key": "hrv_balance", "api_path": "contributors.hrv_balance"},
-            {"sensor_key": "sleep_regularity", "api_path": "contributors.sleep_regularity"},
-        ],
-    },
-    "activity": {
-        "mappings": [
-            {"sensor_key": "activity_score", "api_path": "score"},
-            {"sensor_key": "steps", "api_path": "steps"},
-            {"sensor_key": "active_calories", "api_path": "active_calories"},
-            {"sensor_key": "total_calories", "api_path": "total_calories"},
-            {"sensor_key": "target_calories", "api_path": "target_calories"},
-            {"sensor_key": "met_min_high", "api_path": "high_activity_met_minutes"},
-            {"sensor_key": "met_min_medium", "api_path": "medium_activity_met_minutes"},
-            {"sensor_key": "met_min_low", "api_path": "low_activity_met_minutes"},
-        ],
-    },
-    "heartrate": {
-        "custom_processor": "heartrate",
-    },
-    "stress": {
-        "mappings": [
-            {"sensor_key": "stress_high_duration", "api_path": "stress_high", "transform": "seconds_to_minutes"},
-            {"sensor_key": "recovery_high_duration", "api_path": "recovery_high", "transform": "seconds_to_minutes"},
-            {"sensor_key": "stress_day_summary", "api_path": "day_summary"},
-        ],
-    },
-    "resilience": {
-        "mappings": [
-            {"sensor_key": "resilience_level", "api_path": "level"},
-            {"sensor_key": "sleep_recovery_score", "api_path": "contributors.sleep_recovery"},
-            {"sensor_key": "daytime_recovery_score", "api_path": "contributors.daytime_recovery"},
-            {"sensor_key": "stress_resilience_score", "api_path": "contributors.stress"},
-        ],
-    },
-    "spo2": {
-        "mappings": [
-            {"sensor_key": "spo2_average", "api_path": "spo2_percentage.average"},
-            {"sensor_key": "breathing_disturbance_index", "api_path": "breathing_disturbance_index"},
-        ],
-    },
-    "vo2_max": {
-        "mappings": [
-            {"sensor_key": "vo2_max", "api_path": "vo2_max"},
-        ],
-    },
-    "cardiovascular_age": {
-        "mappings": [
-            {"sensor_key": "cardiovascular_age", "api_path": "vascular_age"},
-        ],
-    },
-    "sleep_time": {
-        "mappings": [
-            {"sensor_key": "optimal_bedtime_start", "api_path": "optimal_bedtime_start"},
-            {"sensor_key": "optimal_bedtime_end", "api_path": "optimal_bedtime_end"},
-        ],
-    },
-    "workout": {
-        "custom_processor": "workout",
-    },
-    "session": {
-        "custom_processor": "session",
-    },
-    "tag": {
-        "custom_processor": "tag",
-    },
-    "enhanced_tag": {
-        "custom_processor": "enhanced_tag",
-    },
-    "rest_mode": {
-        "custom_processor": "rest_mode",
-    },
+    "sleep": {"plan": STATISTICS_PLANS["sleep"]},
+    "sleep_detail": {"plan": STATISTICS_PLANS["sleep_detail"]},
+    "readiness": {"plan": STATISTICS_PLANS["readiness"]},
+    "activity": {"plan": STATISTICS_PLANS["activity"]},
+    "stress": {"plan": STATISTICS_PLANS["stress"]},
+    "resilience": {"plan": STATISTICS_PLANS["resilience"]},
+    "spo2": {"plan": STATISTICS_PLANS["spo2"]},
+    "vo2_max": {"plan": STATISTICS_PLANS["vo2_max"]},
+    "cardiovascular_age": {"plan": STATISTICS_PLANS["cardiovascular_age"]},
+    "sleep_time": {"plan": STATISTICS_PLANS["sleep_time"]},
+    "workout": {"custom_processor": "workout"},
+    "session": {"custom_processor": "session"},
+    "tag": {"custom_processor": "tag"},
+    "enhanced_tag": {"custom_processor": "enhanced_tag"},
+    "rest_mode": {"custom_processor": "rest_mode"},
 }
 
 # Custom processor registry - maps processor names to functions
 # This avoids fragile globals() lookups
 CUSTOM_PROCESSORS = {
-    "heartrate": None,  # Will be set after function definition
     "workout": None,    # Will be set after function definition
     "session": None,    # Will be set after function definition
     "tag": None,        # Will be set after function definition
@@ -248,59 +156,57 @@ CUSTOM_PROCESSORS = {
 }
 
 
-async def async_import_statistics(
+async def async_import_source_statistics(
     hass: HomeAssistant,
-    data: dict[str, Any],
+    source_key: str,
+    source_data: list[dict[str, Any]],
     entry: ConfigEntry,
-) -> None:
-    """Import historical Oura data as long-term statistics.
+) -> int:
+    """Import statistics for a single data source.
+
+    Lets callers stream a backfill one endpoint at a time instead of
+    building the full multi-endpoint payload first.
 
     Args:
         hass: Home Assistant instance
-        data: Historical data from Oura API
+        source_key: Data key from DATA_SOURCE_CONFIG (e.g. "sleep")
+        source_data: Documents returned by the Oura API for that source
         entry: Config entry for unique ID generation
-    """
-    _LOGGER.info("Starting statistics import from historical data")
-
-    total_stats = 0
-
-    # Process each configured data source
-    for source_key, config in DATA_SOURCE_CONFIG.items():
-        source_data = data.get(source_key, {}).get("data")
-        if not source_data:
-            continue
-
-        # Check if custom processor is specified
-        if custom_processor := config.get("custom_processor"):
-            processor_func = CUSTOM_PROCESSORS.get(custom_processor)
-            if processor_func:
-                stats_count = await processor_func(hass, source_data, entry)
-                total_stats += stats_count
-                _LOGGER.debug("Imported %d %s statistics", stats_count, source_key)
-            else:
-                _LOGGER.error("Custom processor '%s' not found in registry", custom_processor)
-            continue
 
+    Returns:
+        Number of statistics imported
+    """
+    config = DATA_SOURCE_CONFIG.get(source_key)
+    if not config or not source_data:
+        return 0
+
+    # Check if custom processor is specified
+    if custom_processor := config.get("custom_processor"):
+        processor_func = CUSTOM_PROCESSORS.get(custom_processor)
+        if not processor_func:
+            _LOGGER.error("Custom processor '%s' not found in registry", custom_processor)
+            return 0
+        stats_count = await processor_func(hass, source_data, entry)
+    else:
         # Use generic processor
-        stats_count = await _process_generic_statistics(hass, source_data, config, entry)
-        total_stats += stats_count
-        _LOGGER.debug("Imported %d %s statistics", stats_count, source_key)
+        stats_count = await _process_generic_statistics(hass, source_data, config["plan"], entry)
 
-    _LOGGER.info("Successfully imported %d total statistics data points", total_stats)
+    _LOGGER.debug("Imported %d %s statistics", stats_count, source_key)
+    return stats_count
 
 
 async def _process_generic_statistics(
     hass: HomeAssistant,
     data_list: list[dict[str, Any]],
-    config: dict[str, Any],
+    plan: ExtractionPlan,
     entry: ConfigEntry,
 ) -> int:
-    """Process data using generic configuration-driven approach.
+    """Process data using the compiled extraction plan of its source.
 
     Args:
         hass: Home Assistant instance
         data_list: List of data entries from API
-        config: Configuration with mappings and computed fields
+        plan: Compiled field accessors shared with the sensor states
         entry: Config entry for unique ID generation
 
     Returns:
@@ -309,12 +215,9 @@ async def _process_generic_statistics(
     stats_count = 0
 
     # Initialize data collectors for each sensor
-    sensor_data: dict[str, list[dict[str, Any]]] = {}
-    for mapping in config.get("mappings", []):
-        sensor_data[mapping["sensor_key"]] = []
-
-    for computed in config.get("computed", []):
-        sensor_data[computed["sensor_key"]] = []
+    sensor_data: dict[str, list[dict[str, Any]]] = {
+        sensor_key: [] for sensor_key in plan.sensor_keys
+    }
 
     # Process each data entry
     for entry_data in data_list:
@@ -322,24 +225,9 @@ async def _process_generic_statistics(
         if not timestamp:
             continue
 
-        # Process direct mappings
-        for mapping in config.get("mappings", []):
-            value = _get_nested_value(entry_data, mapping["api_path"])
-            if value is not None:
-                # Apply transformation if specified
-                if transform := mapping.get("transform"):
-                    value = _apply_transformation(value, transform)
-
-                sensor_data[mapping["sensor_key"]].append({
-                    "timestamp": timestamp,
-                    "value": value,
-                })
-
-        # Process computed fields
-        for computed in config.get("computed", []):
-            value = computed["compute"](entry_data)
-            if value is not None:
-                sensor_data[computed["sensor_key"]].append({
+        for sensor_key, accessor in plan.fields:
+            if (value := accessor(entry_data)) is not None:
+                sensor_data[sensor_key].append({
                     "timestamp": timestamp,
                     "value": value,
                 })
@@ -353,58 +241,80 @@ async def _process_generic_statistics(
     return stats_count
 
 
-async def _process_heartrate_statistics(
+class DailyHeartRateAggregator:
+    """Running per-day heart rate statistics.
+
+    Samples are folded into count/sum/min/max as they arrive, so a multi-year
+    backfill can be streamed without keeping individual readings around.
+    """
+
+    __slots__ = ("_days",)
+
+    def __init__(self) -> None:
+        """Initialize an empty aggregator."""
+        # day -> [count, total, min, max]
+        self._days: dict[str, list[int]] = {}
+
+    def add(self, sample: Mapping[str, Any]) -> None:
+        """Fold one heart rate sample into its day."""
+        if not (bpm := sample.get("bpm")):
+            return
+        if not (timestamp_str := sample.get("timestamp", "")):
+            return
+
+        day = timestamp_str.split("T")[0]
+        if (stats := self._days.get(day)) is None:
+            self._days[day] = [1, bpm, bpm, bpm]
+            return
+        stats[0] += 1
+        stats[1] += bpm
+        if bpm < stats[2]:
+            stats[2] = bpm
+        elif bpm > stats[3]:
+            stats[3] = bpm
+
+    def __len__(self) -> int:
+        """Return the number of days seen."""
+        return len(self._days)
+
+    def sensor_data(self) -> dict[str, list[dict[str, Any]]]:
+        """Return the daily average/min/max data points per statistic."""
+        sensor_data: dict[str, list[dict[str, Any]]] = {
+            "average_heart_rate": [],
+            "min_heart_rate": [],
+            "max_heart_rate": [],
+        }
+
+        for day, (count, total, minimum, maximum) in self._days.items():
+            timestamp = _parse_date_to_timestamp(day)
+            if not timestamp:
+                continue
+
+            sensor_data["average_heart_rate"].append({"timestamp": timestamp, "value": total / count})
+            sensor_data["min_heart_rate"].append({"timestamp": timestamp, "value": minimum})
+            sensor_data["max_heart_rate"].append({"timestamp": timestamp, "value": maximum})
+
+        return sensor_data
+
+
+async def async_import_heartrate_statistics(
     hass: HomeAssistant,
-    heartrate_data: list[dict[str, Any]],
+    aggregator: DailyHeartRateAggregator,
     entry: ConfigEntry,
 ) -> int:
-    """Process heart rate data with special daily aggregation logic.
+    """Import daily heart rate statistics from an aggregator filled while streaming.
+
+    Args:
+        hass: Home Assistant instance
+        aggregator: Per-day heart rate aggregates
+        entry: Config entry for unique ID generation
 
-    Heart rate data comes as individual readings throughout the day,
-    so we need to aggregate them into daily statistics.
+    Returns:
+        Number of statistics imported
     """
     stats_count = 0
 
-    # Group heart rate readings by day
-    daily_readings: dict[str, list[int]] = {}
-
-    for data_entry in heartrate_data:
-        if bpm := data_entry.get("bpm"):
-            # Extract date from timestamp
-            timestamp_str = data_entry.get("timestamp", "")
-            if timestamp_str:
-                day = timestamp_str.split("T")[0]
-                if day not in daily_readings:
-                    daily_readings[day] = []
-                daily_readings[day].append(bpm)
-
-    # Calculate daily statistics
-    sensor_data = {
-        "average_heart_rate": [],
-        "min_heart_rate": [],
-        "max_heart_rate": [],
-    }
-
-    for day, readings in daily_readings.items():
-        timestamp = _parse_date_to_timestamp(day)
-        if not timestamp or not readings:
-            continue
-
-        sensor_data["average_heart_rate"].append({
-            "timestamp": timestamp,
-            "value": sum(readings) / len(readings),
-        })
-        sensor_data["min_heart_rate"].append({
-            "timestamp": timestamp,
-            "value": min(readings),
-        })
-        sensor_data["max_heart_rate"].append({
-            "timestamp": timestamp,
-            "value": max(readings),
-        })
-
-    # Import statistics
-    for sensor_key, data_points in sensor_data.items():
+    for sensor_key, data_points in aggregator.sensor_data().items():
         if data_points:
             await _create_statistic(hass, sensor_key, data_points, entry)
             stats_count += len(data_points)
@@ -730,10 +640,6 @@ CUSTOM_PROCESSORS["enhanced_tag"] = _process_enhanced_tag_statistics
 CUSTOM_PROCESSORS["rest_mode"] = _process_rest_mode_statistics
 
 
-# Register heartrate processor
-CUSTOM_PROCESSORS["heartrate"] = _process_heartrate_statistics
-
-
 async def _create_statistic(
     hass: HomeAssistant,
     sensor_key: str,
@@ -818,80 +724,6 @@ async def _create_statistic(
     )
 
 
-def _get_nested_value(data: dict[str, Any], path: str) -> Any:
-    """Get a value from nested dictionary using dot notation.
-
-    Args:
-        data: Dictionary to extract from
-        path: Dot-separated path (e.g., "contributors.efficiency")
-
-    Returns:
-        Value at path, or None if not found
-    """
-    keys = path.split(".")
-    value = data
-
-    for key in keys:
-        if isinstance(value, dict):
-            value = value.get(key)
-            if value is None:
-                return None
-        else:
-            return None
-
-    return value
-
-
-def _apply_transformation(value: Any, transform: str, **kwargs) -> Any:
-    """Apply a transformation to a value.
-
-    Args:
-        value: Value to transform
-        transform: Transformation name
-        **kwargs: Additional arguments for transformation
-
-    Returns:
-        Transformed value
-    """
-    if transform == "seconds_to_hours":
-        return value / 3600
-    elif transform == "seconds_to_minutes":
-        return value / 60
-    elif transform == "percentage":
-        total = kwargs.get("total", 100)
-        return (value / total) * 100 if total else 0
-    elif transform == "iso_to_datetime":
-        # Parse ISO datetime string to datetime object
-        if isinstance(value, str):
-            try:
-                return datetime.fromisoformat(value.replace('Z', '+00:00'))
-            except (ValueError, AttributeError):
-                return None
-        return value
-
-    return value
-
-
-def _compute_percentage(entry: dict[str, Any], numerator_key: str, denominator_key: str) -> float | None:
-    """Compute a percentage from two entry fields.
-
-    Args:
-        entry: Data entry
-        numerator_key: Key for numerator value
-        denominator_key: Key for denominator value
-
-    Returns:
-        Percentage value rounded to 1 decimal, or None if can't compute
-    """
-    numerator = entry.get(numerator_key)
-    denominator = entry.get(denominator_key)
-
-    if numerator is None or denominator is None or denominator == 0:
-        return None
-
-    return round((numerator / denominator) * 100, 1)
-
-
 def _parse_date_to_timestamp(date_str: str | None) -> datetime | None:
     """Parse ISO date string to datetime object.
 
@@ -0,0 +1,234 @@
+"""Webhook push ingestion for Oura Ring.
+
+Oura calls a Home Assistant webhook whenever a document is created, updated or
+deleted. Each notification only carries the document id, so the changed document
+is fetched on its own instead of re-polling the whole endpoint.
+"""
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime
+import hmac
+import json
+import logging
+import secrets
+from typing import Any
+
+from aiohttp import ClientError, web
+
+from homeassistant.components import webhook
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.network import NoURLAvailableError
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .api import OuraWebhookClient
+from .const import (
+    DOMAIN,
+    WEBHOOK_DATA_TYPES,
+    WEBHOOK_EVENT_TYPES,
+    WEBHOOK_RENEW_BEFORE,
+    WEBHOOK_RENEW_CHECK_INTERVAL,
+    WEBHOOK_STORAGE_KEY,
+    WEBHOOK_STORAGE_VERSION,
+)
+from .coordinator import OuraDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class OuraWebhookManager:
+    """Register the webhook and keep Oura subscriptions for it alive."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        coordinator: OuraDataUpdateCoordinator,
+        webhook_client: OuraWebhookClient,
+    ) -> None:
+        """Initialize the webhook manager.
+
+        Args:
+            hass: Home Assistant instance
+            entry: Config entry
+            coordinator: Coordinator that receives pushed documents
+            webhook_client: Client for the webhook subscription API
+        """
+        self.hass = hass
+        self.entry = entry
+        self.coordinator = coordinator
+        self.webhook_client = webhook_client
+        self.webhook_id: str | None = None
+        self.callback_url: str | None = None
+        self._verification_token: str | None = None
+        self._store: Store[dict[str, Any]] = Store(
+            hass, WEBHOOK_STORAGE_VERSION, WEBHOOK_STORAGE_KEY.format(entry_id=entry.entry_id)
+        )
+        self._unsub_renew = None
+
+    async def async_setup(self) -> bool:
+        """Register the webhook and start managing subscriptions.
+
+        Returns False when Home Assistant has no externally reachable URL, in
+        which case the integration keeps polling every endpoint.
+        """
+        stored = await self._store.async_load() or {}
+        self.webhook_id = stored.get("webhook_id") or webhook.async_generate_id()
+        self._verification_token = stored.get("verification_token") or secrets.token_urlsafe(32)
+        if stored.get("webhook_id") != self.webhook_id:
+            await self._store.async_save(
+                {"webhook_id": self.webhook_id, "verification_token": self._verification_token}
+            )
+
+        try:
+            self.callback_url = webhook.async_generate_url(
+                self.hass, self.webhook_id, allow_internal=False
+            )
+        except NoURLAvailableError:
+            _LOGGER.warning(
+                "Oura push mode needs an external Home Assistant URL; falling back to polling"
+            )
+            return False
+
+        webhook.async_register(
+            self.hass,
+            DOMAIN,
+            "Oura Ring",
+            self.webhook_id,
+            self._async_handle_webhook,
+            allowed_methods=["GET", "POST"],
+        )
+
+        # Oura calls the webhook to verify it while subscriptions are created,
+        # so subscribe in the background once the handler is in place
+        self.entry.async_create_background_task(
+            self.hass, self.async_sync_subscriptions(), name=f"{DOMAIN} webhook subscriptions"
+        )
+        self._unsub_renew = async_track_time_interval(
+            self.hass, self.async_sync_subscriptions, WEBHOOK_RENEW_CHECK_INTERVAL
+        )
+        return True
+
+    @callback
+    def async_unload(self) -> None:
+        """Stop renewing subscriptions and unregister the webhook.
+
+        Subscriptions are left in place and expire on their own if the entry
+        does not come back.
+        """
+        if self._unsub_renew:
+            self._unsub_renew()
+            self._unsub_renew = None
+        if self.webhook_id and self.callback_url:
+            webhook.async_unregister(self.hass, self.webhook_id)
+
+    async def async_sync_subscriptions(self, now: datetime | None = None) -> None:
+        """Create missing subscriptions and renew the ones about to expire."""
+        try:
+            existing = await self.webhook_client.async_list_subscriptions()
+        except (ClientError, asyncio.TimeoutError) as err:
+            _LOGGER.warning("Failed to list Oura webhook subscriptions: %s", err)
+            # Can't tell which subscriptions are still active; poll everything
+            self.coordinator.async_set_push_endpoints(set())
+            return
+
+        ours = {
+            (subscription.get("data_type"), subscription.get("event_type")): subscription
+            for subscription in existing
+            if subscription.get("callback_url") == self.callback_url
+        }
+        renew_before = dt_util.utcnow() + WEBHOOK_RENEW_BEFORE
+        subscribed: set[str] = set()
+
+        for data_type, endpoint in WEBHOOK_DATA_TYPES.items():
+            active = 0
+            for event_type in WEBHOOK_EVENT_TYPES:
+                subscription = ours.get((data_type, event_type))
+                try:
+                    if subscription is None:
+                        await self.webhook_client.async_create_subscription(
+                            self.callback_url, self._verification_token, event_type, data_type
+                        )
+                    elif _expires_before(subscription, renew_before):
+                        await self.webhook_client.async_renew_subscription(subscription["id"])
+                except (ClientError, asyncio.TimeoutError) as err:
+                    _LOGGER.warning(
+                        "Failed to subscribe to Oura %s %s events: %s", data_type, event_type, err
+                    )
+                    continue
+                active += 1
+
+            # Only stop regular polling once every event type is pushed
+            if active == len(WEBHOOK_EVENT_TYPES):
+                subscribed.add(endpoint)
+
+        self.coordinator.async_set_push_endpoints(subscribed)
+        _LOGGER.debug("Oura webhook subscriptions active for: %s", sorted(subscribed))
+
+    async def _async_handle_webhook(
+        self, hass: HomeAssistant, webhook_id: str, request: web.Request
+    ) -> web.Response:
+        """Answer verification challenges and accept signed change notifications."""
+        if request.method == "GET":
+            return self._verify_challenge(request)
+
+        body = await request.read()
+        if not self.webhook_client.verify_signature(
+            request.headers.get("x-oura-timestamp", ""),
+            body,
+            request.headers.get("x-oura-signature", ""),
+        ):
+            _LOGGER.warning("Rejected an Oura webhook notification with an invalid signature")
+            return web.Response(status=401)
+
+        try:
+            notification = json.loads(body)
+        except ValueError:
+            return web.Response(status=400)
+        if not isinstance(notification, dict):
+            return web.Response(status=400)
+
+        # Acknowledge right away; Oura retries notifications that time out
+        self.entry.async_create_background_task(
+            hass, self.async_handle_notification(notification), name=f"{DOMAIN} webhook"
+        )
+        return web.Response(status=200)
+
+    def _verify_challenge(self, request: web.Request) -> web.Response:
+        """Echo the challenge when the verification token matches ours."""
+        token = request.query.get("verification_token", "")
+        challenge = request.query.get("challenge")
+        if not challenge or not hmac.compare_digest(token, self._verification_token or ""):
+            return web.Response(status=401)
+        return web.json_response({"challenge": challenge})
+
+    async def async_handle_notification(self, notification: dict[str, Any]) -> None:
+        """Fetch the changed document and push it to the coordinator.
+
+        Deletes are confirmed the same way: the document is only dropped once
+        the API no longer returns it.
+        """
+        endpoint = WEBHOOK_DATA_TYPES.get(notification.get("data_type"))
+        document_id = notification.get("object_id")
+        if endpoint is None or not document_id:
+            _LOGGER.debug("Ignoring Oura webhook notification: %s", notification)
+            return
+
+        try:
+            await self.coordinator.async_refresh_document(endpoint, document_id)
+        except Exception as err:
+            # The next poll picks the change up instead
+            _LOGGER.warning("Failed to fetch pushed Oura %s document: %s", endpoint, err)
+
+
+def _expires_before(subscription: dict[str, Any], moment: datetime) -> bool:
+    """Return whether a subscription expires before the given moment."""
+    expiration = dt_util.parse_datetime(subscription.get("expiration_time") or "")
+    if expiration is None:
+        return True
+    if expiration.tzinfo is None:
+        expiration = expiration.replace(tzinfo=dt_util.UTC)
+    return expiration <= moment
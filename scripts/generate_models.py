@@ -0,0 +1,382 @@
+"""Generate custom_components/oura/models.py from the Oura OpenAPI spec.
+
+Every document model returned by a /v2/usercollection endpoint (and the models
+nested in it) becomes a slotted, frozen dataclass with a generated from_dict
+that validates field types. Run from the repository root after updating the
+spec:
+
+    python scripts/generate_models.py
+
+Pass --check to verify models.py is up to date without writing it (exits 1 if
+it is stale), or --output to write the module somewhere else.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+import re
+import sys
+from typing import Any
+
+ROOT = Path(__file__).resolve().parent.parent
+SPEC_PATH = ROOT / "docs" / "Oura API" / "openapi-1.28.json"
+OUTPUT_PATH = ROOT / "custom_components" / "oura" / "models.py"
+COLLECTION_PREFIX = "/v2/usercollection/"
+
+# JSON keys that would shadow Mapping methods get a trailing underscore as attribute
+RESERVED_ATTRIBUTES = {"get", "items", "keys", "values"}
+
+SCALAR_CHECKS = {
+    "string": ("_str", "str"),
+    "integer": ("_int", "int"),
+    "number": ("_float", "float"),
+    "boolean": ("_bool", "bool"),
+}
+
+# Collections whose documents stay plain dicts: heart rate pages hold thousands of
+# three-field samples that are only read by key, so decoding them costs several
+# times the JSON parse for no benefit
+RAW_COLLECTIONS = {"heartrate"}
+
+# Names used by the generated from_dict that a field's local variable must not shadow
+FROM_DICT_NAMES = {"cls", "data"}
+
+HEADER = '''"""Typed Oura API document models.
+
+Generated from docs/Oura API/{spec_name} by scripts/generate_models.py; do not
+edit by hand.
+
+Documents are decoded into slotted, frozen dataclasses at the API boundary:
+missing or null fields become None, while values of the wrong type raise
+OuraModelError. Enum values are kept as plain strings so new values from the API
+don't break decoding. Every model is also a read-only Mapping keyed by the JSON
+field names (null fields are treated as absent), so code written against the raw
+dicts keeps working while new code can use attribute access. Array fields are
+decoded into tuples, so a model compares equal to the equivalent dict only if
+the dict holds tuples too; decoding a model's fields again gives an equal model.
+"""
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator, Mapping
+from dataclasses import dataclass
+import logging
+from typing import Any, ClassVar
+
+_LOGGER = logging.getLogger(__name__)
+
+# JSON keys that would shadow Mapping methods get a trailing underscore as attribute
+RESERVED_ATTRIBUTES = frozenset({{{reserved}}})
+
+
+def attribute_name(key: str) -> str:
+    """Return the model attribute holding a JSON field."""
+    return f"{{key}}_" if key in RESERVED_ATTRIBUTES else key
+
+
+class OuraModelError(ValueError):
+    """Raised when a document does not match its schema."""
+
+
+class OuraModel(Mapping[str, Any]):
+    """Base class for decoded documents."""
+
+    __slots__ = ()
+
+    # JSON key -> attribute name, filled in by each generated model
+    _attributes: ClassVar[dict[str, str]] = {{}}
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> OuraModel:
+        """Decode and validate a raw document."""
+        raise NotImplementedError
+
+    def __getitem__(self, key: str) -> Any:
+        """Return a field by its JSON name."""
+        attribute = self._attributes.get(key)
+        if attribute is None or (value := getattr(self, attribute)) is None:
+            raise KeyError(key)
+        return value
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return a field by its JSON name, or default if it is missing or null."""
+        attribute = self._attributes.get(key)
+        if attribute is None or (value := getattr(self, attribute)) is None:
+            return default
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the JSON names of the fields that are set."""
+        return (
+            key
+            for key, attribute in self._attributes.items()
+            if getattr(self, attribute) is not None
+        )
+
+    def __len__(self) -> int:
+        """Return the number of fields that are set."""
+        return sum(1 for _ in self)
+
+
+def _fail(field: str, expected: str, value: Any) -> OuraModelError:
+    return OuraModelError(f"{{field}}: expected {{expected}}, got {{type(value).__name__}}")
+
+
+def _str(value: Any, field: str) -> str | None:
+    if value is None or isinstance(value, str):
+        return value
+    raise _fail(field, "string", value)
+
+
+def _int(value: Any, field: str) -> int | None:
+    if value is None or (isinstance(value, int) and not isinstance(value, bool)):
+        return value
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    raise _fail(field, "integer", value)
+
+
+def _float(value: Any, field: str) -> float | None:
+    if value is None or (isinstance(value, (int, float)) and not isinstance(value, bool)):
+        return value
+    raise _fail(field, "number", value)
+
+
+def _bool(value: Any, field: str) -> bool | None:
+    if value is None or isinstance(value, bool):
+        return value
+    raise _fail(field, "boolean", value)
+
+
+# Item check -> item classes it accepts unchanged, for the array fast path
+_ITEM_CLASSES: dict[Callable[[Any, str], Any], tuple[type, ...]] = {{
+    _str: (str, type(None)),
+    _int: (int, type(None)),
+    _float: (float, int, type(None)),
+    _bool: (bool, type(None)),
+}}
+
+
+def _array(
+    value: Any, field: str, item: Callable[[Any, str], Any]
+) -> tuple[Any, ...] | None:
+    if value is None:
+        return None
+    if not isinstance(value, (list, tuple)):
+        raise _fail(field, "array", value)
+    # Series such as hrv.items are checked in one pass; only mismatches go through item
+    if (classes := _ITEM_CLASSES.get(item)) and all(
+        element.__class__ in classes for element in value
+    ):
+        return tuple(value)
+    return tuple(item(element, field) for element in value)
+
+
+def _model(value: Any, field: str, model: type[OuraModel]) -> OuraModel | None:
+    if value is None or isinstance(value, model):
+        return value
+    if not isinstance(value, Mapping):
+        raise _fail(field, "object", value)
+    return model.from_dict(value)'''
+
+FOOTER = '''
+
+
+# Document model per collection path (the segment after API_BASE_URL); heart rate
+# samples are not listed and stay plain dicts
+PATH_MODELS: dict[str, type[OuraModel]] = {{
+{path_models}
+}}
+
+
+def decode_document(model: type[OuraModel], document: Any) -> OuraModel:
+    """Decode one raw document, raising OuraModelError if it is malformed."""
+    if isinstance(document, model):
+        return document
+    if not isinstance(document, Mapping):
+        raise OuraModelError(f"{{model.__name__}}: expected object, got {{type(document).__name__}}")
+    return model.from_dict(document)
+
+
+def decode_documents(model: type[OuraModel], documents: list[Any]) -> list[OuraModel]:
+    """Decode a page of documents, dropping (and logging) malformed ones."""
+    decoded = []
+    for document in documents:
+        try:
+            decoded.append(decode_document(model, document))
+        except OuraModelError as err:
+            _LOGGER.warning("Skipping malformed %s document: %s", model.__name__, err)
+    return decoded
+'''
+
+
+def _attribute(key: str) -> str:
+    return f"{key}_" if key in RESERVED_ATTRIBUTES else key
+
+
+class Generator:
+    """Collects the models reachable from the collection endpoints."""
+
+    def __init__(self, spec: dict[str, Any]) -> None:
+        self.schemas = spec["components"]["schemas"]
+        self.paths = spec["paths"]
+        self.order: list[str] = []
+
+    def collection_models(self) -> dict[str, str]:
+        """Return collection path segment -> document model name."""
+        models = {}
+        for path, operations in self.paths.items():
+            if not path.startswith(COLLECTION_PREFIX) or "{" in path:
+                continue
+            response = operations["get"]["responses"]["200"]["content"]["application/json"]
+            wrapper = self.schemas[_ref_name(response["schema"]["$ref"])]
+            if "data" not in wrapper.get("properties", {}):
+                continue  # single objects such as personal_info
+            models[path.removeprefix(COLLECTION_PREFIX)] = _ref_name(
+                wrapper["properties"]["data"]["items"]["$ref"]
+            )
+        return models
+
+    def visit(self, name: str) -> None:
+        """Add a model and the models it references, dependencies first."""
+        if name in self.order:
+            return
+        for prop in self.schemas[name]["properties"].values():
+            for ref in _refs(prop):
+                if "properties" in self.schemas[ref]:
+                    self.visit(ref)
+        self.order.append(name)
+
+    def checker(self, prop: dict[str, Any]) -> tuple[str, str]:
+        """Return (validation expression template, type annotation) for a property.
+
+        Scalar annotations double as the exact class their fast path accepts.
+        """
+        options = [option for option in prop.get("anyOf", [prop]) if option.get("type") != "null"]
+        if len(options) != 1:
+            raise ValueError(f"Unsupported union: {prop}")
+        option = options[0]
+        if "allOf" in option and len(option["allOf"]) == 1:
+            option = option["allOf"][0]
+
+        if "$ref" in option:
+            ref = _ref_name(option["$ref"])
+            schema = self.schemas[ref]
+            if "properties" in schema:
+                return f"_model({{value}}, {{field}}, {ref})", ref
+            option = schema  # enums and formatted strings
+
+        kind = option.get("type", "string")
+        if kind == "array":
+            item_check, item_type = self.checker(option["items"])
+            if item_check.startswith("_model"):
+                item = item_check.format(value="v", field="f")
+                return f"_array({{value}}, {{field}}, lambda v, f: {item})", f"tuple[{item_type}, ...]"
+            item_function = item_check.split("(", 1)[0]
+            return f"_array({{value}}, {{field}}, {item_function})", f"tuple[{item_type} | None, ...]"
+        if kind in SCALAR_CHECKS:
+            function, annotation = SCALAR_CHECKS[kind]
+            return f"{function}({{value}}, {{field}})", annotation
+        raise ValueError(f"Unsupported property: {prop}")
+
+    def render_model(self, name: str) -> str:
+        """Render one dataclass."""
+        schema = self.schemas[name]
+        properties = schema["properties"]
+        description = (schema.get("description") or schema.get("title") or name).strip().splitlines()[0]
+        lines = [
+            "",
+            "",
+            "",
+            "@dataclass(slots=True, frozen=True, eq=False)",
+            f"class {name}(OuraModel):",
+            f'    """{description.rstrip(".")}."""',
+            "",
+        ]
+        decode = []
+        for key, prop in properties.items():
+            check, annotation = self.checker(prop)
+            attribute = _attribute(key)
+            if attribute in FROM_DICT_NAMES:
+                raise ValueError(f"{name}.{key} shadows a from_dict name")
+            lines.append(f"    {attribute}: {annotation} | None = None")
+            call = check.format(value=attribute, field=f'"{name}.{key}"')
+            decode.append(f'        {attribute} = data.get("{key}")')
+            if check.startswith(("_array", "_model")):
+                decode.append(f"        {attribute} = {call}")
+            else:
+                # Values of the expected class skip the call; others are checked or coerced
+                decode += [
+                    f"        if {attribute}.__class__ is not {annotation} and {attribute} is not None:",
+                    f"            {attribute} = {call}",
+                ]
+        lines += [
+            "",
+            "    _attributes: ClassVar[dict[str, str]] = {",
+            *(f'        "{key}": "{_attribute(key)}",' for key in properties),
+            "    }",
+            "",
+            "    @classmethod",
+            f"    def from_dict(cls, data: Mapping[str, Any]) -> {name}:",
+            '        """Decode and validate a raw document."""',
+            *decode,
+            "        return cls(",
+            *(f"            {_attribute(key)}," for key in properties),
+            "        )",
+        ]
+        return "\n".join(lines)
+
+    def render(self) -> str:
+        """Render the whole module."""
+        collections = self.collection_models()
+        for model in collections.values():
+            self.visit(model)
+        body = "".join(self.render_model(name) for name in self.order)
+        path_models = "\n".join(
+            f'    "{path}": {model},'
+            for path, model in collections.items()
+            if path not in RAW_COLLECTIONS
+        )
+        return (
+            HEADER.format(
+                spec_name=SPEC_PATH.name,
+                reserved=", ".join(f'"{key}"' for key in sorted(RESERVED_ATTRIBUTES)),
+            )
+            + body
+            + FOOTER.format(path_models=path_models)
+        )
+
+
+def _ref_name(ref: str) -> str:
+    return ref.rsplit("/", 1)[-1]
+
+
+def _refs(prop: dict[str, Any]) -> list[str]:
+    found = re.findall(r'"\$ref": "([^"]+)"', json.dumps(prop))
+    return [_ref_name(ref) for ref in found]
+
+
+def main() -> int:
+    """Write models.py, or check that it is up to date."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", 1)[0])
+    parser.add_argument("--output", type=Path, default=OUTPUT_PATH, help="module to write")
+    parser.add_argument(
+        "--check", action="store_true",
+        help="exit 1 if the output differs from the generated module instead of writing it",
+    )
+    args = parser.parse_args()
+
+    rendered = Generator(json.loads(SPEC_PATH.read_text())).render()
+    if args.check:
+        if not args.output.exists() or args.output.read_text() != rendered:
+            print(f"{args.output} is out of date; run scripts/generate_models.py", file=sys.stderr)
+            return 1
+        print(f"{args.output} is up to date")
+        return 0
+    args.output.write_text(rendered)
+    print(f"Wrote {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,351 @@
+"""Local stand-in for the Oura API, generated from the bundled OpenAPI spec.
+
+Serves every /v2/usercollection endpoint of docs/Oura API/openapi-1.28.json,
+both collections and single documents, with synthetic data for any date range.
+Documents are derived from a seed, the endpoint and the day, so the same range
+always returns the same data and pages stay consistent across requests.
+
+Besides the data, the server reproduces the API behaviour the integration has
+to cope with: next_token pagination, 401 for scopes the account lacks, 429 with
+Retry-After once the rate limit is used up, and injected latency.
+
+Run from the repository root and point the integration at it:
+
+    python scripts/mock_server.py --port 8765 --latency 0.05 --missing-scope workout
+    OURA_API_BASE_URL=http://127.0.0.1:8765/v2/usercollection hass -c config
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections import deque
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+import hashlib
+import json
+from pathlib import Path
+import random
+import re
+import sys
+import time
+from typing import Any
+
+from aiohttp import web
+
+ROOT = Path(__file__).resolve().parent.parent
+SPEC_PATH = ROOT / "docs" / "Oura API" / "openapi-1.28.json"
+COLLECTION_PREFIX = "/v2/usercollection/"
+
+HEARTRATE_PATH = "heartrate"
+HEARTRATE_INTERVAL = timedelta(minutes=5)
+# Documents per day for collections that are not one-per-day
+DOCUMENTS_PER_DAY = {"workout": (0, 2), "session": (0, 2), "tag": (0, 1), "enhanced_tag": (0, 2)}
+# Collections the API only returns when the matching scope was granted
+SCOPES = {
+    "workout": "workout",
+    "session": "session",
+    "tag": "tag",
+    "enhanced_tag": "tag",
+    "daily_spo2": "spo2",
+    "daily_stress": "stress",
+    "daily_resilience": "stress",
+}
+
+
+@dataclass
+class MockOptions:
+    """Behaviour of the stand-in server."""
+
+    seed: int = 0
+    page_size: int = 50
+    heartrate_page_size: int = 1000
+    latency: float = 0.0  # seconds added to every response
+    latency_jitter: float = 0.0  # +/- seconds of random extra latency
+    rate_limit: int = 5000  # requests per rate_limit_period, then 429
+    rate_limit_period: float = 300.0  # seconds
+    missing_scopes: set[str] = field(default_factory=set)
+
+
+def _ref_name(ref: str) -> str:
+    return ref.rsplit("/", 1)[-1]
+
+
+class DocumentFactory:
+    """Synthesizes schema-valid documents from the OpenAPI component schemas."""
+
+    def __init__(self, spec: dict[str, Any], seed: int) -> None:
+        self.schemas = spec["components"]["schemas"]
+        self.seed = seed
+        self.collections: dict[str, str] = {}
+        for path, operations in spec["paths"].items():
+            if not path.startswith(COLLECTION_PREFIX) or "{" in path:
+                continue
+            response = operations["get"]["responses"]["200"]["content"]["application/json"]
+            wrapper = self.schemas[_ref_name(response["schema"]["$ref"])]
+            if "data" in wrapper.get("properties", {}):
+                self.collections[path.removeprefix(COLLECTION_PREFIX)] = _ref_name(
+                    wrapper["properties"]["data"]["items"]["$ref"]
+                )
+
+    def _random(self, *parts: Any) -> random.Random:
+        key = ":".join(str(part) for part in (self.seed, *parts))
+        return random.Random(hashlib.sha1(key.encode()).digest())
+
+    def documents(self, path: str, day: date) -> list[dict[str, Any]]:
+        """Return the documents of one collection for one day."""
+        low, high = DOCUMENTS_PER_DAY.get(path, (1, 1))
+        count = self._random(path, day, "count").randint(low, high)
+        return [self.document(path, day, index) for index in range(count)]
+
+    def document(self, path: str, day: date, index: int) -> dict[str, Any]:
+        """Return one document; its id encodes the day and index."""
+        rng = self._random(path, day, index)
+        start = datetime.combine(day, datetime.min.time()) + timedelta(
+            hours=rng.randint(7, 20), minutes=rng.randint(0, 59)
+        )
+        context = {"day": day, "start": start, "rng": rng}
+        document = self._object(self.collections[path], context)
+        if "id" in document:
+            document["id"] = f"{day.isoformat()}_{index}_{rng.getrandbits(32):08x}"
+        return document
+
+    def heartrate(self, start: datetime, end: datetime) -> Iterable[dict[str, Any]]:
+        """Yield 5-minute heart rate samples in [start, end)."""
+        # Align to the sample grid so overlapping ranges return identical samples
+        moment = datetime.min + -(-(start - datetime.min) // HEARTRATE_INTERVAL) * HEARTRATE_INTERVAL
+        while moment < end:
+            rng = self._random(HEARTRATE_PATH, moment)
+            if moment.hour < 7:
+                bpm, source = rng.randint(46, 62), "sleep"
+            else:
+                bpm, source = rng.randint(58, 115), rng.choice(("awake", "rest", "workout"))
+            yield {"bpm": bpm, "source": source, "timestamp": moment.isoformat() + "+00:00"}
+            moment += HEARTRATE_INTERVAL
+
+    def _object(self, name: str, context: dict[str, Any]) -> dict[str, Any]:
+        return {
+            key: self._value(key, prop, context)
+            for key, prop in self.schemas[name]["properties"].items()
+        }
+
+    def _value(self, key: str, prop: dict[str, Any], context: dict[str, Any]) -> Any:
+        rng: random.Random = context["rng"]
+        options = [option for option in prop.get("anyOf", [prop]) if option.get("type") != "null"]
+        if not options:
+            return None
+        option = options[0]
+        if "allOf" in option:
+            option = option["allOf"][0]
+        if "$ref" in option:
+            schema = self.schemas[_ref_name(option["$ref"])]
+            if "properties" in schema:
+                return self._object(_ref_name(option["$ref"]), context)
+            option = schema
+        if "enum" in option:
+            return rng.choice(option["enum"])
+
+        kind = option.get("type", "string")
+        if kind == "array":
+            return [self._value(key, option["items"], context) for _ in range(rng.randint(3, 12))]
+        if kind == "object":
+            return {}
+        if kind == "boolean":
+            return rng.random() < 0.2
+        if kind == "integer":
+            return self._integer(key, prop, rng)
+        if kind == "number":
+            return self._number(key, rng)
+        return self._string(key, option, context)
+
+    def _integer(self, key: str, prop: dict[str, Any], rng: random.Random) -> int:
+        description = prop.get("description", "")
+        if "[1, 100]" in description or key.endswith("score") or key in ("efficiency", "latency"):
+            return rng.randint(55, 98)
+        if key.endswith(("duration", "_time", "_seconds")):
+            return rng.randint(600, 30000)
+        if key == "steps":
+            return rng.randint(1500, 18000)
+        if key.endswith(("calories", "_burn")):
+            return rng.randint(100, 900)
+        if key.endswith("_age"):
+            return rng.randint(25, 60)
+        return rng.randint(0, 100)
+
+    def _number(self, key: str, rng: random.Random) -> float:
+        if "temperature" in key:
+            return round(rng.uniform(-1.0, 1.0), 2)
+        if "heart_rate" in key or key == "bpm":
+            return round(rng.uniform(48, 75), 1)
+        if key in ("vo2_max", "average_breath"):
+            return round(rng.uniform(12, 55), 1)
+        if key in ("interval",):
+            return 300.0
+        if "distance" in key or "meters" in key:
+            return round(rng.uniform(500, 15000), 1)
+        return round(rng.uniform(0, 100), 2)
+
+    def _string(self, key: str, option: dict[str, Any], context: dict[str, Any]) -> str:
+        rng: random.Random = context["rng"]
+        day: date = context["day"]
+        start: datetime = context["start"]
+        if option.get("format") == "date" or key in ("day", "start_day", "end_day"):
+            return day.isoformat()
+        if key.startswith("end") or key.endswith("_end") or "end_" in key:
+            return (start + timedelta(minutes=rng.randint(20, 480))).isoformat() + "+00:00"
+        if (
+            option.get("format") == "date-time"
+            or "time" in key
+            or key.startswith(("start", "bedtime"))
+            or key.endswith("_start")
+        ):
+            return start.isoformat() + "+00:00"
+        if key in ("text", "comment", "label", "name"):
+            return rng.choice(("morning run", "late dinner", "travel", "sauna", ""))
+        return f"{key}_{rng.getrandbits(24):06x}"
+
+
+class MockOuraServer:
+    """aiohttp application serving the synthetic collections."""
+
+    def __init__(self, options: MockOptions | None = None, spec_path: Path = SPEC_PATH) -> None:
+        self.options = options or MockOptions()
+        self.factory = DocumentFactory(json.loads(spec_path.read_text()), self.options.seed)
+        self.requests = 0
+        self._request_times: deque[float] = deque()
+
+    def create_app(self) -> web.Application:
+        """Return the aiohttp application."""
+        app = web.Application(middlewares=[self._middleware])
+        app.router.add_get(COLLECTION_PREFIX + "{path}", self._handle_collection)
+        app.router.add_get(COLLECTION_PREFIX + "{path}/{document_id}", self._handle_document)
+        return app
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler) -> web.StreamResponse:
+        """Apply authentication, scopes, rate limiting and latency to every request."""
+        self.requests += 1
+        if self.options.latency or self.options.latency_jitter:
+            jitter = random.uniform(-self.options.latency_jitter, self.options.latency_jitter)
+            await asyncio.sleep(max(0.0, self.options.latency + jitter))
+
+        if not request.headers.get("Authorization", "").startswith("Bearer "):
+            return _error(401, "Missing bearer token")
+
+        now = time.monotonic()
+        while self._request_times and self._request_times[0] <= now - self.options.rate_limit_period:
+            self._request_times.popleft()
+        if len(self._request_times) >= self.options.rate_limit:
+            retry_after = self._request_times[0] + self.options.rate_limit_period - now
+            return _error(429, "Rate limit exceeded", {"Retry-After": str(max(1, round(retry_after)))})
+        self._request_times.append(now)
+
+        path = request.match_info.get("path", "")
+        if path in SCOPES and SCOPES[path] in self.options.missing_scopes:
+            return _error(401, f"Missing scope: {SCOPES[path]}")
+        if path != HEARTRATE_PATH and path not in self.factory.collections:
+            return _error(404, "Not found")
+        return await handler(request)
+
+    async def _handle_collection(self, request: web.Request) -> web.Response:
+        path = request.match_info["path"]
+        query = request.query
+        try:
+            offset = int(query.get("next_token") or 0)
+            if path == HEARTRATE_PATH:
+                start = _parse_datetime(query.get("start_datetime"), days_ago=1)
+                end = _parse_datetime(query.get("end_datetime"), days_ago=0)
+                documents = list(self.factory.heartrate(start, end))
+                page_size = self.options.heartrate_page_size
+            else:
+                start_day = _parse_date(query.get("start_date"), days_ago=1)
+                end_day = _parse_date(query.get("end_date"), days_ago=0)
+                documents = [
+                    document
+                    for day in _days(start_day, end_day)
+                    for document in self.factory.documents(path, day)
+                ]
+                page_size = self.options.page_size
+        except ValueError as err:
+            return _error(400, str(err))
+
+        page = documents[offset:offset + page_size]
+        next_offset = offset + page_size
+        return web.json_response(
+            {"data": page, "next_token": str(next_offset) if next_offset < len(documents) else None}
+        )
+
+    async def _handle_document(self, request: web.Request) -> web.Response:
+        path = request.match_info["path"]
+        if path == HEARTRATE_PATH:
+            return _error(404, "Not found")
+        match = re.fullmatch(r"(\d{4}-\d{2}-\d{2})_(\d+)_[0-9a-f]{8}", request.match_info["document_id"])
+        if not match:
+            return _error(404, "Document not found")
+        day = date.fromisoformat(match.group(1))
+        index = int(match.group(2))
+        if index >= len(self.factory.documents(path, day)):
+            return _error(404, "Document not found")
+        document = self.factory.document(path, day, index)
+        if document.get("id") != request.match_info["document_id"]:
+            return _error(404, "Document not found")
+        return web.json_response(document)
+
+
+def _error(status: int, detail: str, headers: dict[str, str] | None = None) -> web.Response:
+    return web.json_response({"detail": detail}, status=status, headers=headers)
+
+
+def _parse_date(value: str | None, days_ago: int) -> date:
+    if not value:
+        return date.today() - timedelta(days=days_ago)
+    return date.fromisoformat(value)
+
+
+def _parse_datetime(value: str | None, days_ago: int) -> datetime:
+    if not value:
+        return datetime.combine(date.today() - timedelta(days=days_ago), datetime.min.time())
+    return datetime.fromisoformat(value).replace(tzinfo=None)
+
+
+def _days(start: date, end: date) -> Iterable[date]:
+    """Yield each day in [start, end), the API's exclusive end date."""
+    day = start
+    while day < end:
+        yield day
+        day += timedelta(days=1)
+
+
+def main() -> int:
+    """Run the stand-in server."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", 1)[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--page-size", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every response")
+    parser.add_argument("--latency-jitter", type=float, default=0.0)
+    parser.add_argument("--rate-limit", type=int, default=5000, help="requests per 5 minutes")
+    parser.add_argument(
+        "--missing-scope", action="append", default=[], choices=sorted(set(SCOPES.values())),
+        help="answer the endpoints needing this scope with 401 (repeatable)",
+    )
+    args = parser.parse_args()
+
+    server = MockOuraServer(
+        MockOptions(
+            seed=args.seed,
+            page_size=args.page_size,
+            latency=args.latency,
+            latency_jitter=args.latency_jitter,
+            rate_limit=args.rate_limit,
+            missing_scopes=set(args.missing_scope),
+        )
+    )
+    print(f"Oura stand-in: OURA_API_BASE_URL=http://{args.host}:{args.port}/v2/usercollection")
+    web.run_app(server.create_app(), host=args.host, port=args.port, print=None)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,562 @@
+"""Tests for the Oura API client."""
+from __future__ import annotations
+
+import asyncio
+from datetime import date, datetime, timezone
+import json
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from aiohttp import ClientResponseError
+import pytest
+
+from custom_components.oura.api import OuraApiClient
+
+
+def _client() -> OuraApiClient:
+    """Create an API client with PAT auth and no real session."""
+    return OuraApiClient(MagicMock(), entry=MagicMock(), pat_token="mock_pat")
+
+
+@pytest.mark.asyncio
+async def test_iter_documents_follows_next_token():
+    """Test that documents are streamed across every page."""
+    client = _client()
+    client._async_get = AsyncMock(
+        side_effect=[
+            {"data": [{"id": "1"}, {"id": "2"}], "next_token": "abc"},
+            {"data": [{"id": "3"}], "next_token": None},
+        ]
+    )
+
+    documents = [
+        doc
+        async for doc in client.async_iter_documents("sleep", date(2024, 1, 1), date(2024, 3, 1))
+    ]
+
+    assert [doc["id"] for doc in documents] == ["1", "2", "3"]
+    assert client._async_get.call_count == 2
+    first_params = client._async_get.call_args_list[0].args[1]
+    second_params = client._async_get.call_args_list[1].args[1]
+    assert "next_token" not in first_params
+    assert second_params["next_token"] == "abc"
+    assert second_params["start_date"] == "2024-01-01"
+
+
+@pytest.mark.asyncio
+async def test_collection_fetch_concatenates_pages():
+    """Test that regular endpoint fetches no longer stop at the first page."""
+    client = _client()
+    client._async_get = AsyncMock(
+        side_effect=[
+            {"data": [{"day": "2024-01-01"}], "next_token": "page2"},
+            {"data": [{"day": "2024-01-02"}]},
+        ]
+    )
+
+    result = await client._async_get_activity(date(2024, 1, 1), date(2024, 1, 3))
+
+    assert result == {"data": [{"day": "2024-01-01"}, {"day": "2024-01-02"}]}
+
+
+@pytest.mark.asyncio
+async def test_iter_documents_scope_gated_401_yields_nothing():
+    """Test that unsupported optional endpoints stream no documents."""
+    client = _client()
+    client._async_get = AsyncMock(
+        side_effect=ClientResponseError(MagicMock(), (), status=401)
+    )
+
+    documents = [
+        doc
+        async for doc in client.async_iter_documents("spo2", date(2024, 1, 1), date(2024, 1, 2))
+    ]
+
+    assert documents == []
+
+
+@pytest.mark.asyncio
+async def test_iter_documents_heartrate_uses_windows():
+    """Test that long heart rate ranges are streamed in 30-day windows."""
+    client = _client()
+    client._async_get = AsyncMock(return_value={"data": [{"bpm": 60}]})
+
+    documents = [
+        doc
+        async for doc in client.async_iter_documents("heartrate", date(2024, 1, 1), date(2024, 3, 1))
+    ]
+
+    assert client._async_get.call_count == len(documents)
+    assert client._async_get.call_count > 1
+    for call in client._async_get.call_args_list:
+        assert "start_datetime" in call.args[1]
+
+
+@pytest.mark.asyncio
+async def test_get_data_uses_per_endpoint_start_dates():
+    """Test that sync cursors narrow the requested range per endpoint."""
+    client = _client()
+    client._async_get = AsyncMock(return_value={"data": []})
+
+    with patch("custom_components.oura.api.dt_util.now") as mock_now:
+        mock_now.return_value.date.return_value = date(2024, 1, 15)
+        await client.async_get_data(days_back=1, since={"sleep": date(2024, 1, 15)})
+
+    params_by_url = {call.args[0]: call.args[1] for call in client._async_get.call_args_list}
+    sleep_params = params_by_url["https://api.ouraring.com/v2/usercollection/daily_sleep"]
+    activity_params = params_by_url["https://api.ouraring.com/v2/usercollection/daily_activity"]
+    assert sleep_params["start_date"] == "2024-01-15"
+    assert activity_params["start_date"] == "2024-01-14"
+
+
+def test_date_windows_are_contiguous():
+    """Test that windows start where the previous one ended (no skipped day)."""
+    from custom_components.oura.api import _date_windows
+
+    windows = list(_date_windows(date(2024, 1, 1), date(2024, 3, 1), 30))
+
+    assert windows[0] == (date(2024, 1, 1), date(2024, 1, 31))
+    assert windows[1] == (date(2024, 1, 31), date(2024, 3, 1))
+    assert all(prev[1] == nxt[0] for prev, nxt in zip(windows, windows[1:]))
+
+
+@pytest.mark.asyncio
+async def test_heartrate_windows_fetched_concurrently_in_order():
+    """Test that windows run concurrently but results come back in timestamp order."""
+    import asyncio
+
+    client = _client()
+    in_flight = 0
+    max_in_flight = 0
+
+    async def fake_get(url, params):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        # Later windows finish first
+        await asyncio.sleep(0.01 if params["start_datetime"] < "2024-02" else 0)
+        in_flight -= 1
+        return {"data": [{"bpm": 60, "timestamp": params["start_datetime"]}]}
+
+    client._async_get = fake_get
+
+    result = await client._async_get_heartrate(date(2024, 1, 1), date(2024, 4, 1))
+
+    timestamps = [sample["timestamp"] for sample in result["data"]]
+    assert timestamps == sorted(timestamps)
+    assert len(timestamps) == 4
+    assert max_in_flight > 1
+
+
+@pytest.mark.asyncio
+async def test_window_retried_on_transient_error():
+    """Test that a failed window is retried on its own."""
+    client = _client()
+    client._async_get = AsyncMock(
+        side_effect=[
+            ClientResponseError(MagicMock(), (), status=503),
+            {"data": [{"bpm": 61, "timestamp": "2024-01-01T00:00:00"}]},
+        ]
+    )
+
+    with patch("custom_components.oura.api.asyncio.sleep", new=AsyncMock()):
+        result = await client._async_get_window(
+            "https://example/heartrate",
+            {"start_datetime": "2024-01-01T00:00:00", "end_datetime": "2024-01-31T00:00:00"},
+        )
+
+    assert result["data"][0]["bpm"] == 61
+    assert client._async_get.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_consumes_budget():
+    """Test that each request consumes one token from the shared budget."""
+    from custom_components.oura.api import OuraRateLimiter
+
+    limiter = OuraRateLimiter(capacity=10, period=300)
+
+    for _ in range(3):
+        await limiter.async_acquire()
+
+    assert limiter.remaining == 7
+
+
+def test_rate_limiter_pause_empties_budget():
+    """Test that a 429 pause reports no remaining budget."""
+    from custom_components.oura.api import OuraRateLimiter
+
+    limiter = OuraRateLimiter(capacity=10, period=300)
+    limiter.async_pause(30)
+
+    assert limiter.remaining == 0
+
+
+def test_rate_limiter_shared_per_account():
+    """Test that clients for the same Oura account share one limiter."""
+    hass = MagicMock()
+    hass.data = {}
+    entry = MagicMock()
+    entry.unique_id = "oura_user_1"
+
+    first = OuraApiClient(hass, entry=entry, pat_token="a")
+    second = OuraApiClient(hass, entry=entry, pat_token="a")
+
+    assert first.rate_limiter is second.rate_limiter
+
+
+def test_parse_retry_after():
+    """Test Retry-After parsing for seconds, missing and invalid values."""
+    from custom_components.oura.api import RATE_LIMIT_DEFAULT_RETRY_AFTER, _parse_retry_after
+
+    assert _parse_retry_after("120") == 120
+    assert _parse_retry_after(None) == RATE_LIMIT_DEFAULT_RETRY_AFTER
+    assert _parse_retry_after("not a date") == RATE_LIMIT_DEFAULT_RETRY_AFTER
+
+
+def _oauth_client(expires_at: float) -> OuraApiClient:
+    """Create an API client backed by a mocked OAuth2 session."""
+    entry = MagicMock()
+    entry.data = {"token": {"access_token": "old", "expires_at": expires_at}}
+    session = MagicMock()
+    session.config_entry = entry
+    type(session).token = property(lambda self: entry.data["token"])
+    type(session).valid_token = property(
+        lambda self: entry.data["token"]["expires_at"] > time.time()
+    )
+
+    async def refresh(*args):
+        await asyncio.sleep(0)
+        entry.data = {"token": {"access_token": "new", "expires_at": time.time() + 3600}}
+
+    session.async_ensure_token_valid = AsyncMock(side_effect=refresh)
+    hass = MagicMock()
+    hass.config_entries.async_update_entry = MagicMock(
+        side_effect=lambda entry, data: setattr(entry, "data", data)
+    )
+    session.implementation.async_refresh_token = AsyncMock(
+        return_value={"access_token": "forced", "expires_at": time.time() + 3600}
+    )
+    return OuraApiClient(hass, session, entry)
+
+
+@pytest.mark.asyncio
+async def test_expired_token_refreshed_once_for_concurrent_requests():
+    """Test that concurrent requests share a single in-flight token refresh."""
+    client = _oauth_client(expires_at=0)
+
+    headers = await asyncio.gather(*(client._async_get_auth_headers() for _ in range(5)))
+
+    assert client.session.async_ensure_token_valid.await_count == 1
+    assert all(h == {"Authorization": "Bearer new"} for h in headers)
+
+    # Valid cached headers are reused without checking the session again
+    await client._async_get_auth_headers()
+    assert client.session.async_ensure_token_valid.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_rejected_token_refreshed_once_and_replayed():
+    """Test that a 401 triggers one coordinated refresh shared by concurrent callers."""
+    client = _oauth_client(expires_at=time.time() + 3600)
+    rejected = await client._async_get_auth_headers()
+
+    replay_headers = await asyncio.gather(
+        client._async_get_auth_headers(rejected=rejected),
+        client._async_get_auth_headers(rejected=rejected),
+    )
+
+    assert client.session.implementation.async_refresh_token.await_count == 1
+    assert all(h == {"Authorization": "Bearer forced"} for h in replay_headers)
+    # A 401 for the freshly refreshed token is a scope problem, not expiry
+    assert not client._can_replay(replay_headers[0], "daily_sleep")
+
+
+@pytest.mark.asyncio
+async def test_scope_gated_401_never_forces_refresh():
+    """Test that a missing scope does not refresh the token on every poll."""
+    client = _oauth_client(expires_at=time.time() + 3600)
+    headers = await client._async_get_auth_headers()
+
+    assert client._can_replay(headers, "daily_sleep")
+    assert not client._can_replay(headers, "workout")
+    assert not client._can_replay(headers, "daily_resilience")
+
+
+@pytest.mark.asyncio
+async def test_get_document_by_id():
+    """Test that a single document is fetched from its /{document_id} route."""
+    client = _client()
+    client._async_get = AsyncMock(return_value={"id": "abc", "score": 80})
+
+    document = await client.async_get_document("readiness", "abc")
+
+    assert document == {"id": "abc", "score": 80}
+    client._async_get.assert_awaited_once_with(
+        "https://api.ouraring.com/v2/usercollection/daily_readiness/abc", coalesce=False
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_document_missing_or_unsupported():
+    """Test that deleted documents return None and heart rate is rejected."""
+    client = _client()
+    client._async_get = AsyncMock(side_effect=ClientResponseError(MagicMock(), (), status=404))
+
+    assert await client.async_get_document("tag", "gone") is None
+    with pytest.raises(ValueError):
+        await client.async_get_document("heartrate", "abc")
+
+
+def test_circuit_breaker_opens_and_recovers():
+    """Test closed -> open -> half-open -> closed transitions."""
+    from custom_components.oura.api import OuraCircuitBreaker
+
+    breaker = OuraCircuitBreaker("spo2")
+    with patch("custom_components.oura.api.time.monotonic", return_value=1000.0):
+        for _ in range(3):
+            assert breaker.allow_request()
+            breaker.record_failure(RuntimeError("503"))
+        assert breaker.state == "open"
+        assert not breaker.allow_request()
+
+    # Backoff is at most base backoff plus jitter for the first trip
+    with patch("custom_components.oura.api.time.monotonic", return_value=1100.0):
+        assert breaker.allow_request()
+        assert breaker.state == "half_open"
+        breaker.record_success()
+
+    assert breaker.state == "closed"
+    assert breaker.failures == 0
+
+
+@pytest.mark.asyncio
+async def test_open_circuit_skips_endpoint():
+    """Test that endpoints with an open circuit are not requested."""
+    client = _client()
+    client._async_get = AsyncMock(return_value={"data": []})
+    client.circuit_breakers["stress"].state = "open"
+    client.circuit_breakers["stress"]._open_until = float("inf")
+
+    data = await client.async_get_data(endpoints=["stress", "activity"])
+
+    assert data["stress"] == {}
+    assert data["activity"] == {"data": []}
+    assert client._async_get.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_failing_heartrate_window_trips_breaker():
+    """Test that heart rate failures reach async_get_data instead of returning no samples."""
+    client = _client()
+
+    async def fake_get(url, params):
+        if params["start_datetime"] >= "2024-02":
+            raise ClientResponseError(MagicMock(), (), status=503)
+        return {"data": [{"bpm": 60, "timestamp": params["start_datetime"]}]}
+
+    client._async_get = AsyncMock(side_effect=fake_get)
+
+    # One failing window fails the whole multi-window range
+    with pytest.raises(ClientResponseError), patch(
+        "custom_components.oura.api.asyncio.sleep", new=AsyncMock()
+    ):
+        await client._async_get_heartrate(date(2024, 1, 1), date(2024, 4, 1))
+
+    client._async_get = AsyncMock(side_effect=ClientResponseError(MagicMock(), (), status=503))
+    with patch("custom_components.oura.api.asyncio.sleep", new=AsyncMock()):
+        for _ in range(3):
+            data = await client.async_get_data(endpoints=["heartrate"])
+            assert data["heartrate"] == {}
+
+    assert client.circuit_breakers["heartrate"].state == "open"
+    calls = client._async_get.call_count
+    assert await client.async_get_data(endpoints=["heartrate"]) == {"heartrate": {}}
+    assert client._async_get.call_count == calls
+
+
+def _mock_response(status: int = 200, payload: dict | None = None) -> MagicMock:
+    """Build an aiohttp response usable as an async context manager."""
+    response = MagicMock()
+    response.status = status
+    response.headers = {}
+    response.read = AsyncMock(return_value=json.dumps(payload or {}).encode())
+    response.raise_for_status = MagicMock()
+    response.__aenter__ = AsyncMock(return_value=response)
+    response.__aexit__ = AsyncMock(return_value=None)
+    return response
+
+
+@pytest.mark.asyncio
+async def test_requests_use_per_endpoint_timeouts():
+    """Test that slow endpoints get their own, longer timeouts."""
+    from custom_components.oura.api import DEFAULT_REQUEST_TIMEOUT, REQUEST_TIMEOUTS, OuraRateLimiter
+
+    client = _client()
+    client._rate_limiter = OuraRateLimiter()
+    client._client_session = MagicMock(closed=False)
+    client._client_session.get = MagicMock(return_value=_mock_response(payload={"data": []}))
+
+    await client._async_get("https://api.ouraring.com/v2/usercollection/heartrate", {})
+    await client._async_get("https://api.ouraring.com/v2/usercollection/daily_stress", {})
+
+    first, second = client._client_session.get.call_args_list
+    assert first.kwargs["timeout"] is REQUEST_TIMEOUTS["heartrate"]
+    assert first.kwargs["trace_request_ctx"] == {"endpoint": "heartrate"}
+    assert second.kwargs["timeout"] is DEFAULT_REQUEST_TIMEOUT
+
+
+def test_client_session_created_through_home_assistant():
+    """Test that the session comes from HA's helper, with timeouts and metrics."""
+    from custom_components.oura.api import DEFAULT_REQUEST_TIMEOUT
+
+    client = _client()
+    with patch("custom_components.oura.api.async_create_clientsession") as create:
+        assert client.client_session is client.client_session
+
+    create.assert_called_once()
+    assert create.call_args.args == (client.hass,)
+    assert create.call_args.kwargs["timeout"] is DEFAULT_REQUEST_TIMEOUT
+    assert len(create.call_args.kwargs["trace_configs"]) == 1
+
+
+@pytest.mark.asyncio
+async def test_request_metrics_track_latency_and_reuse():
+    """Test that trace hooks record latency and connection reuse."""
+    from types import SimpleNamespace
+
+    from custom_components.oura.api import OuraRequestMetrics
+
+    metrics = OuraRequestMetrics()
+    context = SimpleNamespace(trace_request_ctx={"endpoint": "daily_sleep"})
+
+    await metrics._on_request_start(None, context, None)
+    await metrics._on_connection_reuseconn(None, context, None)
+    await metrics._on_request_end(None, context, None)
+
+    stats = metrics.as_dict()
+    assert stats["requests"] == 1
+    assert stats["connections_reused"] == 1
+    assert stats["latency"]["daily_sleep"]["count"] == 1
+
+
+def test_json_decoder_selection():
+    """Test that the fast decoder is preferred and the stdlib one is available."""
+    from custom_components.oura.decoder import DECODER_STDLIB, get_json_loads
+
+    name, loads = get_json_loads()
+    assert loads(b'{"data": [{"bpm": 60}]}') == {"data": [{"bpm": 60}]}
+
+    name, loads = get_json_loads(DECODER_STDLIB)
+    assert name == DECODER_STDLIB
+    assert loads(b'{"data": []}') == {"data": []}
+
+    with pytest.raises(ValueError):
+        get_json_loads("yaml")
+
+
+@pytest.mark.asyncio
+async def test_client_uses_configured_decoder():
+    """Test that response bodies go through the client's decoder."""
+    from custom_components.oura.api import OuraRateLimiter
+
+    decoded = []
+
+    def loads(body):
+        decoded.append(body)
+        return json.loads(body)
+
+    client = OuraApiClient(MagicMock(), entry=MagicMock(), pat_token="mock_pat", json_loads=loads)
+    client._rate_limiter = OuraRateLimiter()
+    client._client_session = MagicMock(closed=False)
+    client._client_session.get = MagicMock(return_value=_mock_response(payload={"data": [1]}))
+
+    assert await client._async_get("https://api.ouraring.com/v2/usercollection/tag") == {"data": [1]}
+    assert decoded == [b'{"data": [1]}']
+
+
+@pytest.mark.asyncio
+async def test_identical_requests_are_coalesced_and_memoized():
+    """Test that concurrent identical GETs share one request and reuse its response."""
+    client = _client()
+    release = asyncio.Event()
+    calls = []
+
+    async def fake_request(url, params=None):
+        calls.append((url, params))
+        await release.wait()
+        return {"data": [{"id": "a"}]}
+
+    client._async_request = fake_request
+    url = "https://api.ouraring.com/v2/usercollection/daily_sleep"
+
+    waiters = [
+        asyncio.ensure_future(client._async_get(url, {"start_date": "2024-01-01", "end_date": "2024-01-08"})),
+        asyncio.ensure_future(client._async_get(url, {"end_date": "2024-01-08", "start_date": "2024-01-01"})),
+    ]
+    await asyncio.sleep(0)
+    release.set()
+    first, second = await asyncio.gather(*waiters)
+
+    assert first == second == {"data": [{"id": "a"}]}
+    assert len(calls) == 1
+    assert client.metrics.coalesced == 1
+
+    # A completed response is reused within the TTL, but not for another range
+    await client._async_get(url, {"start_date": "2024-01-01", "end_date": "2024-01-08"})
+    assert len(calls) == 1
+    assert client.metrics.memo_hits == 1
+    await client._async_get(url, {"start_date": "2024-01-02", "end_date": "2024-01-08"})
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_requests_are_not_memoized():
+    """Test that a failure reaches every waiter and the next call retries."""
+    client = _client()
+    client._async_request = AsyncMock(
+        side_effect=[ClientResponseError(MagicMock(), (), status=500), {"data": []}]
+    )
+    url = "https://api.ouraring.com/v2/usercollection/tag"
+
+    with pytest.raises(ClientResponseError):
+        await client._async_get(url, {})
+    assert await client._async_get(url, {}) == {"data": []}
+    assert client._async_request.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_heartrate_polls_only_newer_samples():
+    """Test that heart rate polls given a cursor start at the newest sample already held."""
+    client = _client()
+    client._async_get_window = AsyncMock(return_value={"data": []})
+
+    await client._async_get_heartrate(date(2024, 1, 1), date(2024, 1, 3))
+    await client._async_get_heartrate(date(2024, 1, 1), date(2024, 1, 3), "2024-01-02T08:05:00+00:00")
+    # A cursor from before the window or past its end leaves the window alone
+    await client._async_get_heartrate(date(2024, 1, 1), date(2024, 1, 3), "2023-12-31T23:55:00+00:00")
+    await client._async_get_heartrate(date(2024, 1, 1), date(2024, 1, 3), "2024-01-05T08:05:00+00:00")
+
+    first, second, older, newer = (call.args[1] for call in client._async_get_window.call_args_list)
+    assert first["start_datetime"] == "2024-01-01T00:00:00"
+    assert second["start_datetime"] == "2024-01-02T08:05:00+00:00"
+    assert second["end_datetime"] == first["end_datetime"]
+    assert older == first
+    assert newer == first
+
+
+@pytest.mark.asyncio
+async def test_heartrate_cursor_only_applies_when_passed():
+    """Test that explicit range fetches are not truncated by earlier polls."""
+    client = _client()
+    client.async_now = AsyncMock(return_value=datetime(2024, 1, 8, 12, 0, tzinfo=timezone.utc))
+    client._async_get_window = AsyncMock(return_value={"data": [
+        {"bpm": 64, "timestamp": "2024-01-08T08:05:00+00:00"},
+    ]})
+
+    await client.async_get_data(days_back=7, endpoints=["heartrate"], heartrate_since="2024-01-08T08:05:00+00:00")
+    await client.async_get_data(days_back=7, endpoints=["heartrate"])
+
+    polled, explicit = (call.args[1] for call in client._async_get_window.call_args_list)
+    assert polled["start_datetime"] == "2024-01-08T08:05:00+00:00"
+    assert explicit["start_datetime"] == "2024-01-01T00:00:00"
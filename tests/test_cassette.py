@@ -0,0 +1,109 @@
+"""Tests for recording and replaying Oura API traffic."""
+from __future__ import annotations
+
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+from aiohttp import ClientResponseError
+import pytest
+
+from custom_components.oura.api import OuraApiClient, OuraRateLimiter
+from custom_components.oura.cassette import (
+    CASSETTE_RECORD,
+    CASSETTE_REPLAY,
+    SCRUBBED_VALUE,
+    CassetteMissError,
+    OuraCassette,
+)
+
+URL = "https://api.ouraring.com/v2/usercollection/daily_sleep"
+PARAMS = {"start_date": "2024-01-01", "end_date": "2024-01-08"}
+
+
+def _response(status: int, payload: dict | None = None) -> MagicMock:
+    """Build an aiohttp response usable as an async context manager."""
+    response = MagicMock()
+    response.status = status
+    response.headers = {}
+    response.read = AsyncMock(return_value=json.dumps(payload or {}).encode())
+    if status >= 400:
+        response.raise_for_status = MagicMock(
+            side_effect=ClientResponseError(MagicMock(), (), status=status)
+        )
+    response.__aenter__ = AsyncMock(return_value=response)
+    response.__aexit__ = AsyncMock(return_value=None)
+    return response
+
+
+@pytest.mark.asyncio
+async def test_record_then_replay(tmp_path):
+    """Test that recorded responses are scrubbed and replayed without a network."""
+    payload = {"data": [{"id": "s1", "day": "2024-01-01", "score": 80}], "access_token": "secret"}
+
+    recorder = OuraApiClient(
+        MagicMock(), entry=MagicMock(), pat_token="mock_pat",
+        cassette=OuraCassette(tmp_path, CASSETTE_RECORD),
+    )
+    recorder._rate_limiter = OuraRateLimiter()
+    recorder._client_session = MagicMock(closed=False)
+    recorder._client_session.get = MagicMock(
+        side_effect=[_response(200, payload), _response(404)]
+    )
+    await recorder._async_get(URL, PARAMS)
+    with pytest.raises(ClientResponseError):
+        await recorder._async_get(f"{URL}/gone", coalesce=False)
+
+    recorded = "".join(path.read_text() for path in tmp_path.iterdir())
+    assert "secret" not in recorded
+    assert "mock_pat" not in recorded
+
+    player = OuraApiClient(
+        MagicMock(), entry=MagicMock(), pat_token="mock_pat",
+        cassette=OuraCassette(tmp_path, CASSETTE_REPLAY),
+    )
+    player._client_session = MagicMock(closed=False)
+
+    # Query order does not matter; the session is never used
+    replayed = await player._async_get(URL, dict(reversed(PARAMS.items())))
+    assert replayed["data"] == payload["data"]
+    assert replayed["access_token"] == SCRUBBED_VALUE
+    with pytest.raises(ClientResponseError) as err:
+        await player._async_get(f"{URL}/gone", coalesce=False)
+    assert err.value.status == 404
+    with pytest.raises(CassetteMissError):
+        await player._async_get(URL, {"start_date": "2023-01-01"})
+    player._client_session.get.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_replay_after_the_clock_moved(tmp_path):
+    """Test that a replay on a later day requests the ranges that were recorded."""
+    from datetime import timedelta
+    from unittest.mock import patch
+
+    from homeassistant.util import dt as dt_util
+
+    payload = {"data": [{"id": "s1", "day": "2024-01-01", "score": 80}]}
+    recorder = OuraApiClient(
+        MagicMock(), entry=MagicMock(), pat_token="mock_pat",
+        cassette=OuraCassette(tmp_path, CASSETTE_RECORD),
+    )
+    recorder._rate_limiter = OuraRateLimiter()
+    recorder._client_session = MagicMock(closed=False)
+    recorder._client_session.get = MagicMock(return_value=_response(200, payload))
+    recorded = await recorder.async_get_data(endpoints=["sleep"])
+    assert recorded["sleep"]["data"] == payload["data"]
+
+    player = OuraApiClient(
+        MagicMock(), entry=MagicMock(), pat_token="mock_pat",
+        cassette=OuraCassette(tmp_path, CASSETTE_REPLAY),
+    )
+    player._client_session = MagicMock(closed=False)
+    later = dt_util.now() + timedelta(days=3)
+    with patch("custom_components.oura.api.dt_util.now", return_value=later):
+        assert (await player.async_now()).date() != later.date()
+        replayed = await player.async_get_data(endpoints=["sleep"])
+
+    assert replayed["sleep"]["data"] == payload["data"]
+    assert player.circuit_breakers["sleep"].failures == 0
+    player._client_session.get.assert_not_called()
@@ -2,9 +2,18 @@
 
 import sys
 from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
 sys.path.insert(0, str(Path(__file__).parent.parent / "custom_components"))
 
-from oura.coordinator import OuraDataUpdateCoordinator
+from oura.const import WEBHOOK_FALLBACK_POLL_INTERVAL
+from oura.coordinator import (
+    HEARTRATE_BUFFER_SAMPLES,
+    OuraDataUpdateCoordinator,
+    _append_samples,
+    _merge_documents,
+)
 
 
 class MockCoordinator:
@@ -217,7 +226,8 @@ def test_process_heart_rate_with_aggregation():
     coordinator._process_heart_rate(data, processed)
 
     assert processed["current_heart_rate"] == 57
-    assert processed["heart_rate_timestamp"] == "2024-01-01T00:20:00"
+    # The sample timestamp changes every poll and no entity shows it
+    assert "heart_rate_timestamp" not in processed
     assert processed["average_heart_rate"] == (55 + 58 + 62 + 60 + 57) / 5
     assert processed["min_heart_rate"] == 55
     assert processed["max_heart_rate"] == 62
@@ -381,3 +391,385 @@ def test_empty_data_handling():
     # Should return empty dict without errors
     assert isinstance(processed, dict)
     assert len(processed) == 0
+
+
+def test_merge_documents_replaces_updated_documents():
+    """Test that a delta fetch updates documents in place by id."""
+    cached = [
+        {"id": "a", "day": "2024-01-14", "steps": 9000},
+        {"id": "b", "day": "2024-01-15", "steps": 1000},
+    ]
+    fetched = [{"id": "b", "day": "2024-01-15", "steps": 4000}]
+
+    merged = _merge_documents(cached, fetched, cutoff="2024-01-14")
+
+    assert [doc["id"] for doc in merged] == ["a", "b"]
+    assert merged[-1]["steps"] == 4000
+
+
+def test_merge_documents_drops_stale_and_orders_by_time():
+    """Test that documents older than the cutoff are pruned and samples stay ordered."""
+    cached = [
+        {"bpm": 50, "timestamp": "2024-01-13T23:55:00+00:00"},
+        {"bpm": 55, "timestamp": "2024-01-14T10:00:00+00:00"},
+    ]
+    fetched = [
+        {"bpm": 62, "timestamp": "2024-01-15T08:05:00+00:00"},
+        {"bpm": 60, "timestamp": "2024-01-15T08:00:00+00:00"},
+    ]
+
+    merged = _merge_documents(cached, fetched, cutoff="2024-01-14")
+
+    assert [doc["bpm"] for doc in merged] == [55, 60, 62]
+
+
+def test_endpoint_cadence_by_poll_class(mock_hass, mock_config_entry):
+    """Test that each endpoint gets the cadence of its poll class."""
+    from datetime import timedelta
+
+    coordinator = OuraDataUpdateCoordinator(
+        mock_hass, MagicMock(), mock_config_entry, 5, {"daily": 45}
+    )
+
+    assert coordinator._endpoint_intervals["heartrate"] == timedelta(minutes=5)
+    assert coordinator._endpoint_intervals["activity"] == timedelta(minutes=15)
+    assert coordinator._endpoint_intervals["sleep"] == timedelta(minutes=45)
+    assert coordinator._endpoint_intervals["vo2_max"] == timedelta(minutes=360)
+
+
+def test_push_endpoints_restore_their_cadence(mock_hass, mock_config_entry):
+    """Test that an endpoint whose subscription is removed is polled at its class cadence again."""
+    from datetime import timedelta
+
+    from homeassistant.util import dt as dt_util
+
+    coordinator = OuraDataUpdateCoordinator(
+        mock_hass, MagicMock(), mock_config_entry, 5, {"daily": 45}
+    )
+    fallback = timedelta(minutes=WEBHOOK_FALLBACK_POLL_INTERVAL)
+
+    coordinator.async_set_push_endpoints({"sleep", "tag"})
+    assert coordinator._endpoint_intervals["sleep"] == fallback
+    assert coordinator._endpoint_intervals["activity"] == timedelta(minutes=15)
+    coordinator._next_poll["sleep"] = dt_util.utcnow() + fallback
+
+    # The sleep subscription is gone: back to the daily cadence, polled within it
+    coordinator.async_set_push_endpoints({"tag"})
+    assert coordinator._endpoint_intervals["sleep"] == timedelta(minutes=45)
+    assert coordinator._endpoint_intervals["tag"] == fallback
+    assert coordinator._next_poll["sleep"] <= dt_util.utcnow() + timedelta(minutes=45)
+
+    coordinator.async_set_push_endpoints(set())
+    assert coordinator._endpoint_intervals["tag"] == timedelta(minutes=15)
+
+
+def test_only_due_endpoints_are_polled(mock_hass, mock_config_entry):
+    """Test that successfully fetched endpoints wait for their cadence."""
+    from datetime import datetime, timedelta, timezone
+
+    coordinator = OuraDataUpdateCoordinator(mock_hass, MagicMock(), mock_config_entry, 5)
+    now = datetime(2024, 1, 15, 8, 0, tzinfo=timezone.utc)
+
+    # Everything is due on the first tick
+    assert len(coordinator._due_endpoints(now)) == 16
+
+    # vo2_max succeeded, activity failed (empty dict)
+    coordinator._schedule_next_polls(
+        {"heartrate": {"data": []}, "vo2_max": {"data": []}, "activity": {}}, now
+    )
+
+    due = coordinator._due_endpoints(now + timedelta(minutes=5))
+    assert "heartrate" in due
+    assert "activity" in due
+    assert "vo2_max" not in due
+    assert "vo2_max" in coordinator._due_endpoints(now + timedelta(hours=6))
+
+
+def test_unsupported_endpoints_skipped_until_reprobe(mock_hass, mock_config_entry):
+    """Test that endpoints answering 401 are skipped until their re-probe is due."""
+    from datetime import datetime, timedelta, timezone
+
+    coordinator = OuraDataUpdateCoordinator(mock_hass, MagicMock(), mock_config_entry, 5)
+    coordinator._capability_store = MagicMock()
+    now = datetime(2024, 1, 15, 8, 0, tzinfo=timezone.utc)
+
+    coordinator._update_capabilities(
+        {"spo2": {"data": [], "unsupported": True}, "sleep": {"data": []}}, now
+    )
+
+    assert "spo2" not in coordinator._due_endpoints(now + timedelta(hours=1))
+    assert "spo2" in coordinator._due_endpoints(now + timedelta(hours=24))
+    coordinator._capability_store.async_delay_save.assert_called_once()
+
+    # A successful re-probe makes the endpoint regular again
+    coordinator._update_capabilities({"spo2": {"data": [{"day": "2024-01-16"}]}}, now)
+    assert coordinator._unsupported_endpoints == {}
+
+
+def test_merge_document_reprocesses_only_its_endpoint(mock_hass, mock_config_entry):
+    """Test that a single changed document updates only the sensors it feeds."""
+    coordinator = OuraDataUpdateCoordinator(mock_hass, MagicMock(), mock_config_entry, 5)
+    coordinator._sync_store = MagicMock()
+    coordinator._response_store = MagicMock()
+    coordinator._async_schedule_response_save = MagicMock()
+    coordinator.api_client.rate_limiter.remaining = 4999
+    coordinator.async_set_updated_data = MagicMock()
+    coordinator._raw_data = {"readiness": {"data": [{"id": "r1", "day": "2099-01-01", "score": 70}]}}
+    coordinator.data = {"readiness_score": 70, "sleep_score": 85}
+    coordinator._process_sleep_scores = MagicMock()
+
+    coordinator.async_merge_document("readiness", {"id": "r1", "day": "2099-01-01", "score": 82})
+
+    published = coordinator.async_set_updated_data.call_args.args[0]
+    assert published["readiness_score"] == 82
+    assert published["sleep_score"] == 85
+    coordinator._process_sleep_scores.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_cached_responses_restored_on_startup(mock_hass, mock_config_entry):
+    """Test that cached documents and the poll schedule are published without fetching."""
+    from datetime import timedelta
+    from unittest.mock import AsyncMock
+
+    from homeassistant.util import dt as dt_util
+
+    mock_hass.async_add_executor_job = AsyncMock(side_effect=lambda target, *args: target(*args))
+    coordinator = OuraDataUpdateCoordinator(mock_hass, MagicMock(), mock_config_entry, 5)
+    coordinator._response_store = MagicMock()
+    coordinator._raw_data = {"readiness": {"data": [{"id": "r1", "day": "2099-01-01", "score": 82}]}}
+    coordinator._next_poll = {"readiness": dt_util.utcnow() + timedelta(minutes=30)}
+    await coordinator._async_save_responses()
+    stored = coordinator._responses_to_store()
+
+    restored = OuraDataUpdateCoordinator(mock_hass, MagicMock(), mock_config_entry, 5)
+    restored._sync_store = MagicMock(async_load=AsyncMock(return_value=None))
+    restored._capability_store = MagicMock(async_load=AsyncMock(return_value=None))
+    restored._response_store = MagicMock(async_load=AsyncMock(return_value=stored))
+    restored.async_set_updated_data = MagicMock()
+
+    assert await restored.async_restore_cached_data()
+    assert restored.async_set_updated_data.call_args.args[0]["readiness_score"] == 82
+    assert "readiness" not in restored._due_endpoints(dt_util.utcnow())
+    restored.api_client.async_get_data.assert_not_called()
+
+    # Stale caches are ignored
+    stored["saved_at"] = (dt_util.utcnow() - timedelta(days=3)).isoformat()
+    assert not await restored.async_restore_cached_data()
+
+
+@pytest.mark.asyncio
+async def test_only_changed_responses_recompressed(mock_hass, mock_config_entry):
+    """Test that saving the response cache compresses only changed endpoints, off the loop."""
+    from unittest.mock import AsyncMock
+
+    mock_hass.async_add_executor_job = AsyncMock(side_effect=lambda target, *args: target(*args))
+    coordinator = OuraDataUpdateCoordinator(mock_hass, MagicMock(), mock_config_entry, 5)
+    coordinator._sync_store = MagicMock()
+    coordinator._response_store = MagicMock()
+    coordinator._async_schedule_response_save = MagicMock()
+    coordinator._merge_raw_data({
+        "readiness": {"data": [{"id": "r1", "day": "2099-01-01", "score": 70}]},
+        "heartrate": {"data": [{"bpm": 60, "timestamp": "2099-01-01T08:00:00+00:00"}]},
+    })
+    await coordinator._async_save_responses()
+    assert mock_hass.async_add_executor_job.await_count == 2
+    first = coordinator._responses_to_store()["endpoints"]
+
+    # New heart rate samples: readiness keeps its compressed blob
+    coordinator._merge_raw_data({
+        "heartrate": {"data": [{"bpm": 62, "timestamp": "2099-01-01T08:05:00+00:00"}]},
+    })
+    await coordinator._async_save_responses()
+    assert mock_hass.async_add_executor_job.await_count == 3
+    second = coordinator._responses_to_store()["endpoints"]
+    assert second["readiness"] is first["readiness"]
+    assert second["heartrate"] != first["heartrate"]
+
+    # A revised document is compressed again
+    coordinator._merge_raw_data({"readiness": {"data": [{"id": "r1", "day": "2099-01-01", "score": 75}]}})
+    await coordinator._async_save_responses()
+    assert mock_hass.async_add_executor_job.await_count == 4
+    coordinator._response_store.async_delay_save.assert_called()
+
+
+def test_heartrate_samples_appended_to_rolling_buffer():
+    """Test that delta polls append only new samples and the buffer stays bounded."""
+    buffer = [{"bpm": 60, "timestamp": "2024-01-15T08:00:00+00:00"}]
+
+    _append_samples(buffer, [
+        {"bpm": 60, "timestamp": "2024-01-15T08:00:00+00:00"},
+        {"bpm": 62, "timestamp": "2024-01-15T08:05:00+00:00"},
+    ])
+    assert [sample["bpm"] for sample in buffer] == [60, 62]
+
+    _append_samples(buffer, [
+        {"bpm": 70, "timestamp": f"2024-01-16T{minute // 60:02d}:{minute % 60:02d}:00+00:00"}
+        for minute in range(0, 24 * 60, 1)
+    ][:HEARTRATE_BUFFER_SAMPLES])
+    assert len(buffer) == HEARTRATE_BUFFER_SAMPLES
+    assert buffer[-1]["bpm"] == 70
+
+
+def test_category_coordinators_notify_only_on_their_changes(mock_hass, mock_config_entry):
+    """Test that a hub update only reaches the categories whose data changed."""
+    mock_hass.loop = MagicMock()  # Subscribing categories schedules the hub's polling
+    hub = OuraDataUpdateCoordinator(mock_hass, MagicMock(), mock_config_entry, 5)
+    heartrate = hub.async_category("heartrate")
+    sleep = hub.async_category("sleep")
+    assert hub.async_category("sleep") is sleep
+
+    heartrate_updates, sleep_updates = MagicMock(), MagicMock()
+    heartrate.async_add_listener(heartrate_updates)
+    sleep.async_add_listener(sleep_updates)
+
+    hub.data = {"_data_date": "2024-01-15", "sleep_score": 85, "current_heart_rate": 60}
+    hub.async_update_listeners()
+    assert heartrate_updates.call_count == 1
+    assert sleep_updates.call_count == 1
+
+    # Only heart rate (and the diagnostics counter) moved
+    hub.data = {
+        "_data_date": "2024-01-15", "sleep_score": 85, "current_heart_rate": 64,
+        "api_requests_remaining": 4990,
+    }
+    hub.async_update_listeners()
+    assert heartrate_updates.call_count == 2
+    assert sleep_updates.call_count == 1
+    assert sleep.data["current_heart_rate"] == 64
+
+
+def test_unchanged_sensors_are_not_rewritten(mock_hass, mock_config_entry):
+    """Test that only entities whose key changed are notified, and skips are counted."""
+    mock_hass.loop = MagicMock()
+    hub = OuraDataUpdateCoordinator(mock_hass, MagicMock(), mock_config_entry, 5)
+    activity = hub.async_category("activity")
+    steps, calories = MagicMock(), MagicMock()
+    activity.async_add_listener(steps, "steps")
+    activity.async_add_listener(calories, "active_calories")
+
+    hub.data = {"steps": 1000, "active_calories": 50}
+    hub.async_update_listeners()
+    hub.data = {"steps": 1200, "active_calories": 50}
+    hub.async_update_listeners()
+
+    assert steps.call_count == 2
+    assert calories.call_count == 1
+    assert hub.suppressed_writes == 1
+
+    # A new data_date is shown by every sensor
+    hub.data = {"steps": 1200, "active_calories": 50, "_data_date": "2024-01-16"}
+    hub.async_update_listeners()
+    assert calories.call_count == 2
+
+
+def test_new_heart_rate_sample_with_same_values_is_not_rewritten(mock_hass, mock_config_entry):
+    """Test that a newer sample with unchanged heart rate values suppresses the state write."""
+    mock_hass.loop = MagicMock()
+    hub = OuraDataUpdateCoordinator(mock_hass, MagicMock(), mock_config_entry, 5)
+    heartrate = hub.async_category("heartrate")
+    current = MagicMock()
+    heartrate.async_add_listener(current, "current_heart_rate")
+
+    for timestamp in ("2024-01-15T08:00:00+00:00", "2024-01-15T08:05:00+00:00"):
+        processed: dict = {}
+        hub._process_heart_rate(
+            {"heartrate": {"data": [{"bpm": 60, "timestamp": timestamp}]}}, processed
+        )
+        hub.data = processed
+        hub.async_update_listeners()
+
+    assert current.call_count == 1
+    assert hub.suppressed_writes == 1
+
+
+def test_only_changed_endpoints_are_reprocessed(mock_hass, mock_config_entry):
+    """Test that endpoints with an unchanged payload reuse their previous output."""
+    coordinator = OuraDataUpdateCoordinator(mock_hass, MagicMock(), mock_config_entry, 5)
+    coordinator._sync_store = MagicMock()
+    coordinator._response_store = MagicMock()
+    coordinator._async_schedule_response_save = MagicMock()
+    coordinator._merge_raw_data({
+        "readiness": {"data": [{"id": "r1", "day": "2099-01-01", "score": 70}]},
+        "activity": {"data": [{"id": "a1", "day": "2099-01-01", "steps": 1000}]},
+    })
+    assert coordinator._process_changed_endpoints()["steps"] == 1000
+
+    coordinator._process_readiness = MagicMock()
+    coordinator._process_activity = MagicMock(wraps=coordinator._process_activity)
+
+    # Same ids and day but new content: only activity runs again
+    coordinator._merge_raw_data({"activity": {"data": [{"id": "a1", "day": "2099-01-01", "steps": 1500}]}})
+    processed = coordinator._process_changed_endpoints()
+
+    assert processed["steps"] == 1500
+    assert processed["readiness_score"] == 70
+    coordinator._process_readiness.assert_not_called()
+    assert coordinator._process_activity.call_count == 1
+
+    # Byte-identical payloads are not reprocessed
+    coordinator._merge_raw_data({"activity": {"data": [{"id": "a1", "day": "2099-01-01", "steps": 1500}]}})
+    coordinator._process_changed_endpoints()
+    assert coordinator._process_activity.call_count == 1
+    assert coordinator.reused_endpoints > 0
+
+
+@pytest.mark.asyncio
+async def test_historical_backfill_imported_in_chunks_of_whole_days(mock_hass, mock_config_entry):
+    """Test that a backfill is imported while streaming, never splitting a day."""
+    from datetime import date, timedelta
+    from unittest.mock import AsyncMock, patch
+
+    from oura.coordinator import HISTORICAL_IMPORT_CHUNK, HISTORICAL_STATE_DOCUMENTS
+
+    async def iter_documents(endpoint, start_date, end_date):
+        for index in range(3 * HISTORICAL_IMPORT_CHUNK):
+            day = (date(2024, 1, 1) + timedelta(days=index // 3)).isoformat()
+            yield {"id": f"w{index}", "day": day}
+
+    coordinator = OuraDataUpdateCoordinator(mock_hass, MagicMock(), mock_config_entry, 5)
+    coordinator.api_client.async_iter_documents = iter_documents
+    chunks = []
+
+    async def record_chunk(hass, endpoint, documents, entry):
+        chunks.append(list(documents))
+        return len(documents)
+
+    recent_data = {}
+    with patch(
+        "oura.coordinator.async_import_source_statistics", AsyncMock(side_effect=record_chunk)
+    ):
+        imported = await coordinator._async_load_historical_endpoint(
+            "workout", date(2024, 1, 1), date(2025, 1, 1), recent_data
+        )
+
+    assert imported == 3 * HISTORICAL_IMPORT_CHUNK
+    assert len(chunks) > 1
+    assert all(len(chunk) <= HISTORICAL_IMPORT_CHUNK + 2 for chunk in chunks)
+    # No day is split across two imports
+    assert all(before[-1]["day"] != after[0]["day"] for before, after in zip(chunks, chunks[1:]))
+    assert len(recent_data["workout"]["data"]) == HISTORICAL_STATE_DOCUMENTS
+
+
+@pytest.mark.asyncio
+async def test_historical_backfill_fetch_error_propagates(mock_hass, mock_config_entry):
+    """Test that a failed backfill fetch is raised so the import is retried."""
+    from datetime import datetime, timezone
+    from unittest.mock import AsyncMock, patch
+
+    from aiohttp import ClientError
+
+    async def iter_documents(endpoint, start_date, end_date):
+        yield {"id": f"{endpoint}1", "day": "2024-01-01"}
+        raise ClientError("connection reset")
+
+    coordinator = OuraDataUpdateCoordinator(mock_hass, MagicMock(), mock_config_entry, 5)
+    coordinator.api_client.async_now = AsyncMock(return_value=datetime(2024, 6, 1, tzinfo=timezone.utc))
+    coordinator.api_client.async_iter_documents = iter_documents
+
+    with patch(
+        "oura.coordinator.async_import_source_statistics", AsyncMock(return_value=1)
+    ), pytest.raises(ClientError):
+        await coordinator.async_load_historical_data(90)
+
+    assert coordinator.historical_data_loaded is False
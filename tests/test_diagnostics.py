@@ -0,0 +1,33 @@
+"""Tests for Oura Ring diagnostics."""
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import pytest
+
+from custom_components.oura.api import OuraApiClient
+from custom_components.oura.const import DOMAIN
+from custom_components.oura.coordinator import OuraDataUpdateCoordinator
+from custom_components.oura.diagnostics import async_get_config_entry_diagnostics
+
+
+@pytest.mark.asyncio
+async def test_diagnostics_include_circuit_breakers(mock_hass, mock_config_entry):
+    """Test that diagnostics expose breaker state and redact credentials."""
+    api_client = OuraApiClient(mock_hass, entry=mock_config_entry, pat_token="pat")
+    api_client.circuit_breakers["spo2"].record_failure(RuntimeError("boom"))
+    coordinator = OuraDataUpdateCoordinator(mock_hass, api_client, mock_config_entry, 5)
+    coordinator._sync_cursors = {"sleep": {"day": "2024-01-15"}}
+    coordinator._next_poll = {"sleep": datetime(2024, 1, 15, 8, tzinfo=timezone.utc)}
+    coordinator.data = {"sleep_score": 85}
+    mock_hass.data[DOMAIN] = {mock_config_entry.entry_id: coordinator}
+
+    diagnostics = await async_get_config_entry_diagnostics(mock_hass, mock_config_entry)
+
+    spo2 = diagnostics["api"]["circuit_breakers"]["spo2"]
+    assert spo2["state"] == "closed"
+    assert spo2["failures"] == 1
+    assert spo2["last_error"] == "boom"
+    assert diagnostics["entry"]["data"]["token"] == "**REDACTED**"
+    assert diagnostics["sync"]["cursors"] == {"sleep": {"day": "2024-01-15"}}
+    assert diagnostics["sync"]["next_poll"] == {"sleep": "2024-01-15T08:00:00+00:00"}
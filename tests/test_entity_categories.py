@@ -19,6 +19,7 @@ def test_entity_categories_assigned():
         "optimal_bedtime_start",
         "optimal_bedtime_end",
         "low_battery_alert",
+        "api_requests_remaining",
     ]
     
     for sensor_key in diagnostic_sensors:
@@ -0,0 +1,145 @@
+"""Tests for the extraction plans shared by sensor states and statistics."""
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import pytest
+
+from custom_components.oura.extraction import (
+    LIVE_PLANS,
+    STATISTICS_PLANS,
+    TRANSFORMS,
+    ExtractionPlan,
+    compile_path,
+    compute_percentage,
+    extract_latest,
+)
+from custom_components.oura.models import PATH_MODELS, SampleModel, SleepModel
+
+SLEEP_DETAIL = {
+    "day": "2024-01-16",
+    "efficiency": 0,
+    "total_sleep_duration": 28800,
+    "deep_sleep_duration": 7200,
+    "latency": 600,
+    "bedtime_end": "2024-01-16T07:30:00Z",
+    "low_battery_alert": None,
+}
+
+
+def test_live_and_statistics_read_documents_alike():
+    """Test that both paths extract the same values from one schema."""
+    processed: dict = {}
+    extract_latest({"sleep_detail": {"data": [SLEEP_DETAIL]}}, "sleep_detail", processed)
+
+    assert processed == {
+        "total_sleep_duration": 8.0,
+        "deep_sleep_duration": 2.0,
+        "sleep_latency": 10.0,
+        "bedtime_end": datetime(2024, 1, 16, 7, 30, tzinfo=timezone.utc),
+        "deep_sleep_percentage": 25.0,
+        "low_battery_alert": False,
+    }
+
+    statistics: dict = {}
+    STATISTICS_PLANS["sleep_detail"].extract(SLEEP_DETAIL, statistics)
+    # State-only values are left out of the statistics import
+    assert statistics == {key: value for key, value in processed.items() if key != "low_battery_alert"}
+    assert "_data_date" in LIVE_PLANS["sleep"].sensor_keys
+    assert "_data_date" not in STATISTICS_PLANS["sleep"].sensor_keys
+
+
+def test_computed_and_nested_fields():
+    """Test compiled paths and computed fields."""
+    assert compile_path("a.b.c")({"a": {"b": {"c": 1}}}) == 1
+    assert compile_path("a.b.c")({"a": {"b": 2}}) is None
+    assert compile_path("a.b")({"a": None}) is None
+
+    processed: dict = {}
+    extract_latest(
+        {"sleep_time": {"data": [{
+            "day": "2023-10-25",
+            "optimal_bedtime": {"day_tz": 3600, "start_offset": 79200, "end_offset": None},
+        }]}},
+        "sleep_time",
+        processed,
+    )
+    assert processed == {
+        "optimal_bedtime_start": datetime(2023, 10, 25, 21, 0, tzinfo=timezone.utc),
+    }
+
+
+def test_decoded_models_read_like_raw_dicts():
+    """Test that plans read decoded models by attribute with the same results."""
+    raw: dict = {}
+    decoded: dict = {}
+    extract_latest({"sleep_detail": {"data": [SLEEP_DETAIL]}}, "sleep_detail", raw)
+    extract_latest(
+        {"sleep_detail": {"data": [SleepModel.from_dict(SLEEP_DETAIL)]}}, "sleep_detail", decoded
+    )
+
+    assert decoded == raw
+    # Fields named like Mapping methods live under a suffixed attribute
+    assert compile_path("items")(SampleModel.from_dict({"items": [1.0]})) == (1.0,)
+    assert compile_path("a.b")({"a": "not an object"}) is None
+    # Heart rate samples are not decoded at all
+    assert "heartrate" not in PATH_MODELS
+
+
+def test_value_transformations():
+    """Test the unit transforms applied by plan fields."""
+    assert TRANSFORMS["seconds_to_hours"](7200) == 2.0
+    assert TRANSFORMS["seconds_to_minutes"](300) == 5.0
+
+    plan = ExtractionPlan("test", [
+        {"sensor_key": "hours", "api_path": "duration", "transform": "seconds_to_hours"},
+        {"sensor_key": "start", "api_path": "start", "transform": "iso_to_datetime"},
+        {"sensor_key": "end", "api_path": "end", "transform": "iso_to_datetime"},
+    ])
+    processed: dict = {}
+    plan.extract(
+        {"duration": 3600, "start": "2024-01-15T08:30:00+00:00", "end": "2024-01-15T09:30:00Z"},
+        processed,
+    )
+    assert processed == {
+        "hours": 1.0,
+        "start": datetime(2024, 1, 15, 8, 30, tzinfo=timezone.utc),
+        "end": datetime(2024, 1, 15, 9, 30, tzinfo=timezone.utc),
+    }
+
+    # Unknown transforms are rejected when the schema is compiled
+    with pytest.raises(KeyError):
+        ExtractionPlan("test", [{"sensor_key": "x", "api_path": "x", "transform": "unknown"}])
+
+
+def test_compute_percentage():
+    """Test percentages computed from two fields."""
+    entry = {
+        "total_sleep_duration": 28800,  # 8 hours
+        "deep_sleep_duration": 7200,    # 2 hours = 25%
+        "rem_sleep_duration": 5760,     # 1.6 hours = 20%
+    }
+
+    assert compute_percentage(entry, "deep_sleep_duration", "total_sleep_duration") == 25.0
+    assert compute_percentage(entry, "rem_sleep_duration", "total_sleep_duration") == 20.0
+
+    # Missing values
+    assert compute_percentage({}, "numerator", "denominator") is None
+    assert compute_percentage({"numerator": 10}, "numerator", "denominator") is None
+    assert compute_percentage({"numerator": 10, "denominator": 0}, "numerator", "denominator") is None
+
+
+def test_nested_paths():
+    """Test plan fields read through dot-separated paths."""
+    plan = ExtractionPlan("test", [
+        {"sensor_key": "score", "api_path": "score"},
+        {"sensor_key": "efficiency", "api_path": "contributors.efficiency"},
+        {"sensor_key": "missing", "api_path": "contributors.missing"},
+        {"sensor_key": "missing_parent", "api_path": "missing.nested"},
+    ])
+    processed: dict = {}
+    plan.extract({"score": 85, "contributors": {"efficiency": 90, "restfulness": 75}}, processed)
+
+    assert processed == {"score": 85, "efficiency": 90}
+    assert plan.sensor_keys == ("score", "efficiency", "missing", "missing_parent")
+    assert compile_path("missing")({}) is None
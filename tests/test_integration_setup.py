@@ -65,3 +65,41 @@ def test_mock_empty_api_response_fixture(mock_empty_api_response: dict):
     assert len(mock_empty_api_response["sleep"]["data"]) == 0
     assert len(mock_empty_api_response["activity"]["data"]) == 0
 
+
+
+@pytest.mark.asyncio
+async def test_remove_entry_deletes_stores(mock_hass: HomeAssistant, mock_config_entry: ConfigEntry):
+    """Test that removing the entry deletes everything it persisted."""
+    from custom_components.oura import async_remove_entry
+
+    with patch("custom_components.oura.Store") as store:
+        store.return_value.async_remove = AsyncMock()
+        await async_remove_entry(mock_hass, mock_config_entry)
+
+    keys = {call.args[2] for call in store.call_args_list}
+    entry_id = mock_config_entry.entry_id
+    assert keys == {
+        f"{DOMAIN}.{entry_id}.sync",
+        f"{DOMAIN}.{entry_id}.capabilities",
+        f"{DOMAIN}.{entry_id}.responses",
+        f"{DOMAIN}.{entry_id}.webhook",
+    }
+    assert store.return_value.async_remove.await_count == 4
+
+
+@pytest.mark.asyncio
+async def test_unload_entry_drops_rate_limiter(mock_hass: HomeAssistant, mock_config_entry: ConfigEntry):
+    """Test that unloading the entry releases its account's rate limiter."""
+    from custom_components.oura import async_unload_entry
+    from custom_components.oura.api import DATA_RATE_LIMITERS, OuraApiClient
+
+    client = OuraApiClient(mock_hass, entry=mock_config_entry, pat_token="pat")
+    limiter = client.rate_limiter
+    assert mock_hass.data[DATA_RATE_LIMITERS][mock_config_entry.unique_id] is limiter
+    mock_hass.data[DOMAIN] = {mock_config_entry.entry_id: MagicMock()}
+    mock_hass.data[DATA_RATE_LIMITERS]["other_account"] = MagicMock()
+
+    assert await async_unload_entry(mock_hass, mock_config_entry)
+
+    assert mock_config_entry.unique_id not in mock_hass.data[DATA_RATE_LIMITERS]
+    assert "other_account" in mock_hass.data[DATA_RATE_LIMITERS]
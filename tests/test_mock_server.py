@@ -0,0 +1,63 @@
+"""Tests for the API client against the local Oura stand-in server."""
+from __future__ import annotations
+
+from datetime import date
+from pathlib import Path
+import sys
+from unittest.mock import MagicMock
+
+from aiohttp.test_utils import TestServer
+import pytest
+
+from custom_components.oura.api import OuraApiClient, OuraRateLimiter
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from mock_server import MockOptions, MockOuraServer  # noqa: E402
+
+
+async def _client_for(options: MockOptions) -> tuple[OuraApiClient, MockOuraServer, TestServer]:
+    """Start a stand-in server and return a client pointed at it."""
+    mock = MockOuraServer(options)
+    server = TestServer(mock.create_app())
+    await server.start_server()
+    client = OuraApiClient(
+        MagicMock(),
+        entry=MagicMock(),
+        pat_token="mock_pat",
+        base_url=str(server.make_url("/v2/usercollection")),
+    )
+    client._rate_limiter = OuraRateLimiter()
+    return client, mock, server
+
+
+@pytest.mark.asyncio
+async def test_client_pages_through_stand_in_server():
+    """Test that synthetic collections are paged and decoded like the real API."""
+    client, mock, server = await _client_for(MockOptions(page_size=7, missing_scopes={"workout"}))
+    try:
+        documents = [
+            document
+            async for document in client.async_iter_documents(
+                "readiness", date(2024, 1, 1), date(2024, 1, 31)
+            )
+        ]
+        assert [document["day"] for document in documents] == [
+            date(2024, 1, day).isoformat() for day in range(1, 31)
+        ]
+        assert mock.requests == 5  # 30 documents in pages of 7
+
+        # Documents can be fetched again by id
+        again = await client.async_get_document("readiness", documents[3]["id"])
+        assert again == documents[3]
+
+        # Missing scopes answer 401, which the client reports as unsupported
+        workout = await client._async_get_workout(date(2024, 1, 1), date(2024, 1, 2))
+        assert workout["unsupported"] is True
+
+        heartrate = await client._async_get_heartrate(date(2024, 1, 1), date(2024, 1, 2))
+        assert len(heartrate["data"]) == 24 * 12
+    finally:
+        # The session belongs to HA; release the connector it was created on
+        await client.client_session.connector.close()
+        await server.close()
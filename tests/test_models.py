@@ -0,0 +1,85 @@
+"""Tests for the typed Oura document models."""
+from __future__ import annotations
+
+import pytest
+
+from custom_components.oura.models import (
+    DailySleepModel,
+    HeartRateModel,
+    OuraModelError,
+    RestModePeriodModel,
+    SampleModel,
+    SleepModel,
+    decode_documents,
+)
+from custom_components.oura.extraction import compile_path
+
+
+def test_document_decodes_into_model():
+    """Test that nested objects decode into models and unknown fields are dropped."""
+    document = DailySleepModel.from_dict(
+        {
+            "id": "abc",
+            "day": "2024-01-15",
+            "score": 85,
+            "contributors": {"deep_sleep": 90, "restfulness": 75},
+            "timestamp": "2024-01-15T00:00:00+00:00",
+            "undocumented": True,
+        }
+    )
+
+    assert document.score == 85
+    assert document.contributors.restfulness == 75
+    assert "undocumented" not in document
+
+
+def test_model_behaves_like_the_raw_dict():
+    """Test Mapping access, null-as-absent semantics and dict equality."""
+    document = DailySleepModel.from_dict({"id": "abc", "day": "2024-01-15", "score": None})
+
+    assert document.get("day") == "2024-01-15"
+    assert document.get("score") is None
+    assert document.get("contributors", {}) == {}
+    assert "score" not in document
+    assert document == {"id": "abc", "day": "2024-01-15"}
+    assert compile_path("contributors.timing")(
+        DailySleepModel.from_dict({"contributors": {"timing": 60}})
+    ) == 60
+
+
+def test_decoded_model_decodes_again():
+    """Test that array fields survive re-decoding and compare as tuples."""
+    period = RestModePeriodModel.from_dict(
+        {"id": "r1", "episodes": [{"tags": ["sick"], "timestamp": "2024-01-15T08:00:00+00:00"}]}
+    )
+
+    assert decode_documents(RestModePeriodModel, [period, dict(period)]) == [period, period]
+    assert period.episodes[0].tags == ("sick",)
+    assert period != {"id": "r1", "episodes": [{"tags": ["sick"], "timestamp": "2024-01-15T08:00:00+00:00"}]}
+
+
+def test_field_shadowing_mapping_method():
+    """Test that a JSON field named like a Mapping method stays reachable by key."""
+    sample = SampleModel.from_dict({"interval": 300, "items": [40.0, None, 42], "timestamp": "t"})
+
+    assert sample["items"] == (40.0, None, 42)
+    assert dict(sample.items())["interval"] == 300
+
+
+def test_type_mismatch_rejected():
+    """Test that malformed documents are rejected at the boundary."""
+    with pytest.raises(OuraModelError):
+        HeartRateModel.from_dict({"bpm": "sixty", "timestamp": "t"})
+    with pytest.raises(OuraModelError):
+        SleepModel.from_dict({"hrv": {"items": "not a list"}})
+    with pytest.raises(OuraModelError):
+        HeartRateModel.from_dict({"bpm": True})
+
+
+def test_decode_documents_drops_malformed():
+    """Test that a malformed document is skipped without losing the page."""
+    documents = decode_documents(
+        HeartRateModel, [{"bpm": 60, "timestamp": "a"}, {"bpm": [], "timestamp": "b"}, "oops"]
+    )
+
+    assert documents == [{"bpm": 60, "timestamp": "a"}]
@@ -0,0 +1,64 @@
+"""Tests for adaptive polling around the wake-up time."""
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+from custom_components.oura.polling import OuraWakeSchedule, _circular_median
+
+INTERVAL = timedelta(minutes=30)
+
+
+def _sleep(day: str, wake: str, sleep_type: str = "long_sleep") -> dict:
+    return {"day": day, "type": sleep_type, "bedtime_end": f"{day}T{wake}:00+00:00"}
+
+
+def _schedule() -> OuraWakeSchedule:
+    schedule = OuraWakeSchedule()
+    schedule.learn([
+        _sleep("2024-01-01", "07:00"),
+        _sleep("2024-01-02", "07:20"),
+        _sleep("2024-01-03", "06:50"),
+        _sleep("2024-01-03", "15:00", "late_nap"),
+    ])
+    return schedule
+
+
+def test_wake_time_learned_from_main_sleep():
+    """Test that the expected wake-up is the median of main sleeps only."""
+    schedule = _schedule()
+    now = datetime(2024, 1, 4, 3, 0, tzinfo=timezone.utc)
+
+    assert schedule.expected_wake(now) == datetime(2024, 1, 4, 7, 0, tzinfo=timezone.utc)
+    assert OuraWakeSchedule(schedule.wake_times).wake_times == schedule.wake_times
+
+    # Wake-up times around midnight average across it
+    assert _circular_median([23 * 60 + 50, 10, 30]) == 10
+
+
+def test_daily_polls_follow_the_wake_window():
+    """Test polling backs off overnight and after the data arrived, and speeds up after waking."""
+    schedule = _schedule()
+    day = datetime(2024, 1, 4, tzinfo=timezone.utc)
+
+    # Overnight: sleep until the window opens at 06:30
+    assert schedule.next_poll(day.replace(hour=2), INTERVAL, False) == day.replace(hour=5)
+    assert schedule.next_poll(day.replace(hour=5), INTERVAL, False) == day.replace(hour=6, minute=30)
+
+    # In the window: poll every tick until today's documents are in
+    now = day.replace(hour=7, minute=10)
+    assert schedule.next_poll(now, INTERVAL, False) == now
+    assert schedule.next_poll(now, INTERVAL, True) == now + timedelta(hours=3)
+
+    # Slept in past the window: regular interval
+    now = day.replace(hour=11)
+    assert schedule.next_poll(now, INTERVAL, False) == now + INTERVAL
+
+
+def test_flat_interval_until_enough_nights():
+    """Test that the regular interval is used while the wake-up time is unknown."""
+    schedule = OuraWakeSchedule()
+    schedule.learn([_sleep("2024-01-01", "07:00")])
+    now = datetime(2024, 1, 2, 7, 0, tzinfo=timezone.utc)
+
+    assert schedule.expected_wake(now) is None
+    assert schedule.next_poll(now, INTERVAL, False) == now + INTERVAL
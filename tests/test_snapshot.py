@@ -0,0 +1,86 @@
+"""Tests for the compact processed-data snapshot."""
+from __future__ import annotations
+
+import copy
+import sys
+
+import pytest
+
+from custom_components.oura.const import SENSOR_TYPES
+from custom_components.oura.snapshot import (
+    OuraSnapshot,
+    RestModeSummary,
+    WorkoutSummary,
+    category_keys,
+)
+
+WORKOUT = {
+    "id": "workout_1",
+    "activity": "running",
+    "calories": 300.0,
+    "day": "2024-01-15",
+    "distance": 5000.0,
+    "end_datetime": "2024-01-15T08:00:00+00:00",
+    "intensity": "moderate",
+    "label": None,
+    "source": "manual",
+    "start_datetime": "2024-01-15T07:00:00+00:00",
+}
+
+
+def test_snapshot_reads_like_the_processed_dict():
+    """Test mapping access, None versus unset keys, and immutability."""
+    processed = {"sleep_score": 85, "readiness_score": None, "_data_date": "2024-01-15"}
+    snapshot = OuraSnapshot.from_dict(processed)
+
+    assert snapshot == processed
+    assert dict(snapshot) == processed
+    assert snapshot.get("readiness_score", 1) is None
+    assert "readiness_score" in snapshot
+    assert "steps" not in snapshot
+    assert snapshot.get("steps") is None
+    with pytest.raises(KeyError):
+        snapshot["steps"]
+    with pytest.raises(KeyError):
+        OuraSnapshot.from_dict({"not_a_sensor": 1})
+    with pytest.raises(AttributeError):
+        snapshot._sections = ()
+    assert not hasattr(snapshot, "__dict__")
+    assert copy.deepcopy(snapshot) == snapshot
+
+
+def test_snapshot_compares_per_category():
+    """Test that unchanged categories compare equal while changed ones don't."""
+    before = OuraSnapshot.from_dict({"sleep_score": 85, "steps": 1000, "_data_date": "2024-01-15"})
+    after = OuraSnapshot.from_dict({"sleep_score": 85, "steps": 1200, "_data_date": "2024-01-15"})
+
+    assert before != after
+    assert before.category_values("sleep") == after.category_values("sleep")
+    assert before.category_values("activity") != after.category_values("activity")
+    assert len(category_keys("activity")) == len(before.category_values("activity"))
+
+
+def test_snapshot_is_smaller_than_the_dict():
+    """Test the resident size of a fully populated snapshot and its projections."""
+    processed = {key: float(index) for index, key in enumerate(SENSOR_TYPES)}
+    processed["_data_date"] = "2024-01-15"
+    snapshot = OuraSnapshot.from_dict(processed)
+
+    snapshot_size = (
+        sys.getsizeof(snapshot)
+        + sys.getsizeof(snapshot._sections)
+        + sum(sys.getsizeof(section) for section in snapshot._sections)
+    )
+    assert snapshot_size < sys.getsizeof(processed)
+
+    # Only the attribute fields of a document are kept
+    workout = WorkoutSummary.from_document(WORKOUT)
+    assert sys.getsizeof(workout) < sys.getsizeof(WORKOUT)
+    assert workout.as_dict() == {
+        "source": "manual",
+        "start_datetime": "2024-01-15T07:00:00+00:00",
+        "end_datetime": "2024-01-15T08:00:00+00:00",
+        "day": "2024-01-15",
+    }
+    assert workout == WorkoutSummary.from_document(dict(WORKOUT, calories=10.0))
+    assert RestModeSummary.from_document({"id": "r1", "episodes": []}).as_dict() == {"id": "r1"}
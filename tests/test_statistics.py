@@ -5,13 +5,11 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from custom_components.oura.statistics import (
-    async_import_statistics,
+    async_import_heartrate_statistics,
     STATISTICS_METADATA,
     DATA_SOURCE_CONFIG,
     _parse_date_to_timestamp,
-    _apply_transformation,
-    _compute_percentage,
-    _get_nested_value,
+    DailyHeartRateAggregator,
 )
 
 
@@ -38,16 +36,14 @@ def test_statistics_metadata_completeness():
 def test_data_source_config_structure():
     """Test that data source configuration is properly structured."""
     for source_key, config in DATA_SOURCE_CONFIG.items():
-        # Either has mappings or a custom processor
-        assert "mappings" in config or "custom_processor" in config
-        
-        if "mappings" in config:
-            assert isinstance(config["mappings"], list)
-            
-            for mapping in config["mappings"]:
-                assert "sensor_key" in mapping
-                assert "api_path" in mapping
-                assert mapping["sensor_key"] in STATISTICS_METADATA
+        # Either has an extraction plan or a custom processor
+        assert "plan" in config or "custom_processor" in config
+
+        if "plan" in config:
+            assert config["plan"].source == source_key
+
+            for sensor_key in config["plan"].sensor_keys:
+                assert sensor_key in STATISTICS_METADATA
 
 
 def test_timestamp_parsing():
@@ -67,81 +63,42 @@ def test_timestamp_parsing():
     assert _parse_date_to_timestamp("invalid") is None
 
 
-def test_value_transformations():
-    """Test that data transformations work correctly."""
-    # Test seconds to hours
-    assert _apply_transformation(3600, "seconds_to_hours") == 1.0
-    assert _apply_transformation(7200, "seconds_to_hours") == 2.0
-    
-    # Test seconds to minutes
-    assert _apply_transformation(60, "seconds_to_minutes") == 1.0
-    assert _apply_transformation(300, "seconds_to_minutes") == 5.0
-    
-    # Test percentage calculation
-    assert _apply_transformation(30, "percentage", total=100) == 30.0
-    
-    # Test ISO to datetime
-    iso_str = "2024-01-15T08:30:00+00:00"
-    dt = _apply_transformation(iso_str, "iso_to_datetime")
-    assert dt is not None
-    assert dt.year == 2024
-    assert dt.month == 1
-    assert dt.day == 15
-    assert dt.hour == 8
-    assert dt.minute == 30
-    assert dt.tzinfo == timezone.utc
-
-    # Test ISO to datetime with Z
-    iso_str_z = "2024-01-15T08:30:00Z"
-    dt_z = _apply_transformation(iso_str_z, "iso_to_datetime")
-    assert dt_z is not None
-    assert dt_z.hour == 8
-    assert dt_z.tzinfo == timezone.utc
-    
-    # Test no transformation
-    assert _apply_transformation(42, "unknown") == 42
-
-
-def test_compute_percentage():
-    """Test percentage computation."""
-    entry = {
-        "total_sleep_duration": 28800,  # 8 hours
-        "deep_sleep_duration": 7200,    # 2 hours = 25%
-        "rem_sleep_duration": 5760,     # 1.6 hours = 20%
+def test_daily_heartrate_aggregator():
+    """Test heart rate samples are folded into daily average, min and max."""
+    aggregator = DailyHeartRateAggregator()
+    for sample in [
+        {"bpm": 60, "timestamp": "2024-01-01T08:00:00+00:00"},
+        {"bpm": 80, "timestamp": "2024-01-01T12:00:00+00:00"},
+        {"bpm": 55, "timestamp": "2024-01-01T23:00:00+00:00"},
+        {"bpm": 70, "timestamp": "2024-01-02T08:00:00+00:00"},
+        {"bpm": None, "timestamp": "2024-01-02T09:00:00+00:00"},
+        {"bpm": 90},
+    ]:
+        aggregator.add(sample)
+
+    assert len(aggregator) == 2
+    sensor_data = aggregator.sensor_data()
+    day_one = _parse_date_to_timestamp("2024-01-01")
+
+    assert sensor_data["average_heart_rate"][0] == {"timestamp": day_one, "value": 65}
+    assert sensor_data["min_heart_rate"][0] == {"timestamp": day_one, "value": 55}
+    assert sensor_data["max_heart_rate"][0] == {"timestamp": day_one, "value": 80}
+    assert [point["value"] for point in sensor_data["average_heart_rate"]] == [65, 70]
+
+
+@pytest.mark.asyncio
+async def test_heartrate_statistics_imported_from_aggregator():
+    """Test that each daily heart rate statistic is imported from the aggregator."""
+    aggregator = DailyHeartRateAggregator()
+    aggregator.add({"bpm": 60, "timestamp": "2024-01-01T08:00:00+00:00"})
+    aggregator.add({"bpm": 70, "timestamp": "2024-01-02T08:00:00+00:00"})
+
+    with patch("custom_components.oura.statistics._create_statistic", AsyncMock()) as create:
+        imported = await async_import_heartrate_statistics(MagicMock(), aggregator, MagicMock())
+
+    assert imported == 6
+    assert {call.args[1] for call in create.await_args_list} == {
+        "average_heart_rate",
+        "min_heart_rate",
+        "max_heart_rate",
     }
-    
-    deep_pct = _compute_percentage(entry, "deep_sleep_duration", "total_sleep_duration")
-    assert deep_pct == 25.0
-    
-    rem_pct = _compute_percentage(entry, "rem_sleep_duration", "total_sleep_duration")
-    assert rem_pct == 20.0
-    
-    # Test missing values
-    assert _compute_percentage({}, "numerator", "denominator") is None
-    assert _compute_percentage({"numerator": 10}, "numerator", "denominator") is None
-    assert _compute_percentage({"numerator": 10, "denominator": 0}, "numerator", "denominator") is None
-
-
-def test_get_nested_value():
-    """Test nested value extraction."""
-    data = {
-        "score": 85,
-        "contributors": {
-            "efficiency": 90,
-            "restfulness": 75,
-        },
-    }
-    
-    # Test direct access
-    assert _get_nested_value(data, "score") == 85
-    
-    # Test nested access
-    assert _get_nested_value(data, "contributors.efficiency") == 90
-    assert _get_nested_value(data, "contributors.restfulness") == 75
-    
-    # Test missing values
-    assert _get_nested_value(data, "missing") is None
-    assert _get_nested_value(data, "contributors.missing") is None
-    assert _get_nested_value(data, "missing.nested") is None
-
-
@@ -3,23 +3,19 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 from homeassistant.core import HomeAssistant
 from homeassistant.config_entries import ConfigEntry
-from custom_components.oura.statistics import async_import_statistics
+from custom_components.oura.statistics import async_import_source_statistics
 from custom_components.oura.const import DOMAIN
 
 @pytest.mark.asyncio
 async def test_import_statistics_entity_exists(mock_hass: HomeAssistant, mock_config_entry: ConfigEntry):
     """Test importing statistics when entity exists (uses recorder source)."""
     
-    data = {
-        "sleep": {
-            "data": [
-                {
-                    "day": "2024-01-01",
-                    "score": 85
-                }
-            ]
+    documents = [
+        {
+            "day": "2024-01-01",
+            "score": 85
         }
-    }
+    ]
     
     with patch("custom_components.oura.statistics.er.async_get") as mock_er_get, \
          patch("custom_components.oura.statistics.async_import_statistics_ha") as mock_import_ha, \
@@ -30,7 +26,7 @@ async def test_import_statistics_entity_exists(mock_hass: HomeAssistant, mock_co
         # Simulate entity exists
         mock_registry.async_get_entity_id.return_value = "sensor.oura_ring_sleep_score"
         
-        await async_import_statistics(mock_hass, data, mock_config_entry)
+        await async_import_source_statistics(mock_hass, "sleep", documents, mock_config_entry)
         
         # Should use async_import_statistics_ha (recorder source)
         assert mock_import_ha.called
@@ -52,16 +48,12 @@ async def test_import_statistics_entity_exists(mock_hass: HomeAssistant, mock_co
 async def test_import_statistics_entity_missing(mock_hass: HomeAssistant, mock_config_entry: ConfigEntry):
     """Test importing statistics when entity missing (uses recorder source with fallback ID)."""
     
-    data = {
-        "sleep": {
-            "data": [
-                {
-                    "day": "2024-01-01",
-                    "score": 85
-                }
-            ]
+    documents = [
+        {
+            "day": "2024-01-01",
+            "score": 85
         }
-    }
+    ]
     
     with patch("custom_components.oura.statistics.er.async_get") as mock_er_get, \
          patch("custom_components.oura.statistics.async_import_statistics_ha") as mock_import_ha, \
@@ -72,7 +64,7 @@ async def test_import_statistics_entity_missing(mock_hass: HomeAssistant, mock_c
         # Simulate entity missing
         mock_registry.async_get_entity_id.return_value = None
         
-        await async_import_statistics(mock_hass, data, mock_config_entry)
+        await async_import_source_statistics(mock_hass, "sleep", documents, mock_config_entry)
         
         # Should use async_import_statistics_ha (recorder source) because fallback ID is sensor.xxx
         assert mock_import_ha.called
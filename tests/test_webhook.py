@@ -0,0 +1,173 @@
+"""Tests for Oura webhook push ingestion."""
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+import hashlib
+import hmac
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from homeassistant.util import dt as dt_util
+
+from custom_components.oura.api import OuraWebhookClient
+from custom_components.oura.const import WEBHOOK_DATA_TYPES, WEBHOOK_EVENT_TYPES
+from custom_components.oura.webhook import OuraWebhookManager
+
+CALLBACK_URL = "https://example.ui.nabu.casa/api/webhook/abc"
+CLIENT_SECRET = "mock_client_secret"
+
+
+def _manager(mock_hass, mock_config_entry) -> OuraWebhookManager:
+    """Create a webhook manager with a mocked coordinator and subscription API."""
+    coordinator = MagicMock()
+    coordinator.async_refresh_document = AsyncMock()
+    webhook_client = OuraWebhookClient(mock_hass, "mock_client_id", CLIENT_SECRET)
+    webhook_client.async_list_subscriptions = AsyncMock()
+    webhook_client.async_create_subscription = AsyncMock()
+    webhook_client.async_renew_subscription = AsyncMock()
+    manager = OuraWebhookManager(mock_hass, mock_config_entry, coordinator, webhook_client)
+    manager.webhook_id = "abc"
+    manager.callback_url = CALLBACK_URL
+    manager._verification_token = "secret"
+    return manager
+
+
+def _request(
+    method: str, query: dict | None = None, body: dict | None = None, secret: str = CLIENT_SECRET
+) -> MagicMock:
+    """Build a request as Oura would send it to the webhook, signed with secret."""
+    raw = json.dumps(body).encode()
+    timestamp = "1704067200"
+    request = MagicMock()
+    request.method = method
+    request.query = query or {}
+    request.headers = {
+        "x-oura-timestamp": timestamp,
+        "x-oura-signature": hmac.new(
+            secret.encode(), timestamp.encode() + raw, hashlib.sha256
+        ).hexdigest().upper(),
+    }
+    request.read = AsyncMock(return_value=raw)
+    return request
+
+
+@pytest.mark.asyncio
+async def test_challenge_verified(mock_hass, mock_config_entry):
+    """Test that the verification challenge is echoed only for our token."""
+    manager = _manager(mock_hass, mock_config_entry)
+
+    response = await manager._async_handle_webhook(
+        mock_hass, "abc", _request("GET", {"verification_token": "secret", "challenge": "xyz"})
+    )
+    assert response.status == 200
+    assert json.loads(response.body) == {"challenge": "xyz"}
+
+    response = await manager._async_handle_webhook(
+        mock_hass, "abc", _request("GET", {"verification_token": "wrong", "challenge": "xyz"})
+    )
+    assert response.status == 401
+
+
+@pytest.mark.asyncio
+async def test_notification_fetches_changed_document(mock_hass, mock_config_entry):
+    """Test that a notification fetches only the changed document and pushes it."""
+    manager = _manager(mock_hass, mock_config_entry)
+    mock_config_entry.async_create_background_task = MagicMock(
+        side_effect=lambda hass, coro, name: coro
+    )
+    notification = {"event_type": "update", "data_type": "daily_sleep", "object_id": "doc-1"}
+
+    response = await manager._async_handle_webhook(
+        mock_hass, "abc", _request("POST", body=notification)
+    )
+    assert response.status == 200
+
+    # Run the background task the handler scheduled
+    await mock_config_entry.async_create_background_task.call_args.args[1]
+
+    manager.coordinator.async_refresh_document.assert_awaited_once_with("sleep", "doc-1")
+
+
+@pytest.mark.asyncio
+async def test_forged_notification_rejected(mock_hass, mock_config_entry):
+    """Test that notifications not signed with the client secret are refused."""
+    manager = _manager(mock_hass, mock_config_entry)
+    mock_config_entry.async_create_background_task = MagicMock()
+    notification = {"event_type": "delete", "data_type": "tag", "object_id": "tag-1"}
+
+    response = await manager._async_handle_webhook(
+        mock_hass, "abc", _request("POST", body=notification, secret="guessed")
+    )
+    assert response.status == 401
+
+    unsigned = _request("POST", body=notification)
+    unsigned.headers = {}
+    response = await manager._async_handle_webhook(mock_hass, "abc", unsigned)
+    assert response.status == 401
+    mock_config_entry.async_create_background_task.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_delete_notification_confirmed_with_the_api(mock_hass, mock_config_entry):
+    """Test that a delete is confirmed with the API before the document is dropped."""
+    from custom_components.oura.coordinator import OuraDataUpdateCoordinator
+
+    manager = _manager(mock_hass, mock_config_entry)
+    coordinator = OuraDataUpdateCoordinator(mock_hass, MagicMock(), mock_config_entry, 5)
+    coordinator.async_merge_document = MagicMock()
+    coordinator.async_remove_document = MagicMock()
+    manager.coordinator = coordinator
+    notification = {"event_type": "delete", "data_type": "tag", "object_id": "tag-1"}
+
+    # Still returned by the API: the notification is not trusted
+    coordinator.api_client.async_get_document = AsyncMock(return_value={"id": "tag-1"})
+    await manager.async_handle_notification(notification)
+    coordinator.async_remove_document.assert_not_called()
+
+    coordinator.api_client.async_get_document = AsyncMock(return_value=None)
+    await manager.async_handle_notification(notification)
+    coordinator.api_client.async_get_document.assert_awaited_once_with("tag", "tag-1")
+    coordinator.async_remove_document.assert_called_once_with("tag", "tag-1")
+
+
+@pytest.mark.asyncio
+async def test_subscriptions_created_and_renewed(mock_hass, mock_config_entry):
+    """Test that missing subscriptions are created and expiring ones renewed."""
+    manager = _manager(mock_hass, mock_config_entry)
+    soon = (dt_util.utcnow() + timedelta(hours=1)).isoformat()
+    later = (dt_util.utcnow() + timedelta(days=30)).isoformat()
+    manager.webhook_client.async_list_subscriptions.return_value = [
+        {"id": "1", "callback_url": CALLBACK_URL, "data_type": "tag",
+         "event_type": "create", "expiration_time": soon},
+        {"id": "2", "callback_url": CALLBACK_URL, "data_type": "tag",
+         "event_type": "update", "expiration_time": later},
+        {"id": "3", "callback_url": "https://other", "data_type": "tag",
+         "event_type": "delete", "expiration_time": later},
+    ]
+
+    await manager.async_sync_subscriptions()
+
+    manager.webhook_client.async_renew_subscription.assert_awaited_once_with("1")
+    expected_creates = len(WEBHOOK_DATA_TYPES) * len(WEBHOOK_EVENT_TYPES) - 2
+    assert manager.webhook_client.async_create_subscription.await_count == expected_creates
+    pushed = manager.coordinator.async_set_push_endpoints.call_args.args[0]
+    assert pushed == set(WEBHOOK_DATA_TYPES.values())
+
+
+@pytest.mark.asyncio
+async def test_subscription_timeouts_fall_back_to_polling(mock_hass, mock_config_entry):
+    """Test that a subscription API timeout keeps the endpoints polled."""
+    manager = _manager(mock_hass, mock_config_entry)
+    manager.webhook_client.async_list_subscriptions.return_value = []
+    manager.webhook_client.async_create_subscription.side_effect = asyncio.TimeoutError
+
+    await manager.async_sync_subscriptions()
+    manager.coordinator.async_set_push_endpoints.assert_called_with(set())
+
+    manager.webhook_client.async_list_subscriptions.side_effect = asyncio.TimeoutError
+    manager.coordinator.async_set_push_endpoints.reset_mock()
+    await manager.async_sync_subscriptions()
+    manager.coordinator.async_set_push_endpoints.assert_called_once_with(set())